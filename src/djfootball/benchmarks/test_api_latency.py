@@ -0,0 +1,235 @@
+import json
+import math
+import os
+import time
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from football.api.changes import UPSERT, encode_token
+from football.dataset import generate
+from football.models import League, Team, Player
+
+
+# Latency of every route of 'football/api/urls.py' over a generated dataset, compared with the
+# baselines stored in 'baselines.json' (per dataset size). A scenario fails when its p95 or its
+# query count regressed.
+#
+#   pytest -m benchmark -s benchmarks/test_api_latency.py
+#
+# BENCHMARK_LEAGUES, BENCHMARK_TEAMS_PER_LEAGUE, BENCHMARK_PLAYERS_PER_TEAM: dataset size (10 x 20 x 100).
+# BENCHMARK_ITERATIONS: requests per scenario (200).
+# BENCHMARK_TOLERANCE: allowed p50 slowdown over the baseline (0.75, i.e. 75%), twice that for p95
+# (the tail is what a busy machine disturbs most).
+# BENCHMARK_UPDATE_BASELINES=1: stores this run's numbers as the new baselines (of the scenarios run).
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+LEAGUES = int(os.environ.get("BENCHMARK_LEAGUES", 10))
+TEAMS_PER_LEAGUE = int(os.environ.get("BENCHMARK_TEAMS_PER_LEAGUE", 20))
+PLAYERS_PER_TEAM = int(os.environ.get("BENCHMARK_PLAYERS_PER_TEAM", 100))
+ITERATIONS = int(os.environ.get("BENCHMARK_ITERATIONS", 200))
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", 0.75))
+UPDATE_BASELINES = os.environ.get("BENCHMARK_UPDATE_BASELINES") == "1"
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+DATASET = f"{LEAGUES}x{TEAMS_PER_LEAGUE}x{PLAYERS_PER_TEAM}"
+# differences under this many milliseconds are noise, whatever the tolerance.
+NOISE_MS = 2.0
+
+
+def player_data(i):
+    return {"name": f"Jogador {i}", "age": 20 + i % 20, "position": "Atacante", "appearances": i}
+
+
+def get_changes(client, path):
+    # the generated rows are only seconds old.
+    with override_settings(CHANGES_DELAY_SECONDS=0):
+        return client.get(path)
+
+
+# name -> (request(client, ids, i), expected status, served from the response cache).
+# 'ids' holds the ids of the generated leagues, teams and players; 'i' is the iteration.
+SCENARIOS = {
+    # leagues
+    "league list": (lambda client, ids, i: client.get("/api/leagues/"), 200, False),
+    "league list filtered": (lambda client, ids, i: client.get("/api/leagues/?country=portugal&ordering=-number_of_teams"), 200, False),
+    "league detail": (lambda client, ids, i: client.get(f"/api/leagues/{ids.leagues[i % len(ids.leagues)]}"), 200, False),
+    "league detail expanded": (lambda client, ids, i: client.get(f"/api/leagues/{ids.leagues[i % len(ids.leagues)]}?expand=teams"), 200, False),
+    "league batch": (lambda client, ids, i: client.post("/api/leagues/batch/", {"ids": ids.leagues}, format="json"), 200, False),
+    "league by player names": (lambda client, ids, i: client.get(f"/api/leagues/?player_name=joão silva santos&player_name=rui costa lopes&player_name=nobody {i}"), 200, False),
+    "league create": (lambda client, ids, i: client.post("/api/leagues/", {"name": f"Liga {i}", "country": "Portugal", "number_of_teams": 18}, format="json"), 201, False),
+
+    # teams
+    "team list": (lambda client, ids, i: client.get("/api/teams/"), 200, False),
+    "team list paginated": (lambda client, ids, i: client.get("/api/teams/?page=2&per_page=50"), 200, False),
+    "team list filtered": (lambda client, ids, i: client.get("/api/teams/?city=porto&page=1"), 200, False),
+    "team detail": (lambda client, ids, i: client.get(f"/api/teams/{ids.teams[i % len(ids.teams)]}"), 200, False),
+    "team detail expanded": (lambda client, ids, i: client.get(f"/api/teams/{ids.teams[i % len(ids.teams)]}?expand=players"), 200, False),
+    "team update": (lambda client, ids, i: client.patch(f"/api/teams/{ids.teams[i % len(ids.teams)]}", {"championships_won": i}, format="json"), 200, False),
+
+    # players
+    "player list paginated": (lambda client, ids, i: client.get("/api/players/?page=1&per_page=100"), 200, False),
+    "player list deep page": (lambda client, ids, i: client.get(f"/api/players/?page={len(ids.players) // 100}&per_page=100"), 200, False),
+    "player list cursor": (lambda client, ids, i: client.get("/api/players/?cursor=&per_page=100"), 200, False),
+    "player list cached": (lambda client, ids, i: client.get("/api/players/?page=1&per_page=100"), 200, True),
+    "player list filtered": (lambda client, ids, i: client.get("/api/players/?position=meia&age_min=20&age_max=25&ordering=-appearances&page=1"), 200, False),
+    "player list by league": (lambda client, ids, i: client.get(f"/api/players/?league={ids.leagues[0]}&page=1"), 200, False),
+    "player list sparse": (lambda client, ids, i: client.get("/api/players/?fields=id,name&page=1&per_page=1000"), 200, False),
+    "player ids": (lambda client, ids, i: client.get("/api/players/?ids=" + ",".join(map(str, ids.players[:100]))), 200, False),
+    "player detail": (lambda client, ids, i: client.get(f"/api/players/{ids.players[i * 7 % len(ids.players)]}"), 200, False),
+    "player create": (lambda client, ids, i: client.post("/api/players/", player_data(i), format="json"), 201, False),
+    "player bulk create": (lambda client, ids, i: client.post("/api/players/", [player_data(i * 100 + j) for j in range(100)], format="json"), 201, False),
+    "player update": (lambda client, ids, i: client.patch(f"/api/players/{ids.players[i]}", {"appearances": i}, format="json"), 200, False),
+    "player delete": (lambda client, ids, i: client.delete(f"/api/players/{ids.players[-1 - i]}"), 204, False),
+
+    # search
+    "search prefix": (lambda client, ids, i: client.get("/api/search/?q=joão"), 200, False),
+    "search fuzzy": (lambda client, ids, i: client.get("/api/search/?q=oliviera"), 200, False),
+
+    # statistics
+    "stats": (lambda client, ids, i: client.get("/api/stats/"), 200, False),
+    "team stats list": (lambda client, ids, i: client.get("/api/stats/teams/?page=1"), 200, False),
+    "team stats detail": (lambda client, ids, i: client.get(f"/api/stats/teams/{ids.teams[i % len(ids.teams)]}"), 200, False),
+    "league stats list": (lambda client, ids, i: client.get("/api/stats/leagues/"), 200, False),
+    "position stats list": (lambda client, ids, i: client.get(f"/api/stats/positions/?league={ids.leagues[0]}"), 200, False),
+
+    # change feed
+    "player changes": (lambda client, ids, i: get_changes(client, "/api/changes/?resource=players&per_page=100"), 200, False),
+    "player changes since": (lambda client, ids, i: get_changes(client, f"/api/changes/?resource=players&per_page=100&since={ids.changes_token}"), 200, False),
+}
+
+
+class Ids:
+    def __init__(self):
+        self.leagues = list(League.objects.order_by("id").values_list("id", flat=True))
+        self.teams = list(Team.objects.order_by("id").values_list("id", flat=True))
+        self.players = list(Player.objects.order_by("id").values_list("id", flat=True))
+        # halfway through the generated players, which share one 'updated_at', of a sync started now.
+        middle = Player.objects.get(pk=self.players[len(self.players) // 2])
+        self.changes_token = encode_token((middle.updated_at, UPSERT, middle.pk, timezone.now()))
+
+
+@pytest.fixture(scope="module")
+def ids(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        start = time.perf_counter()
+        counts = generate(LEAGUES, TEAMS_PER_LEAGUE, PLAYERS_PER_TEAM)
+        print(f"\ngenerated {counts[0]} leagues, {counts[1]} teams, {counts[2]} players in {time.perf_counter() - start:.1f}s")
+
+        yield Ids()
+
+        # a plain TRUNCATE / DELETE: no per-row signals, and the next modules start empty again.
+        call_command("flush", interactive=False, verbosity=0)
+        cache.clear()
+
+
+def calibrate():
+    """
+        Milliseconds this machine takes for a fixed pure-Python workload (best of 5), which baselines are
+        scaled by: a run on a slower or busier machine than the baselines' is allowed proportionally more.
+    """
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        sorted(str(i * 7919 % 100003) for i in range(200000))
+        timings.append(time.perf_counter() - start)
+
+    return round(min(timings) * 1000, 3)
+
+
+@pytest.fixture(scope="module")
+def results():
+    results = {"calibration_ms": calibrate()}
+    yield results
+
+    if UPDATE_BASELINES:
+        baselines = load_baselines()
+        # a partial run ('-k') only replaces its own scenarios.
+        baselines[DATASET] = {**baselines.get(DATASET, {}), **results}
+
+        with open(BASELINES_PATH, "w") as file:
+            json.dump(baselines, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+
+def load_baselines():
+    if not os.path.exists(BASELINES_PATH):
+        return {}
+
+    with open(BASELINES_PATH) as file:
+        return json.load(file)
+
+
+def percentile(timings, p):
+    # nearest rank.
+    return sorted(timings)[max(0, math.ceil(p / 100 * len(timings)) - 1)]
+
+
+def measure(name, ids, offset=0):
+    send, expected_status, cached = SCENARIOS[name]
+    client = APIClient()
+    timings, queries = [], 0
+
+    with override_settings(RESPONSE_CACHE_TIMEOUT=300 if cached else 0):
+        # warm-up (and, for cached scenarios, the cache fill), not measured.
+        send(client, ids, offset + ITERATIONS)
+
+        for i in range(offset, offset + ITERATIONS):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = send(client, ids, i)
+                timings.append(time.perf_counter() - start)
+
+            assert response.status_code == expected_status, response.content[:500]
+            queries = max(queries, len(context.captured_queries))
+
+    return {
+        "p50_ms": round(percentile(timings, 50) * 1000, 3),
+        "p95_ms": round(percentile(timings, 95) * 1000, 3),
+        "p99_ms": round(percentile(timings, 99) * 1000, 3),
+        "queries": queries,
+    }
+
+
+def regressions(result, baseline, scale):
+    slower = []
+    for key, tolerance in (("p50_ms", TOLERANCE), ("p95_ms", 2 * TOLERANCE)):
+        allowed = max(baseline[key] * (1 + tolerance), baseline[key] + NOISE_MS) * scale
+        if result[key] > allowed:
+            slower.append(f"{key[:3]} {result[key]:.2f}ms, baseline {baseline[key]:.2f}ms")
+
+    return slower
+
+
+@pytest.mark.parametrize("name", SCENARIOS)
+def test_scenario(name, ids, results):
+    result = results[name] = measure(name, ids)
+
+    baselines = load_baselines().get(DATASET, {})
+    baseline = baselines.get(name)
+    print(
+        f"\n{name:<25} p50 {result['p50_ms']:8.2f}ms  p95 {result['p95_ms']:8.2f}ms  p99 {result['p99_ms']:8.2f}ms  "
+        f"{result['queries']:3d} queries" + (
+            f"  (baseline p50 {baseline['p50_ms']:.2f}ms  p95 {baseline['p95_ms']:.2f}ms  {baseline['queries']} queries)" if baseline else "  (no baseline)"
+        )
+    )
+
+    if baseline and not UPDATE_BASELINES:
+        assert result["queries"] <= baseline["queries"], f"{name}: {result['queries']} queries, baseline {baseline['queries']}"
+
+        scale = max(1.0, results["calibration_ms"] / baselines["calibration_ms"])
+        if regressions(result, baseline, scale):
+            # a burst of load on the machine looks like a regression: it only counts if it reproduces.
+            retry = measure(name, ids, offset=ITERATIONS + 1)
+            result = {key: min(result[key], retry[key]) for key in result}
+            print(f"{'':<25} retry: p50 {retry['p50_ms']:8.2f}ms  p95 {retry['p95_ms']:8.2f}ms")
+
+            slower = regressions(result, baseline, scale)
+            assert not slower, f"{name}: " + "; ".join(slower)
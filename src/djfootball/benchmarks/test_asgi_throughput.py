@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client, override_settings
+from django.urls import path
+
+from football.api.views import player
+from football.api.views.asynchronous import async_api_view
+from football.models import Player
+
+
+# In-process comparison of the dispatch paths (cache hits on a 100 players list). For a load test
+# against real servers, run e.g. 'gunicorn djfootball.wsgi' and 'uvicorn djfootball.asgi:application'
+# behind an HTTP load generator.
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+TOTAL_REQUESTS = 1000
+CONCURRENCY = 50
+
+urlpatterns = [
+    path("sync/players/", player.PlayerListCreateView.as_view()),
+    path("async/players/", async_api_view(player.PlayerListCreateView)),
+]
+
+
+def report(label, seconds):
+    print(f"\n{label:<20} {TOTAL_REQUESTS} requests in {seconds:.3f}s ({TOTAL_REQUESTS / seconds:,.0f} req/sec)")
+
+
+@pytest.fixture(autouse=True)
+def players():
+    Player.objects.bulk_create(
+        Player(name=f"Jogador {i}", age=27, position="Atacante", appearances=i) for i in range(100)
+    )
+
+
+def run_concurrently(url):
+    client = AsyncClient()
+
+    async def worker(requests):
+        for _ in range(requests):
+            assert (await client.get(url)).status_code == 200
+
+    async def run():
+        await asyncio.gather(*(worker(TOTAL_REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)))
+
+    start = time.perf_counter()
+    async_to_sync(run)()
+    return time.perf_counter() - start
+
+
+@override_settings(ROOT_URLCONF=__name__)
+def test_wsgi_list():
+    client = Client()
+
+    start = time.perf_counter()
+    for _ in range(TOTAL_REQUESTS):
+        assert client.get("/sync/players/").status_code == 200
+    report("WSGI", time.perf_counter() - start)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+def test_asgi_sync_view_list():
+    report("ASGI, sync view", run_concurrently("/sync/players/"))
+
+
+@override_settings(ROOT_URLCONF=__name__)
+def test_asgi_async_view_list():
+    report("ASGI, async view", run_concurrently("/async/players/"))
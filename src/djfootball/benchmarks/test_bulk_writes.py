@@ -0,0 +1,66 @@
+import time
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from football.models import Player
+
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+TOTAL_PLAYERS = 500
+
+
+def player_data(i):
+    return {"name": f"Jogador {i}", "age": 20 + i % 20, "position": "Atacante", "appearances": i}
+
+
+def report(label, rows, seconds):
+    print(f"\n{label:<25} {rows} rows in {seconds:.3f}s ({rows / seconds:,.0f} rows/sec)")
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+def test_single_row_create(client):
+    url = reverse("player-list-create")
+
+    start = time.perf_counter()
+    for i in range(TOTAL_PLAYERS):
+        client.post(url, player_data(i), format="json")
+    report("single-row POST", TOTAL_PLAYERS, time.perf_counter() - start)
+
+    assert Player.objects.count() == TOTAL_PLAYERS
+
+
+def test_bulk_create(client):
+    url = reverse("player-list-create")
+
+    start = time.perf_counter()
+    client.post(url, [player_data(i) for i in range(TOTAL_PLAYERS)], format="json")
+    report("bulk POST", TOTAL_PLAYERS, time.perf_counter() - start)
+
+    assert Player.objects.count() == TOTAL_PLAYERS
+
+
+def test_single_row_update(client):
+    players = Player.objects.bulk_create(Player(**player_data(i)) for i in range(TOTAL_PLAYERS))
+
+    start = time.perf_counter()
+    for player in players:
+        url = reverse("player-retrieve-update-destroy", kwargs={"pk": player.id})
+        client.patch(url, {"appearances": 0}, format="json")
+    report("single-row PATCH", TOTAL_PLAYERS, time.perf_counter() - start)
+
+
+def test_bulk_update(client):
+    players = Player.objects.bulk_create(Player(**player_data(i)) for i in range(TOTAL_PLAYERS))
+
+    start = time.perf_counter()
+    client.patch(reverse("player-list-create"), [{"id": player.id, "appearances": 0} for player in players], format="json")
+    report("bulk PATCH", TOTAL_PLAYERS, time.perf_counter() - start)
+
+    assert not Player.objects.exclude(appearances=0).exists()
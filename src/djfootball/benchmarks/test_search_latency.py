@@ -0,0 +1,51 @@
+import random
+import statistics
+import time
+
+import pytest
+
+from football.api.search import TrigramIndex
+
+
+pytestmark = [pytest.mark.benchmark]
+
+TOTAL_NAMES = 1_000_000
+
+SYLLABLES = ["ba", "ro", "mi", "che", "lu", "ca", "to", "ri", "nho", "fe", "gon", "sa", "vi", "dos", "mar", "quel", "es", "di", "al", "ber"]
+
+
+@pytest.fixture(scope="module")
+def index():
+    rng = random.Random(0)
+    word = lambda: "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+    rows = ((i, f"{word()} {word()}") for i in range(TOTAL_NAMES))
+
+    start = time.perf_counter()
+    index = TrigramIndex(rows)
+    print(f"\nindex of {TOTAL_NAMES} names built in {time.perf_counter() - start:.1f}s")
+
+    return index
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    p50, p95 = statistics.median(timings), timings[int(len(timings) * 0.95)]
+    print(f"\n{label:<8} p50 {p50 * 1000:.2f}ms  p95 {p95 * 1000:.2f}ms")
+
+
+def measure(search, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search(query)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def test_prefix(index):
+    report("prefix", measure(lambda query: index.prefix(query, 20), ["ro", "mar", "lucato", "chenho ber"] * 50))
+
+
+def test_fuzzy(index):
+    report("fuzzy", measure(lambda query: index.fuzzy(query, 20), ["marquel dosvi", "gonsaca", "berchelu rito"] * 20))
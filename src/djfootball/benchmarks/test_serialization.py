@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+from football.api.serializers import PlayerSerializer
+from football.models import Team, Player
+
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+TOTAL_PLAYERS = 20000
+
+
+def report(label, seconds):
+    print(f"\n{label:<15} {TOTAL_PLAYERS} rows in {seconds:.3f}s ({TOTAL_PLAYERS / seconds:,.0f} rows/sec)")
+
+
+@pytest.fixture(autouse=True)
+def players():
+    team = Team.objects.create(name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25)
+    Player.objects.bulk_create(
+        (Player(name=f"Jogador {i}", age=27, position="Atacante", appearances=i, team=team) for i in range(TOTAL_PLAYERS)),
+        batch_size=5000,
+    )
+
+
+def test_model_serializer():
+    start = time.perf_counter()
+    data = PlayerSerializer(PlayerSerializer.setup_queryset(Player.objects.all()), many=True).data
+    report("ModelSerializer", time.perf_counter() - start)
+
+    assert len(data) == TOTAL_PLAYERS
+
+
+def test_values_path():
+    start = time.perf_counter()
+    data = PlayerSerializer.values_data(PlayerSerializer.values_queryset(Player.objects.all()))
+    report("values path", time.perf_counter() - start)
+
+    assert len(data) == TOTAL_PLAYERS
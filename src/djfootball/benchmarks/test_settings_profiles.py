@@ -0,0 +1,77 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+pytestmark = [pytest.mark.benchmark]
+
+PROFILES = ("djfootball.settings", "djfootball.settings_api")
+
+# run in a fresh interpreter per profile: settings can't be swapped once Django is set up.
+SCRIPT = textwrap.dedent("""
+    import json, statistics, time
+
+    start = time.perf_counter()
+    import django
+    django.setup()
+    from django.core.handlers.wsgi import WSGIHandler
+    handler = WSGIHandler()
+    startup = time.perf_counter() - start
+
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.test import Client
+
+    call_command("migrate", verbosity=0)
+    from football.models import League, Team, Player
+    league = League.objects.create(name="Liga", country="Portugal", number_of_teams=1)
+    team = Team.objects.create(name="Porto", city="Porto", championships_won=1, coach="Coach", number_of_players=20, league=league)
+    Player.objects.bulk_create(Player(name=f"Player {i}", age=20, position="Forward", appearances=i, team=team) for i in range(20))
+
+    # 'localhost' is in 'ALLOWED_HOSTS' with DEBUG off; the first request fills the response cache.
+    client = Client(HTTP_HOST="localhost")
+    assert client.get("/api/players/").status_code == 200
+
+    timings = []
+    for _ in range(2000):
+        start = time.perf_counter()
+        client.get("/api/players/")
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    print(json.dumps({
+        "startup": startup,
+        "p50": statistics.median(timings),
+        "p95": timings[int(len(timings) * 0.95)],
+        "middleware": len(settings.MIDDLEWARE),
+        "apps": len(settings.INSTALLED_APPS),
+    }))
+""")
+
+
+def run(profile):
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": profile,
+        "DATABASE_ENGINE": "django.db.backends.sqlite3",
+        "DATABASE_NAME": ":memory:",
+        "DEBUG": "0",
+        "SERVER_TIMING": "0",
+    }
+    output = subprocess.run([sys.executable, "-c", SCRIPT], env=env, capture_output=True, text=True, check=True).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_settings_profiles():
+    for profile in PROFILES:
+        result = run(profile)
+        print(
+            f"\n{profile:<25} {result['apps']} apps, {result['middleware']} middleware  "
+            f"startup {result['startup'] * 1000:.0f}ms  "
+            f"cached GET p50 {result['p50'] * 1e6:.0f}us  p95 {result['p95'] * 1e6:.0f}us"
+        )
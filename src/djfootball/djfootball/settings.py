@@ -47,6 +47,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # outermost, so its total covers the whole stack ('football.instrumentation').
+    'football.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -76,6 +78,9 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'djfootball.wsgi.application'
 
+# Serve the API through async views ('football.api.views.asynchronous'), set by 'djfootball.asgi'.
+ASYNC_API_VIEWS = (os.environ.get("ASYNC_API_VIEWS")) == "1"
+
 
 # Database
 # https://docs.djangoproject.com/en/4.0/ref/settings/#databases
@@ -87,13 +92,65 @@ DATABASES = {
         "USER": os.environ.get("DATABASE_USER"),
         "PASSWORD": os.environ.get("DATABASE_PASSWORD"),
         "HOST": os.environ.get("DATABASE_HOST"),
-        "PORT": os.environ.get("DATABASE_PORT")
+        "PORT": os.environ.get("DATABASE_PORT"),
+        # seconds a connection is kept open for the next requests ('0' closes it after each request).
+        # Under ASGI every request runs in its own thread, so connections can't be reused there.
+        "CONN_MAX_AGE": int(os.environ.get("DATABASE_CONN_MAX_AGE", 0 if ASYNC_API_VIEWS else 60)),
+        # PgBouncer in transaction pooling mode can't keep the server-side cursors behind '.iterator()'.
+        "DISABLE_SERVER_SIDE_CURSORS": (os.environ.get("DATABASE_PGBOUNCER")) == "1",
     }
 }
 
+# pg_trgm lookups ('trigram_similar') used by '/api/search/' on PostgreSQL.
+if "postgresql" in (DATABASES["default"]["ENGINE"] or ""):
+    INSTALLED_APPS.append("django.contrib.postgres")
+
+# Check persistent connections on their first use in a request, and replace broken ones ('football.connections').
+DATABASE_CONN_HEALTH_CHECKS = (os.environ.get("DATABASE_CONN_HEALTH_CHECKS", "1")) == "1"
+
+# Per-request database, serialization and render timings in a 'Server-Timing' response header.
+SERVER_TIMING = (os.environ.get("SERVER_TIMING", "1")) == "1"
+
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+# Local memory by default; e.g. 'django.core.cache.backends.redis.RedisCache' with a 'redis://' location
+# to share the API response cache (and its invalidation) between workers. ETags (conditional GETs)
+# are only sent with a shared backend: a local one doesn't see other processes' writes.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+    }
+}
+
+# Read lists' related names from the denormalized 'Player.team_name' / 'Team.league_name' columns
+# instead of joining ('football.denormalize'); '0' goes back to the joins.
+DENORMALIZED_NAMES = (os.environ.get("DENORMALIZED_NAMES", "1")) == "1"
+
+# Seconds an API response stays cached ('0' disables the response cache).
+RESPONSE_CACHE_TIMEOUT = int(os.environ.get("RESPONSE_CACHE_TIMEOUT", 300))
+
+# Seconds the in-process search index ('football.api.search', without pg_trgm) is trusted for with a
+# local cache backend, whose table versions don't see other processes' writes: it's rebuilt after that.
+SEARCH_INDEX_MAX_AGE = int(os.environ.get("SEARCH_INDEX_MAX_AGE", 300))
+
+# Change feed ('/api/changes/'): changes are served once they're this many seconds old, leaving
+# transactions that long to commit, and deletes are remembered for this many days ('prune_tombstones').
+CHANGES_DELAY_SECONDS = int(os.environ.get("CHANGES_DELAY_SECONDS", 5))
+CHANGES_RETENTION_DAYS = int(os.environ.get("CHANGES_RETENTION_DAYS", 30))
+
 # REST framework defaults.
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # same encoder as the views' 'JsonResponse's (orjson when installed).
+    "DEFAULT_RENDERER_CLASSES": [
+        "football.api.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    # default page size for both page number ('?page=') and keyset ('?cursor=') pagination.
+    "DEFAULT_PAGINATION_CLASS": "football.api.paginators.SingleSetPagination",
+    "PAGE_SIZE": int(os.environ.get("PAGE_SIZE", 50)),
 }
 
 # API Documentation settings (drf-spectacular).
@@ -0,0 +1,44 @@
+"""
+API-only settings profile for djfootball (DJANGO_SETTINGS_MODULE=djfootball.settings_api).
+
+The API's clients are stateless: they send no session cookie and no CSRF token, and never see the
+admin, the browsable API or a template. This profile drops everything that only exists for those,
+so each request skips the session, CSRF, authentication and messages middleware, and startup skips
+loading the admin, auth, sessions, messages and staticfiles apps.
+
+Everything else comes from 'djfootball.settings'.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import INSTALLED_APPS, REST_FRAMEWORK
+
+
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS
+    if app not in (
+        'django.contrib.admin',
+        'django.contrib.auth',
+        'django.contrib.contenttypes',
+        'django.contrib.sessions',
+        'django.contrib.messages',
+        'django.contrib.staticfiles',
+    )
+]
+
+MIDDLEWARE = [
+    'football.instrumentation.InstrumentationMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+# no app templates (admin, browsable API, Swagger UI) to look up.
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    # JSON only: the browsable API needs templates and static files.
+    "DEFAULT_RENDERER_CLASSES": ["football.api.renderers.JSONRenderer"],
+    # no session (or any other) authentication, and no 'django.contrib.auth' for 'request.user'.
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "UNAUTHENTICATED_USER": None,
+}
@@ -1,15 +1,28 @@
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
+from football.instrumentation import metrics
+
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
-    path("api/", include("football.api.urls"))
+    path("api/", include("football.api.urls")),
+    # Prometheus scrape endpoint.
+    path("metrics", metrics, name="metrics"),
 ]
 
 urlpatterns += [
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("api/swagger/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
-    # path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
 ]
+
+# left out by the API-only profile ('djfootball.settings_api').
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns += [path("admin/", admin.site.urls)]
+
+if apps.is_installed("django.contrib.staticfiles"):
+    urlpatterns += [
+        path("api/swagger/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
+        # path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    ]
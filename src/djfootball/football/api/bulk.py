@@ -0,0 +1,106 @@
+from django.db import transaction
+
+from .renderers import JsonResponse
+
+
+# maximum number of ids of a single 'bulk_fetch()'.
+MAX_BULK_FETCH = 1000
+
+
+def parse_ids(value):
+    """
+        Parses a comma separated list of primary keys ('1,2,3'), returning None if it's malformed.
+    """
+    try:
+        return [int(pk) for pk in value.split(",") if pk.strip()]
+    except (AttributeError, ValueError):
+        return None
+
+
+def bulk_create(serializer_class, data):
+    """
+        Validates a list of objects and inserts them with a single 'bulk_create()'.
+
+        Nothing is written unless every item is valid; errors are reported per item, in input order.
+    """
+    serializer = serializer_class(data=data, many=True)
+
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400, safe=False)
+
+    with transaction.atomic():
+        serializer.save()
+
+    return JsonResponse(serializer.data, status=201, safe=False)
+
+
+def bulk_update(serializer_class, queryset, data):
+    """
+        Partially updates a list of objects, each identified by its 'id', with a single 'bulk_update()'.
+
+        Nothing is written unless every item is valid and exists; errors are reported per item, in input order.
+    """
+    if not isinstance(data, list):
+        return JsonResponse({"non_field_errors": ["Expected a list of items."]}, status=400)
+
+    # JSON integers only: 'true' is an 'int' too, and equal to 1.
+    ids = [item.get("id") if isinstance(item, dict) and type(item.get("id")) is int else None for item in data]
+
+    with transaction.atomic():
+        # one query for every row to update, locked until the transaction ends.
+        stored = queryset.select_for_update(of=("self",)).in_bulk([pk for pk in ids if pk is not None])
+
+        serializer = serializer_class([stored.get(pk) for pk in ids], data=data, many=True, partial=True)
+        is_valid = serializer.is_valid()
+
+        errors = [
+            item_errors if pk in stored else {**item_errors, "id": ["Not found."]}
+            for pk, item_errors in zip(ids, serializer.errors or [{}] * len(ids))
+        ]
+        if not is_valid or any(errors):
+            return JsonResponse(errors, status=400, safe=False)
+
+        serializer.save()
+
+    return JsonResponse(serializer.data, status=200, safe=False)
+
+
+def bulk_delete(queryset, ids):
+    """
+        Deletes every object whose primary key is listed in 'ids' ('1,2,3') with a single DELETE.
+    """
+    ids = parse_ids(ids)
+    if not ids:
+        return JsonResponse({"ids": ["Expected a comma separated list of ids."]}, status=400)
+
+    with transaction.atomic():
+        deleted, _ = queryset.filter(pk__in=ids).delete()
+
+    return JsonResponse({"deleted": deleted}, status=200)
+
+
+def bulk_fetch(serializer_class, queryset, ids, fields=None):
+    """
+        Returns the objects whose primary key is listed in 'ids' ('1,2,3' or a list) with a single 'pk__in' query.
+
+        Results follow the requested order (duplicates removed); ids that don't exist are listed under 'missing'.
+    """
+    if isinstance(ids, str):
+        ids = parse_ids(ids)
+    elif not isinstance(ids, list) or not all(type(pk) is int for pk in ids):
+        ids = None
+
+    if not ids:
+        return JsonResponse({"ids": ["Expected a list of ids."]}, status=400)
+
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_BULK_FETCH:
+        return JsonResponse({"ids": [f"Ensure there are no more than {MAX_BULK_FETCH} ids."]}, status=400)
+
+    rows = serializer_class.values_queryset(queryset.filter(pk__in=ids), fields)
+    by_id = {row["id"] if isinstance(row, dict) else row.pk: row for row in rows}
+
+    return JsonResponse({
+        "results": serializer_class.values_data([by_id[pk] for pk in ids if pk in by_id], fields),
+        "missing": [pk for pk in ids if pk not in by_id],
+    })
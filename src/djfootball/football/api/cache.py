@@ -0,0 +1,183 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+
+
+def _version_key(model):
+    return f"football:version:{model._meta.label_lower}"
+
+
+def get_versions(models):
+    """
+        Returns the current version of each model's table.
+
+        A version is the 'time.time_ns()' of the table's last write. A missing version (first use,
+        or evicted by the cache backend) is initialized to "now" rather than to a constant, so an
+        eviction can never bring back responses cached under an older version.
+    """
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+
+    return [versions[key] for key in keys]
+
+
+def local_versions():
+    """
+        Whether the table versions are this process' own (a LocMemCache, a dict in this process): they
+        only see this process' writes, not other workers' or management commands'.
+    """
+    return isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache)
+
+
+def _blocks():
+    # a local cache is read on the event loop directly. Any other backend goes through Django's
+    # async cache API (a thread hop on Django 4.0).
+    return not local_versions()
+
+
+async def aget_versions(models):
+    """
+        Async variant of 'get_versions()'.
+    """
+    if not _blocks():
+        return get_versions(models)
+
+    keys = [_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), timeout=None)
+            versions[key] = await cache.aget(key)
+
+    return [versions[key] for key in keys]
+
+
+async def aget_cached(key):
+    """
+        Async read of a cached response (see 'aget_versions()').
+    """
+    if not _blocks():
+        return cache.get(key)
+
+    return await cache.aget(key)
+
+
+def bump_version(model):
+    """
+        Marks a model's table as changed, orphaning every cached response that depends on it.
+    """
+    cache.set(_version_key(model), time.time_ns(), timeout=None)
+
+
+def get_validators(request, versions):
+    """
+        Returns the response cache key and the ETag of a GET request.
+
+        They're derived from the path, the normalized query parameters, the negotiated media type
+        and the versions of the tables involved. The ETag is None with a process-local cache backend:
+        writes of other workers and of management commands don't bump this process' versions, so an
+        ETag could outlive the data it stands for.
+    """
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    accept = request.META.get("HTTP_ACCEPT", "")
+    joined_versions = ".".join(str(version) for version in versions)
+
+    digest = hashlib.md5(f"{request.path}?{query}|{accept}|{joined_versions}".encode()).hexdigest()
+
+    return f"football:response:{digest}", None if local_versions() else f'"{digest}"'
+
+
+def not_modified(request, etag):
+    """
+        The '304 Not Modified' response to a request already holding 'etag', if any.
+
+        No Last-Modified: versions are finer than its one second resolution, and a write within the
+        second of a previous response would still be answered '304' to 'If-Modified-Since'.
+    """
+    if etag is None:
+        return None
+
+    return get_conditional_response(request, etag=etag)
+
+
+def cacheable(response):
+    # 'Cache-Control: no-store': a response the view knows to be out of date already.
+    return response.status_code == 200 and "no-store" not in response.get("Cache-Control", "")
+
+
+def set_validators(response, etag):
+    if etag is not None and cacheable(response):
+        response["ETag"] = etag
+
+    return response
+
+
+def cached_response(cached):
+    content, content_type = cached
+    return HttpResponse(content, content_type=content_type)
+
+
+class CachedResponseMixin:
+    """
+        Read-through response cache and conditional GET support for APIViews.
+
+        'cache_models' lists the models a view's responses are built from, its own model first
+        (e.g. a Player response embeds its Team's name, so it depends on (Player, Team)). Writing
+        to any of those tables bumps its version and thereby evicts the responses depending on it:
+        single-row writes through model signals ('football.signals'), and every successful write
+        handled by the view itself, which also covers bulk writes that don't send signals.
+
+        With a shared cache backend, the same versions give every GET response an ETag, so a client
+        revalidating an unchanged resource gets a '304 Not Modified' without any query or serialization.
+    """
+    cache_models = ()
+
+    def get_cache_models(self, request):
+        return self.cache_models
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            response = super().dispatch(request, *args, **kwargs)
+
+            if request.method != "OPTIONS" and response.status_code < 400:
+                bump_version(self.cache_models[0])
+
+            return response
+
+        key, etag = get_validators(request, get_versions(self.get_cache_models(request)))
+
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        return set_validators(self.cached_dispatch(request, key, *args, **kwargs), etag)
+
+    def cached_dispatch(self, request, key, *args, **kwargs):
+        if request.method != "GET" or not settings.RESPONSE_CACHE_TIMEOUT:
+            return super().dispatch(request, *args, **kwargs)
+
+        cached = cache.get(key)
+        if cached is not None:
+            return cached_response(cached)
+
+        response = super().dispatch(request, *args, **kwargs)
+
+        if cacheable(response) and not response.streaming:
+            if hasattr(response, "render"):
+                response.render()
+
+            cache.set(key, (response.content, response["Content-Type"]), settings.RESPONSE_CACHE_TIMEOUT)
+
+        return response
@@ -0,0 +1,161 @@
+import base64
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import League, Team, Player, Tombstone
+from .serializers import LeagueSerializer, TeamSerializer, PlayerSerializer
+
+
+# '?resource=' -> (model, serializer of the upserts' 'data').
+RESOURCES = {
+    "leagues": (League, LeagueSerializer),
+    "teams": (Team, TeamSerializer),
+    "players": (Player, PlayerSerializer),
+}
+
+# default and maximum number of changes per page.
+PER_PAGE = 100
+MAX_PER_PAGE = 1000
+
+# order of an upsert and a delete at the same instant.
+UPSERT, DELETE = 0, 1
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+def _microseconds(at):
+    return (at - EPOCH) // timedelta(microseconds=1)
+
+
+def encode_token(position):
+    """
+        Opaque form of a feed position: (instant, UPSERT or DELETE, row or tombstone id, horizon).
+
+        The horizon is the oldest instant whose deletes the client still needs ('changes()'), what
+        the token's expiry goes by.
+    """
+    at, kind, pk, horizon = position
+    token = f"{_microseconds(at)}:{kind}:{pk}:{_microseconds(horizon)}"
+
+    return base64.urlsafe_b64encode(token.encode()).decode().rstrip("=")
+
+
+def decode_token(token):
+    try:
+        microseconds, kind, pk, horizon = (int(part) for part in base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode().split(":"))
+    except ValueError:  # binascii.Error and UnicodeDecodeError included.
+        raise InvalidToken(token)
+
+    if kind not in (UPSERT, DELETE):
+        raise InvalidToken(token)
+
+    return EPOCH + timedelta(microseconds=microseconds), kind, pk, EPOCH + timedelta(microseconds=horizon)
+
+
+def expired(position):
+    """
+        Whether deletes the client needs may have been pruned ('prune_tombstones'): the client has to
+        start over from a full sync.
+    """
+    return position[3] < timezone.now() - timedelta(days=settings.CHANGES_RETENTION_DAYS)
+
+
+def _page(queryset, field, position, limit):
+    """
+        The first 'limit' rows of 'queryset' after 'position' in '(field, id)' order: the rest of the ties
+        at the position's instant ('pk' None: none of them), then the later instants.
+
+        Two seeks into the '(field, id)' index. '(field, id) > (at, pk)' is a single one on PostgreSQL,
+        but SQLite only seeks on 'field' with it and scans every tie, e.g. all the rows of a bulk load.
+    """
+    if position is None:
+        return list(queryset.order_by(field, "id")[:limit])
+
+    at, pk = position
+    rows = [] if pk is None else list(queryset.filter(**{field: at, "id__gt": pk}).order_by("id")[:limit])
+    if len(rows) < limit:
+        rows += queryset.filter(**{f"{field}__gt": at}).order_by(field, "id")[:limit - len(rows)]
+
+    return rows
+
+
+def changes(resource, since=None, per_page=PER_PAGE, fields=None):
+    """
+        Returns a page of the changes of 'resource' after the position 'since' (from the beginning
+        when None): 'results' in the order they happened, 'next' (the token to ask from next time)
+        and 'has_more' (whether 'next' is ready right away).
+
+        An upsert (an insert or an update: both read as the row's current state) is positioned at the
+        row's 'updated_at', a delete at its tombstone's 'deleted_at', ties broken by ids. Each side is
+        a keyset query ('WHERE (updated_at, id) > position ORDER BY updated_at, id LIMIT n', '_page()')
+        on its own index, so a page costs the same however long the tables and the history are.
+
+        Timestamps are taken before commit, so a transaction may become visible after later ones:
+        changes younger than 'CHANGES_DELAY_SECONDS' aren't served yet, giving transactions that long
+        to commit without their changes being skipped.
+
+        The last page moves 'next' up to that bound even when nothing changed, so the token of a quiet
+        resource doesn't age. Its horizon, the oldest delete the client still needs, is then the
+        position itself. While pages follow, it stays at the first page's bound at the earliest: rows
+        deleted before it was served aren't the client's.
+    """
+    model, serializer = RESOURCES[resource]
+    until = timezone.now() - timedelta(seconds=settings.CHANGES_DELAY_SECONDS)
+
+    rows = model.objects.filter(updated_at__lte=until).values_list("updated_at", "id")
+    tombstones = Tombstone.objects.filter(resource=model._meta.model_name, deleted_at__lte=until).values_list("deleted_at", "id", "object_id")
+
+    rows_after = tombstones_after = None
+    if since is not None:
+        at, kind, pk, _ = since
+        # at the same instant, upserts come before deletes.
+        rows_after = (at, pk if kind == UPSERT else None)
+        tombstones_after = (at, pk if kind == DELETE else 0)
+
+    # (instant, kind, id the position is made of, object id).
+    entries = sorted([
+        *((at, UPSERT, pk, pk) for at, pk in _page(rows, "updated_at", rows_after, per_page + 1)),
+        *((at, DELETE, pk, object_id) for at, pk, object_id in _page(tombstones, "deleted_at", tombstones_after, per_page + 1)),
+    ])
+    page = entries[:per_page]
+
+    upserted = [object_id for _, kind, _, object_id in page if kind == UPSERT]
+    data = {}
+    if upserted:
+        objects = list(serializer.values_queryset(model.objects.filter(id__in=upserted), fields))
+        for obj, item in zip(objects, serializer.values_data(objects, fields)):
+            data[obj["id"] if isinstance(obj, dict) else obj.pk] = item
+
+    results = []
+    for at, kind, _, object_id in page:
+        if kind == DELETE:
+            results.append({"op": "delete", "id": object_id, "changed_at": at})
+        # deleted since: its tombstone follows.
+        elif object_id in data:
+            results.append({"op": "upsert", "id": object_id, "changed_at": at, "data": data[object_id]})
+
+    has_more = len(entries) > per_page
+    if has_more:
+        position = page[-1][:3]
+        horizon = max(position[0], since[3] if since is not None else until)
+    else:
+        # everything up to 'until' was read: the position moves up to it, unless past it already (a
+        # page ending at that very instant, or a token of a shorter CHANGES_DELAY_SECONDS).
+        position = (until, DELETE, 0)
+        last = page[-1][:3] if page else since[:3] if since is not None else None
+        if last is not None and last > position:
+            position = last
+
+        horizon = position[0]
+
+    return {
+        "results": results,
+        "next": encode_token((*position, horizon)),
+        "has_more": has_more,
+    }
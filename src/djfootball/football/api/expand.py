@@ -0,0 +1,69 @@
+from django.db.models import Prefetch
+
+from ..models import League, Team
+from .serializers import TeamSerializer, PlayerSerializer
+
+
+# model -> {name: (reverse relation, serializer)} of the nested collections '?expand=' can add.
+EXPANSIONS = {
+    League: {"teams": ("team_set", TeamSerializer)},
+    Team: {"players": ("player_set", PlayerSerializer)},
+}
+
+
+def parse_expand(model, value):
+    """
+        Parses '?expand=' (e.g. 'teams,teams.players') into a tree ('{"teams": {"players": {}}}').
+
+        Raises ValueError naming the first path 'model' can't expand.
+    """
+    tree = {}
+
+    for path in filter(None, (path.strip() for path in (value or "").split(","))):
+        node, current = tree, model
+        for name in path.split("."):
+            if name not in EXPANSIONS.get(current, {}):
+                raise ValueError(f"Unknown expansion '{path}'.")
+
+            node = node.setdefault(name, {})
+            current = EXPANSIONS[current][name][1].Meta.model
+
+    return tree
+
+
+def expand_queryset(queryset, tree):
+    """
+        Adds one 'Prefetch' per level of 'tree', so the whole tree loads in one query per level.
+    """
+    return queryset.prefetch_related(*_prefetches(queryset.model, tree))
+
+
+def _prefetches(model, tree, prefix=""):
+    for name, subtree in tree.items():
+        relation, serializer_class = EXPANSIONS[model][name]
+        child_model = serializer_class.Meta.model
+
+        # a lookup's parent is prefetched before its children.
+        yield Prefetch(prefix + relation, queryset=serializer_class.setup_queryset(child_model.objects.order_by("id")))
+        yield from _prefetches(child_model, subtree, f"{prefix}{relation}__")
+
+
+def expand_data(data, instance, tree):
+    """
+        Adds the collections of 'tree' to 'data', the serialized 'instance' (loaded with 'expand_queryset()').
+    """
+    _attach([data], [instance], type(instance), tree)
+
+    return data
+
+
+def _attach(items, instances, model, tree):
+    for name, subtree in tree.items():
+        relation, serializer_class = EXPANSIONS[model][name]
+
+        for data, instance in zip(items, instances):
+            children = getattr(instance, relation).all()
+            children_data = serializer_class(children, many=True).data
+
+            _attach(children_data, children, serializer_class.Meta.model, subtree)
+            data[name] = children_data
@@ -1,6 +1,26 @@
 import django_filters
+from django_filters.constants import EMPTY_VALUES
 
-from ..models import Team
+from ..models import League, Team, Player
+
+
+class IdTieBreakOrderingFilter(django_filters.OrderingFilter):
+    """
+        Whitelisted '?ordering=' (e.g. '-age,name'), ties broken by 'id' so pages are stable.
+
+        The tie-break follows the direction of the first ordering term, so a descending ordering can
+        still be read backwards from its '(column, id)' index. Cursor pagination only orders by 'id'
+        ('cursor_with_ordering()').
+    """
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        ordering = [self.get_ordering_value(param) for param in value]
+        tie_break = "-id" if ordering[0].startswith("-") else "id"
+
+        return qs.order_by(*ordering, tie_break)
 
 
 class TeamFilter(django_filters.FilterSet):
@@ -11,3 +31,31 @@ class TeamFilter(django_filters.FilterSet):
     class Meta:
         model = Team
         fields = ("name", "city", "championships_won", "coach", "number_of_players")
+
+
+class PlayerFilter(django_filters.FilterSet):
+    # '?age_min=' / '?age_max=', '?appearances_min=' / '?appearances_max='.
+    age         = django_filters.RangeFilter()
+    appearances = django_filters.RangeFilter()
+    position    = django_filters.CharFilter(lookup_expr="iexact")
+    team        = django_filters.NumberFilter(field_name="team")
+    # joins 'Team': players of the league's teams.
+    league      = django_filters.NumberFilter(field_name="team__league")
+
+    ordering = IdTieBreakOrderingFilter(fields=("name", "age", "appearances"))
+
+    class Meta:
+        model = Player
+        fields = ("age", "appearances", "position", "team", "league")
+
+
+class LeagueFilter(django_filters.FilterSet):
+    country         = django_filters.CharFilter(lookup_expr="iexact")
+    # '?number_of_teams_min=' / '?number_of_teams_max='.
+    number_of_teams = django_filters.RangeFilter()
+
+    ordering = IdTieBreakOrderingFilter(fields=("name", "number_of_teams"))
+
+    class Meta:
+        model = League
+        fields = ("country", "number_of_teams")
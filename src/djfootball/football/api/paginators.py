@@ -1,9 +1,46 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
 
 
 class SingleSetPagination(PageNumberPagination):
-    page_size = 2
     max_page_size = 1000
     page_query_param = 'page'
     page_size_query_param = 'per_page'
 
+
+class SingleSetCursorPagination(CursorPagination):
+    """
+        Keyset pagination over the primary key.
+
+        Each page is a 'WHERE id > <last id> ORDER BY id LIMIT n' query, so there's no COUNT(*)
+        and no OFFSET scan: deep pages cost the same as the first one.
+    """
+    max_page_size = 1000
+    ordering = 'id'
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'per_page'
+
+
+def get_paginator(request):
+    """
+        Picks the pagination mode requested by the client, if any.
+
+        '?cursor' (empty on the first page) selects keyset pagination; '?page=N' selects page numbers.
+    """
+    if SingleSetCursorPagination.cursor_query_param in request.query_params:
+        return SingleSetCursorPagination()
+
+    if request.query_params.get(SingleSetPagination.page_query_param):
+        return SingleSetPagination()
+
+    return None
+
+
+def cursor_with_ordering(request):
+    """
+        Whether '?cursor' comes with an '?ordering=': not supported, cursor pages are in 'id' order.
+
+        Their cursor is the last id seen. CursorPagination could key on the first ordering column
+        instead, but it skips the rows tied on it by an OFFSET, which low cardinality columns such as
+        'age' turn into a scan.
+    """
+    return SingleSetCursorPagination.cursor_query_param in request.query_params and bool(request.query_params.get("ordering"))
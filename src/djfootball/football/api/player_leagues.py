@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+
+from ..models import League, Team, Player
+from .cache import get_versions, local_versions
+from .renderers import JsonResponse
+from .serializers import LeagueSerializer
+
+
+# maximum number of '?player_name=' values of a single request.
+MAX_PLAYER_NAMES = 100
+
+# normalized names whose leagues are remembered by each process ('resolve_league_ids()').
+CACHE_SIZE = 10000
+
+
+def normalize_name(name):
+    """
+        The key of a name's answer: names are matched case-insensitively ('iexact'), surrounding
+        whitespace ignored.
+    """
+    return name.strip().lower()
+
+
+class LRUCache:
+    """
+        Thread-safe mapping keeping the 'maxsize' most recently used entries.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys):
+        with self.lock:
+            found = {}
+            for key in keys:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    found[key] = self.entries[key]
+
+            return found
+
+    def set_many(self, items):
+        with self.lock:
+            self.entries.update(items)
+            for key in items:
+                self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+_cache = LRUCache(CACHE_SIZE)
+_cache_versions = None
+
+
+def resolve_league_ids(names):
+    """
+        Returns 'normalize_name(name) -> league ids' for 'names': a sorted tuple of the leagues of every player
+        of that name (empty when none of them plays in a league), or None when there's no such player.
+
+        Answers are kept in this process' LRU cache, emptied whenever the Player, Team or League table
+        changes. That takes versions every process shares: with a local cache backend, other processes'
+        writes would go unseen, and there's no LRU. Misses are resolved in one query, each name an
+        'iexact' lookup served by 'player_name_ci_idx'.
+    """
+    global _cache_versions
+
+    remember = not local_versions()
+    if remember:
+        versions = get_versions((Player, Team, League))
+        if versions != _cache_versions:
+            _cache.clear()
+            _cache_versions = versions
+
+    # the key of each name -> the name looked up, as given.
+    stripped = {normalize_name(name): name.strip() for name in names}
+    resolved = _cache.get_many(stripped) if remember else {}
+
+    misses = [name for name in stripped if name not in resolved]
+    if misses:
+        found = {name: set() for name in misses}
+
+        # LEFT OUTER JOIN with 'Team': players without a team still count as found.
+        rows = list(Player.objects.filter(reduce(or_, (Q(name__iexact=stripped[name]) for name in misses))).values_list("name", "team__league"))
+        for name, league_id in rows:
+            leagues = found.get(normalize_name(name))
+            if leagues is not None and league_id is not None:
+                leagues.add(league_id)
+
+        matched = {normalize_name(name) for name, _ in rows}
+        answers = {name: tuple(sorted(found[name])) if name in matched else None for name in misses}
+
+        if remember:
+            _cache.set_many(answers)
+        resolved.update(answers)
+
+    return resolved
+
+
+def player_leagues(names, fields=None):
+    """
+        Responds to '?player_name=' (repeatable): the leagues of the players with any of 'names', by id,
+        and which names matched no player ('missing') or only players outside any league ('no_league').
+    """
+    names = [name for name in names if name.strip()]
+    if len(names) > MAX_PLAYER_NAMES:
+        return JsonResponse({"player_name": [f"At most {MAX_PLAYER_NAMES} names."]}, status=400)
+
+    resolved = resolve_league_ids(names)
+
+    league_ids = sorted({league_id for league_ids in resolved.values() if league_ids for league_id in league_ids})
+    leagues_queryset = LeagueSerializer.values_queryset(League.objects.filter(id__in=league_ids), fields).order_by("id")
+
+    names = list(dict.fromkeys(names))
+    return JsonResponse({
+        "results": LeagueSerializer.values_data(leagues_queryset, fields),
+        "missing": [name for name in names if resolved[normalize_name(name)] is None],
+        "no_league": [name for name in names if resolved[normalize_name(name)] == ()],
+    })
@@ -0,0 +1,56 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from rest_framework import renderers
+
+from ..instrumentation import timed
+
+try:
+    import orjson
+except ImportError:  # optional, the standard library encoder is used instead.
+    orjson = None
+
+
+_encoder = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# datetimes go through DjangoJSONEncoder on both backends, so the output doesn't depend on the one installed.
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+
+def dumps(data):
+    """
+        Encodes 'data' to UTF-8 JSON bytes, with orjson when it's installed.
+    """
+    with timed("render"):
+        if orjson is not None:
+            return orjson.dumps(data, default=_encoder.default, option=_ORJSON_OPTIONS)
+
+        return _encoder.encode(data).encode()
+
+
+class JsonResponse(HttpResponse):
+    """
+        Drop-in replacement for 'django.http.JsonResponse' encoding through 'dumps()'.
+    """
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError("In order to allow non-dict objects to be serialized set the safe parameter to False.")
+
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+        DRF renderer encoding through 'dumps()', so DRF 'Response's and 'JsonResponse's share one encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        # indented output (the browsable API) is left to DRF.
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return dumps(data)
@@ -0,0 +1,362 @@
+import logging
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import TextField
+from django.db.models.functions import Cast, Upper
+
+from ..models import League, Team, Player
+from .cache import get_versions, local_versions
+from .player_leagues import LRUCache
+
+
+# searchable resources: type -> (model, searched columns).
+SEARCH_FIELDS = {
+    "player": (Player, ("name",)),
+    "team": (Team, ("name", "coach")),
+    "league": (League, ("name",)),
+}
+
+# minimum similarity of a fuzzy match, pg_trgm's default 'similarity_threshold'.
+SIMILARITY_THRESHOLD = 0.3
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[^\W_]+")
+# the bytes of a bitmap holding a row, and the rows of each byte value.
+_NONZERO = re.compile(rb"[^\x00]")
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+_BLOCK = 512
+_ZEROS = bytes(_BLOCK)
+
+
+def trigrams(text):
+    """
+        Returns the set of trigrams of 'text' the way pg_trgm extracts them: lowercased, per word,
+        each word padded with two spaces in front and one behind.
+    """
+    result = set()
+    for word in _WORD.findall(text.casefold()):
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return result
+
+
+def similarity(a, b):
+    """
+        pg_trgm's 'similarity()': shared trigrams over the trigrams of either side.
+    """
+    if not a or not b:
+        return 0.0
+
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class TrigramIndex:
+    """
+        In-process search index over one text column, for databases without pg_trgm.
+
+        Prefix matches come from a sorted list of the casefolded values (a binary search). Fuzzy matches
+        come from trigram posting lists kept as bitmaps (Python ints, one bit per row): a bit-sliced
+        counter adds the query's bitmaps up a machine word at a time, giving every row's shared trigrams.
+        Rows sharing 's' of them and having 'n' trigrams of their own have the same similarity, so with
+        a bitmap of the rows of each trigram count, rows are read off best (s, n) first, and only until
+        the best 'limit' are found.
+    """
+
+    # posting lists at least this dense are bitmaps from the start, no larger than their array of
+    # positions (4 bytes per entry, against 1 bit per row). Sparser ones become bitmaps when queried,
+    # the most recently used kept.
+    BITMAP_DENSITY = 1 / 32
+    CACHED_BITMAPS = 256
+
+    def __init__(self, rows):
+        self.pks, self.values = [], []
+        keys = []
+        postings = defaultdict(lambda: array("i"))
+        by_size = defaultdict(lambda: array("i"))
+
+        for pk, value in rows:
+            if not value:
+                continue
+
+            position = len(self.pks)
+            self.pks.append(pk)
+            self.values.append(value)
+
+            key = value.casefold()
+            keys.append((key, position))
+
+            value_trigrams = trigrams(key)
+            by_size[len(value_trigrams)].append(position)
+            for trigram in value_trigrams:
+                postings[trigram].append(position)
+
+        keys.sort()
+        self.keys = keys
+
+        self.rows = len(self.pks)
+        dense = self.rows * self.BITMAP_DENSITY
+        self.postings = {
+            trigram: self._to_bitmap(positions) if len(positions) >= dense else positions
+            for trigram, positions in postings.items()
+        }
+        self.bitmaps = LRUCache(self.CACHED_BITMAPS)
+        # trigram count -> bitmap of the rows having that many.
+        self.by_size = {size: self._to_bitmap(positions) for size, positions in by_size.items()}
+
+    def _to_bitmap(self, positions):
+        bits = bytearray((self.rows + 7) // 8)
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+
+        return int.from_bytes(bits, "little")
+
+    def _from_bitmap(self, bitmap):
+        data = bitmap.to_bytes((self.rows + 7) // 8, "little")
+        # scanning byte by byte is slow: only blocks having a row are.
+        for start in range(0, len(data), _BLOCK):
+            block = data[start:start + _BLOCK]
+            if block == _ZEROS:
+                continue
+
+            for match in _NONZERO.finditer(block):
+                offset = start + match.start()
+                for bit in _BYTE_BITS[data[offset]]:
+                    yield offset * 8 + bit
+
+    def bitmap(self, trigram):
+        posting = self.postings.get(trigram)
+        if posting is None or isinstance(posting, int):
+            return posting or 0
+
+        bitmap = self.bitmaps.get_many((trigram,)).get(trigram)
+        if bitmap is None:
+            bitmap = self._to_bitmap(posting)
+            self.bitmaps.set_many({trigram: bitmap})
+
+        return bitmap
+
+    def prefix(self, term, limit):
+        start = bisect_left(self.keys, (term,))
+
+        matches = []
+        for key, position in self.keys[start:start + limit]:
+            if not key.startswith(term):
+                break
+
+            matches.append((self.pks[position], self.values[position]))
+
+        return matches
+
+    def fuzzy(self, term, limit, threshold=SIMILARITY_THRESHOLD):
+        query = trigrams(term)
+        if not query:
+            return []
+
+        # bit i of every row's shared trigram count is in counts[i].
+        counts = []
+        for trigram in query:
+            carry, i = self.bitmap(trigram), 0
+            while carry:
+                if i == len(counts):
+                    counts.append(carry)
+                    break
+
+                counts[i], carry = counts[i] ^ carry, counts[i] & carry
+                i += 1
+
+        size, every = len(query), (1 << self.rows) - 1
+        # (similarity, shared trigrams, row trigrams), best first.
+        groups = sorted((
+            (shared / (size + row_size - shared), shared, row_size)
+            for shared in range(1, min(size, (1 << len(counts)) - 1) + 1)
+            for row_size in self.by_size if row_size >= shared
+        ), reverse=True)
+
+        levels = {}
+        found = []
+        for score, shared, row_size in groups:
+            if score < threshold or len(found) >= limit and score < found[-1][0]:
+                break
+
+            if shared not in levels:
+                level = every
+                for i, count in enumerate(counts):
+                    level &= count if shared >> i & 1 else every ^ count
+                levels[shared] = level
+
+            matching = levels[shared] & self.by_size[row_size]
+            if matching:
+                found += ((score, position) for position in self._from_bitmap(matching))
+
+        return [(self.pks[position], self.values[position]) for _, position in sorted(found, reverse=True)[:limit]]
+
+
+# (model label, field) -> (table version, index, 'time.monotonic()' its rows were read at).
+_indexes = {}
+# (model label, field) -> thread rebuilding its index.
+_rebuilding = {}
+_lock = threading.Lock()
+
+
+def get_index(model, field):
+    """
+        Returns this process' 'TrigramIndex' over 'model.field', and whether it's up to date with the
+        table.
+
+        Only the first one is built in the request. Once the table's version changed, the current index
+        keeps serving while a new one is built in the background ('_rebuild()') and swapped in: a write
+        doesn't hold every search up for a full rebuild. With a local cache backend, whose versions
+        don't see other processes' writes, an index older than 'SEARCH_INDEX_MAX_AGE' is out of date too.
+    """
+    version = get_versions((model,))[0]
+    key = (model._meta.label, field)
+
+    entry = _indexes.get(key)
+    if entry is None:
+        with _lock:
+            entry = _indexes.get(key)
+            if entry is None:
+                entry = _indexes[key] = _build(model, field, version)
+                return entry[1], True
+
+    current = entry[0] == version
+    if current and local_versions():
+        current = time.monotonic() - entry[2] < settings.SEARCH_INDEX_MAX_AGE
+
+    if not current:
+        with _lock:
+            thread = None
+            if key not in _rebuilding:
+                thread = _rebuilding[key] = threading.Thread(target=_rebuild, args=(key, model, field, version), daemon=True)
+
+        if thread is not None:
+            thread.start()
+
+    return entry[1], current
+
+
+def clear_indexes():
+    with _lock:
+        _indexes.clear()
+
+
+def _build(model, field, version):
+    built_at = time.monotonic()
+
+    return version, TrigramIndex(model.objects.values_list("id", field).iterator(chunk_size=10000)), built_at
+
+
+def _rebuild(key, model, field, version):
+    try:
+        entry = _build(model, field, version)
+        with _lock:
+            _indexes[key] = entry
+    except Exception:
+        # the current index keeps serving, and the next search tries again.
+        logger.exception("Rebuilding the search index of %s.%s failed", model.__name__, field)
+    finally:
+        with _lock:
+            _rebuilding.pop(key, None)
+
+        # the thread's own connection.
+        connection.close()
+
+
+def _postgres_prefix(model, field, term, limit):
+    # both served by the 'gin_trgm_ops' indexes on 'UPPER(col::text)' (migration 0003).
+    queryset = model.objects.annotate(search_key=Upper(Cast(field, TextField())))
+
+    return list(queryset.filter(search_key__startswith=term.upper()).order_by("search_key").values_list("id", field)[:limit])
+
+
+def _postgres_fuzzy(model, field, term, limit):
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    key = Upper(Cast(field, TextField()))
+    queryset = (
+        model.objects.annotate(search_key=key)
+        .filter(search_key__trigram_similar=term.upper())
+        .annotate(score=TrigramSimilarity(key, term.upper()))
+        .order_by("-score")
+    )
+
+    return list(queryset.values_list("id", field)[:limit])
+
+
+def search(query, types=None, limit=20):
+    """
+        Returns the best 'limit' matches of 'query' across the searchable resources.
+
+        Exact matches rank first, then prefix matches, then fuzzy (trigram) matches, each by similarity.
+        Every match is '{"type", "id", "field", "value", "match", "score"}', one per object.
+
+        Returns the matches, and whether they're up to date: False when an in-process index still
+        being rebuilt after a write answered ('get_index()').
+    """
+    term = " ".join(query.casefold().split())
+    if not term:
+        return [], True
+
+    searched = [(resource, field) for resource in types or SEARCH_FIELDS for field in SEARCH_FIELDS[resource][1]]
+
+    current = True
+    if connection.vendor == "postgresql":
+        def find_prefix(resource, field):
+            return _postgres_prefix(SEARCH_FIELDS[resource][0], field, term, limit)
+
+        def find_fuzzy(resource, field):
+            return _postgres_fuzzy(SEARCH_FIELDS[resource][0], field, term, limit)
+    else:
+        indexes = {}
+        for resource, field in searched:
+            indexes[resource, field], up_to_date = get_index(SEARCH_FIELDS[resource][0], field)
+            current = current and up_to_date
+
+        def find_prefix(resource, field):
+            return indexes[resource, field].prefix(term, limit)
+
+        def find_fuzzy(resource, field):
+            return indexes[resource, field].fuzzy(term, limit)
+
+    query_trigrams = trigrams(term)
+    best = {}
+
+    def collect(find):
+        for resource, field in searched:
+            for pk, value in find(resource, field):
+                key = value.casefold()
+                result = {
+                    "type": resource,
+                    "id": pk,
+                    "field": field,
+                    "value": value,
+                    "match": "exact" if key == term else "prefix" if key.startswith(term) else "fuzzy",
+                    "score": round(similarity(query_trigrams, trigrams(key)), 3),
+                }
+
+                if (resource, pk) not in best or _rank(result) < _rank(best[resource, pk]):
+                    best[resource, pk] = result
+
+    collect(find_prefix)
+    # fuzzy matches rank below every prefix match: once there are 'limit' of those, none would make it.
+    if len(best) < limit:
+        collect(find_fuzzy)
+
+    return sorted(best.values(), key=_rank)[:limit], current
+
+
+_MATCH_ORDER = {"exact": 0, "prefix": 1, "fuzzy": 2}
+
+
+def _rank(result):
+    return _MATCH_ORDER[result["match"]], -result["score"], len(result["value"]), result["type"], result["id"]
@@ -1,27 +1,229 @@
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
 
+from ..instrumentation import timed
 from ..models import League, Team, Player
+from ..signals import post_bulk_create, pre_bulk_update, post_bulk_update
 
 
-class LeagueSerializer(serializers.ModelSerializer):
+class QueryPlanMixin:
+    """
+        Lets a serializer declare which relations it touches, so views can load them up-front.
+
+        'Meta.related_fields' maps each relation to the related columns its representation reads,
+        the first one being the column behind the related model's '__str__'. 'setup_queryset()' turns
+        that into a single JOIN plus a trimmed column list, instead of one extra query per serialized row.
+
+        Read-only lists can skip model instances and per-field dispatch altogether: 'values_queryset()'
+        selects the needed columns as plain dicts (related names joined in SQL) and 'values_data()'
+        maps them to the exact output of the serializer.
+
+        Both paths take an optional sparse fieldset ('select_fields()'), trimming the output and the
+        selected columns alike.
+
+        'Meta.denormalized_fields' maps a relation to a column of the model's own table holding a copy
+        of the related name ('football.denormalize'): with 'DENORMALIZED_NAMES' on, the values path reads
+        that instead of joining the related table.
+    """
+
+    # plain fields whose representation is the database value itself.
+    VALUE_FIELDS = (serializers.IntegerField, serializers.CharField)
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # sparse fieldset: only the given fields are serialized.
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_output_fields(cls):
+        if "_output_fields" not in cls.__dict__:
+            cls._output_fields = tuple(cls().fields)
+
+        return cls._output_fields
+
+    @classmethod
+    def select_fields(cls, query_params):
+        """
+            Returns the fields requested with '?fields=' and/or '?exclude=' (comma separated), or None for all of them.
+
+            Unknown names are ignored, and the serializer's field order is kept.
+        """
+        fields, exclude = query_params.get("fields"), query_params.get("exclude")
+        if not fields and not exclude:
+            return None
+
+        names = cls.get_output_fields()
+        if fields:
+            requested = {name.strip() for name in fields.split(",")}
+            names = [name for name in names if name in requested]
+        if exclude:
+            excluded = {name.strip() for name in exclude.split(",")}
+            names = [name for name in names if name not in excluded]
+
+        return list(names)
+
+    @classmethod
+    def setup_queryset(cls, queryset, fields=None):
+        related_fields = {
+            relation: columns
+            for relation, columns in getattr(cls.Meta, "related_fields", {}).items()
+            if fields is None or relation in fields
+        }
+        if not related_fields and fields is None:
+            return queryset
+
+        own_fields = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if fields is None or field.name in fields
+        ]
+        related_columns = [
+            f"{relation}__{column}"
+            for relation, columns in related_fields.items()
+            for column in columns
+        ]
+
+        return queryset.select_related(*related_fields).only(*own_fields, *related_columns)
+
+    @classmethod
+    def get_values_plan(cls, fields=None):
+        """
+            Returns the (output key, column) pairs of the values path, or None if a field needs the serializer.
+        """
+        denormalized = settings.DENORMALIZED_NAMES
+
+        if "_values_plans" not in cls.__dict__:
+            cls._values_plans = {}
+
+        if denormalized not in cls._values_plans:
+            related_fields = getattr(cls.Meta, "related_fields", {})
+            denormalized_fields = getattr(cls.Meta, "denormalized_fields", {}) if denormalized else {}
+            plan = []
+
+            for name, field in cls().fields.items():
+                if type(field) in cls.VALUE_FIELDS:
+                    plan.append((name, field.source))
+                elif isinstance(field, serializers.StringRelatedField) and name in denormalized_fields:
+                    # single-table: the name is copied into this model's own table.
+                    plan.append((name, denormalized_fields[name]))
+                elif isinstance(field, serializers.StringRelatedField) and related_fields.get(name):
+                    plan.append((name, f"{name}__{related_fields[name][0]}"))
+                else:
+                    plan = None
+                    break
+
+            cls._values_plans[denormalized] = plan
+
+        plan = cls._values_plans[denormalized]
+        if plan is None or fields is None:
+            return plan
+
+        return [(key, column) for key, column in plan if key in fields]
+
+    @classmethod
+    def values_queryset(cls, queryset, fields=None):
+        plan = cls.get_values_plan(fields)
+        if plan is None:
+            return cls.setup_queryset(queryset, fields)
+
+        columns = [column for _, column in plan]
+        # the primary key is always selected: cursor pagination positions on it.
+        if "id" not in columns:
+            columns.append("id")
+
+        return queryset.values(*columns)
+
+    @classmethod
+    def values_data(cls, rows, fields=None):
+        """
+            Serializes rows of 'values_queryset()' (plain dicts, or model instances when there's no values path).
+        """
+        plan = cls.get_values_plan(fields)
+        if plan is None:
+            return cls(rows, many=True, fields=fields).data
+
+        with timed("serialize"):
+            return [{key: row[column] for key, column in plan} for row in rows]
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+        Saves 'many=True' serializers with a single 'bulk_create()' / 'bulk_update()' instead of one query per item.
+
+        Neither sends model signals, so the bulk signals of 'football.signals' are sent instead.
+    """
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        objs = model.objects.bulk_create(model(**attrs) for attrs in validated_data)
+        post_bulk_create.send(sender=model, objs=objs)
+
+        return objs
+
+    def update(self, instances, validated_data):
+        model = self.child.Meta.model
+        pre_bulk_update.send(sender=model, objs=instances)
+
+        updated_fields = set()
+        for instance, attrs in zip(instances, validated_data):
+            for attr, value in attrs.items():
+                setattr(instance, attr, value)
+
+            updated_fields.update(attrs)
+
+        if updated_fields:
+            # 'bulk_update()' skips 'auto_now'.
+            now = timezone.now()
+            for instance in instances:
+                instance.updated_at = now
+            updated_fields.add("updated_at")
+
+            model.objects.bulk_update(instances, updated_fields)
+
+        post_bulk_update.send(sender=model, objs=instances)
+
+        return instances
+
+
+class LeagueSerializer(QueryPlanMixin, serializers.ModelSerializer):
     class Meta:
         model = League
-        fields = "__all__"
+        exclude = ("updated_at",)
+        list_serializer_class = BulkListSerializer
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(QueryPlanMixin, serializers.ModelSerializer):
     league = serializers.StringRelatedField()
 
     class Meta:
-        model = Team 
-        fields = "__all__"
+        model = Team
+        exclude = ("league_name", "updated_at")
+        list_serializer_class = BulkListSerializer
+        related_fields = {"league": ("name",)}
+        denormalized_fields = {"league": "league_name"}
 
 
-class PlayerSerializer(serializers.ModelSerializer):
+class PlayerSerializer(QueryPlanMixin, serializers.ModelSerializer):
     # team = TeamSerializer(read_only=True) --> serializes nested objects.
     team = serializers.StringRelatedField()
 
     class Meta:
         model = Player
-        fields = "__all__"
-
+        exclude = ("team_name", "updated_at")
+        list_serializer_class = BulkListSerializer
+        related_fields = {"team": ("name",)}
+        denormalized_fields = {"team": "team_name"}
@@ -0,0 +1,51 @@
+from itertools import islice
+
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+
+from .renderers import dumps
+
+
+# rows fetched per database round trip (and serialized per batch) while streaming.
+STREAM_CHUNK_SIZE = 2000
+
+# '?stream=' values turning streaming on ('?stream=0' / '?stream=false' don't).
+STREAM_TRUE_VALUES = ("1", "true", "yes")
+
+
+def wants_stream(request):
+    """
+        Whether a list is streamed: '?stream=1' on a WSGI request.
+
+        Django 4.0 iterates a streaming response on the event loop under ASGI, where the rows'
+        queryset raises 'SynchronousOnlyOperation' after the first bytes went out: ASGI requests get
+        the same array in one piece instead.
+    """
+    if isinstance(request._request, ASGIRequest):
+        return False
+
+    return request.query_params.get("stream", "").strip().lower() in STREAM_TRUE_VALUES
+
+
+def stream_queryset(queryset, serializer_class, fields=None, chunk_size=STREAM_CHUNK_SIZE):
+    """
+        Streams a queryset as a JSON array.
+
+        Rows of 'serializer_class.values_queryset()' are pulled with a server-side cursor ('.iterator()')
+        and serialized 'chunk_size' at a time, so memory stays flat regardless of the table size and
+        the first bytes go out as soon as the first chunk is ready.
+    """
+    content = _json_array(queryset.iterator(chunk_size=chunk_size), serializer_class, fields, chunk_size)
+
+    return StreamingHttpResponse(content, content_type="application/json")
+
+
+def _json_array(rows, serializer_class, fields, chunk_size):
+    yield b"["
+
+    separator = b""
+    while chunk := list(islice(rows, chunk_size)):
+        yield separator + b",".join(dumps(item) for item in serializer_class.values_data(chunk, fields))
+        separator = b","
+
+    yield b"]"
@@ -1,18 +1,35 @@
 from django.urls import path
 
-from .views import league, team, player
+from .views import league, team, player, search, stats, changes
+from .views.asynchronous import api_view
 
 
 urlpatterns = [
     # leagues
-    path("leagues/", league.LeagueListCreateView.as_view(), name="league-list-create"),
-    path("leagues/<int:pk>", league.LeagueRetrieveUpdateDestroyView.as_view(), name="league-retrieve-update-destroy"),
+    path("leagues/", api_view(league.LeagueListCreateView), name="league-list-create"),
+    path("leagues/<int:pk>", api_view(league.LeagueRetrieveUpdateDestroyView), name="league-retrieve-update-destroy"),
+    path("leagues/batch/", api_view(league.LeagueBatchView), name="league-batch"),
     
     # teams
-    path("teams/", team.TeamListCreateView.as_view(), name="team-list-create"),
-    path("teams/<int:pk>", team.TeamRetrieveUpdateDestroyView.as_view(), name="team-retrieve-update-destroy"),
+    path("teams/", api_view(team.TeamListCreateView), name="team-list-create"),
+    path("teams/<int:pk>", api_view(team.TeamRetrieveUpdateDestroyView), name="team-retrieve-update-destroy"),
+    path("teams/batch/", api_view(team.TeamBatchView), name="team-batch"),
 
     # players
-    path("players/", player.PlayerListCreateView.as_view(), name="player-list-create"),
-    path("players/<int:pk>", player.PlayerRetrieveUpdateDestroyView.as_view(), name="player-retrieve-update-destroy"),
+    path("players/", api_view(player.PlayerListCreateView), name="player-list-create"),
+    path("players/<int:pk>", api_view(player.PlayerRetrieveUpdateDestroyView), name="player-retrieve-update-destroy"),
+    path("players/batch/", api_view(player.PlayerBatchView), name="player-batch"),
+
+    # search
+    path("search/", api_view(search.SearchView), name="search"),
+
+    # change feed
+    path("changes/", api_view(changes.ChangesView), name="changes"),
+
+    # statistics
+    path("stats/", api_view(stats.StatsView), name="stats"),
+    path("stats/teams/", api_view(stats.TeamStatsListView), name="team-stats-list"),
+    path("stats/teams/<int:pk>", api_view(stats.TeamStatsRetrieveView), name="team-stats-retrieve"),
+    path("stats/leagues/", api_view(stats.LeagueStatsListView), name="league-stats-list"),
+    path("stats/positions/", api_view(stats.PositionStatsListView), name="position-stats-list"),
 ]
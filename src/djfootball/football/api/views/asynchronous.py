@@ -0,0 +1,59 @@
+from functools import update_wrapper
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from ..cache import aget_versions, aget_cached, get_validators, not_modified, set_validators, cached_response
+
+
+def async_api_view(view_class):
+    """
+        Returns an ASGI-native view function in front of one of the API's views.
+
+        GET requests are revalidated ('304 Not Modified') and answered from the response cache on the
+        event loop, so with the local memory cache the bulk of the read traffic never needs a thread.
+        Everything else (cache misses and writes) is handed to the wrapped view in a thread, which is
+        what Django does for any sync view under ASGI.
+
+        Django 4.0 has no async ORM (the 'aget()'/'acount()' queryset methods of later releases are
+        themselves thread hops), so database work stays in the wrapped view rather than being duplicated here.
+    """
+    sync_view = sync_to_async(view_class.as_view())
+    # views without a response cache (e.g. the POST-only batch views) are always handed over.
+    has_cache = hasattr(view_class, "get_cache_models")
+
+    async def view(request, *args, **kwargs):
+        if request.method != "GET" or not has_cache:
+            return await sync_view(request, *args, **kwargs)
+
+        models = view_class().get_cache_models(request)
+        key, etag = get_validators(request, await aget_versions(models))
+
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+
+        if settings.RESPONSE_CACHE_TIMEOUT:
+            cached = await aget_cached(key)
+            if cached is not None:
+                return set_validators(cached_response(cached), etag)
+
+        return await sync_view(request, *args, **kwargs)
+
+    update_wrapper(view, view_class, updated=())
+    # schema generation (drf-spectacular) introspects the APIView behind each route.
+    view.cls, view.initkwargs = view_class, {}
+    # like 'APIView.as_view()': the API doesn't rely on CSRF cookies.
+    view.csrf_exempt = True
+
+    return view
+
+
+def api_view(view_class):
+    """
+        Returns the view function serving 'view_class': async when running the ASGI application.
+    """
+    if settings.ASYNC_API_VIEWS:
+        return async_api_view(view_class)
+
+    return view_class.as_view()
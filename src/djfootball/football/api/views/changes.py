@@ -0,0 +1,51 @@
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+
+from ..changes import RESOURCES, PER_PAGE, MAX_PER_PAGE, InvalidToken, changes, decode_token, expired
+from ..renderers import JsonResponse
+
+
+class ChangesView(APIView):
+    """
+        get:
+        Returns the Leagues, Teams or Players inserted, updated or deleted since a token of a previous response.
+    """
+    # no response cache: the same token sees more changes as time passes.
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("resource", OpenApiTypes.STR, OpenApiParameter.QUERY, required=True, enum=list(RESOURCES)),
+            OpenApiParameter("since", OpenApiTypes.STR, OpenApiParameter.QUERY, description="The 'next' token of the previous response; omitted, from the beginning."),
+            OpenApiParameter("per_page", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+        ],
+        description=(
+            "Returns the changes of a resource since 'since', oldest first: 'upsert' (an insert or an update, with the "
+            "row's current 'data') or 'delete'. Keep the 'next' token and ask from it next time; 'has_more' means "
+            "another page is ready right away. '410 Gone': the token is older than the deletes kept, sync everything again."
+        ),
+    )
+    def get(self, request):
+        resource = request.query_params.get("resource")
+        if resource not in RESOURCES:
+            return JsonResponse({"resource": [f"One of: {', '.join(RESOURCES)}."]}, status=400)
+
+        since = None
+        if request.query_params.get("since"):
+            try:
+                since = decode_token(request.query_params["since"])
+            except InvalidToken:
+                return JsonResponse({"since": ["Invalid token."]}, status=400)
+
+            if expired(since):
+                return JsonResponse({"since": ["Token expired, sync everything again."]}, status=410)
+
+        try:
+            per_page = min(int(request.query_params.get("per_page", PER_PAGE)), MAX_PER_PAGE)
+        except ValueError:
+            return JsonResponse({"per_page": ["A valid integer is required."]}, status=400)
+
+        serializer = RESOURCES[resource][1]
+        return JsonResponse(changes(resource, since, max(per_page, 1), serializer.select_fields(request.query_params)))
@@ -1,4 +1,3 @@
-from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.generics import get_object_or_404
@@ -6,66 +5,108 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from ...models import League, Player
+from ...models import League, Team, Player
+from ..filters import LeagueFilter
+from ..bulk import bulk_create, bulk_update, bulk_delete, bulk_fetch
+from ..cache import CachedResponseMixin
+from ..expand import parse_expand, expand_queryset, expand_data
 from ..serializers import LeagueSerializer
-from ..paginators import SingleSetPagination
+from ..paginators import cursor_with_ordering, get_paginator
+from ..player_leagues import player_leagues
+from ..renderers import JsonResponse
+from ..streaming import stream_queryset, wants_stream
 
 
-class LeagueListCreateView(APIView):
+class LeagueListCreateView(CachedResponseMixin, APIView):
     """
         get:
         Returns a list of all existing Leagues.
-        If query parameter 'player_name' is provided, we return the respective player's League.
+        If query parameter 'ids' is provided, we return those Leagues only.
+        If query parameter 'player_name' is provided (repeatable), we return the Leagues of the players with those names.
+        Possibility to filter leagues: ('country', 'number_of_teams_min', 'number_of_teams_max')
+        and to order them: ('ordering', e.g. '-number_of_teams')
 
         post:
-        Creates a new League instance.
+        Creates a new League instance, or several at once if the body is a list.
+
+        patch:
+        Partially updates several Leagues at once, each identified by its 'id'.
+
+        delete:
+        Deletes the Leagues listed in query parameter 'ids'.
     """
+    cache_models = (League,)
+
+    def get_cache_models(self, request):
+        # the 'player_name' lookup goes through the Player and Team tables as well.
+        if any(name.strip() for name in request.GET.getlist("player_name")):
+            return (League, Player, Team)
+
+        return self.cache_models
 
     @extend_schema(
         parameters=[
             OpenApiParameter("page", OpenApiTypes.INT, OpenApiParameter.QUERY),
             OpenApiParameter("per_page", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("cursor", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("stream", OpenApiTypes.BOOL, OpenApiParameter.QUERY),
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("ids", OpenApiTypes.STR, OpenApiParameter.QUERY, description="e.g. '1,2,3'"),
             
-            OpenApiParameter("player_name", OpenApiTypes.STR, OpenApiParameter.QUERY)
+            OpenApiParameter("player_name", {"type": "array", "items": {"type": "string"}}, OpenApiParameter.QUERY, explode=True, description="Repeatable, e.g. '?player_name=Pepe&player_name=Otávio'"),
+
+            OpenApiParameter("country", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("number_of_teams_min", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("number_of_teams_max", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("ordering", OpenApiTypes.STR, OpenApiParameter.QUERY, enum=["name", "-name", "number_of_teams", "-number_of_teams"])
         ],
-        description="Returns a list of all existing Leagues. If query parameter 'player_name' is provided, we return the respective player's League.",
+        description=(
+            "Returns a list of all existing Leagues. If query parameter 'player_name' is provided, we return the Leagues of "
+            "the players with those names (by id), and the names matching no player ('missing') or only players without a League ('no_league')."
+        ),
         responses=LeagueSerializer
     )
     def get(self, request):
         # default empty response.
         res = JsonResponse({}, safe=False)
 
-        player_name = request.query_params.get("player_name")
-        if player_name:
-            try:
-                # INNER JOIN with 'Team' and 'League' tables.
-                player = Player.objects.select_related("team__league").get(name__iexact=player_name)
-                
-                league = player.team.league
-                league_serializer = LeagueSerializer(league)
-                
-                res = JsonResponse(league_serializer.data, safe=False) 
-            except Player.DoesNotExist:
-                pass
+        fields = LeagueSerializer.select_fields(request.query_params)
+
+        if "ids" in request.query_params:
+            return bulk_fetch(LeagueSerializer, League.objects.all(), request.query_params["ids"], fields)
+
+        if cursor_with_ordering(request):
+            return JsonResponse({"ordering": ["Not supported with 'cursor': cursor pages are in id order."]}, status=400)
+
+        player_names = request.query_params.getlist("player_name")
+        if any(name.strip() for name in player_names):
+            res = player_leagues(player_names, fields)
         else:
-            leagues_queryset = League.objects.all().order_by("id")
+            leagues_queryset = LeagueSerializer.values_queryset(League.objects.all(), fields).order_by("id")
 
-            if request.query_params.get("page"):
-                paginator = SingleSetPagination()
+            filterset = LeagueFilter(request.GET, queryset=leagues_queryset)
+            if not filterset.is_valid():
+                return JsonResponse(filterset.errors, status=400)
 
-                paginated_queryset = paginator.paginate_queryset(leagues_queryset, request)
-                leagues_serializer = LeagueSerializer(paginated_queryset, many=True)
+            leagues_queryset = filterset.qs
 
-                res = paginator.get_paginated_response(leagues_serializer.data)
+            paginator = get_paginator(request)
+            if paginator:
+                page = paginator.paginate_queryset(leagues_queryset, request)
+                res = paginator.get_paginated_response(LeagueSerializer.values_data(page, fields))
+            elif wants_stream(request):
+                res = stream_queryset(leagues_queryset, LeagueSerializer, fields)
             else:
-                leagues_serializer = LeagueSerializer(leagues_queryset, many=True)
-                
-                res = JsonResponse(leagues_serializer.data, safe=False)
+                res = JsonResponse(LeagueSerializer.values_data(leagues_queryset, fields), safe=False)
         
         return res
 
-    @extend_schema(description="Creates a new League instance.", request=LeagueSerializer, responses=LeagueSerializer)
+    @extend_schema(description="Creates a new League instance, or several at once if the body is a list.", request=LeagueSerializer, responses=LeagueSerializer)
     def post(self, request):
+        if isinstance(request.data, list):
+            return bulk_create(LeagueSerializer, request.data)
+
         # default empty response.
         res = JsonResponse({}, safe=False)
         
@@ -79,11 +120,46 @@ class LeagueListCreateView(APIView):
 
         return res
 
+    @extend_schema(description="Partially updates several Leagues at once, each identified by its 'id'.", request=LeagueSerializer(many=True), responses=LeagueSerializer(many=True))
+    def patch(self, request):
+        queryset = LeagueSerializer.setup_queryset(League.objects.all())
+
+        return bulk_update(LeagueSerializer, queryset, request.data)
+
+    @extend_schema(
+        parameters=[OpenApiParameter("ids", OpenApiTypes.STR, OpenApiParameter.QUERY, required=True)],
+        description="Deletes the Leagues listed in query parameter 'ids' (e.g. '1,2,3').",
+        request=None,
+    )
+    def delete(self, request):
+        return bulk_delete(League.objects.all(), request.query_params.get("ids"))
+
+
+class LeagueBatchView(APIView):
+    """
+        post:
+        Returns the Leagues listed in the body's 'ids', like 'GET ?ids=' for lists too long for a URL.
+    """
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+        ],
+        description="Returns the Leagues listed in the body's 'ids' (e.g. {\"ids\": [1, 2, 3]}), in that order, and the ids not found.",
+        request=None,
+    )
+    def post(self, request):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+
+        return bulk_fetch(LeagueSerializer, League.objects.all(), ids, LeagueSerializer.select_fields(request.query_params))
 
-class LeagueRetrieveUpdateDestroyView(APIView):
+
+class LeagueRetrieveUpdateDestroyView(CachedResponseMixin, APIView):
     """
         get:
         Retrieves a given League.
+        Possibility to include nested collections: ('expand', any of 'teams', 'teams.players')
 
         put:
         Updates a given League.
@@ -94,20 +170,45 @@ class LeagueRetrieveUpdateDestroyView(APIView):
         delete:
         Deletes a given League.
     """
+    cache_models = (League,)
+
+    def get_cache_models(self, request):
+        # expanded collections are read from the tables below as well.
+        if request.GET.get("expand"):
+            return (League, Team, Player)
 
-    @extend_schema(description="Retrieves a given League.", request=LeagueSerializer, responses=LeagueSerializer)
+        return self.cache_models
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("expand", OpenApiTypes.STR, OpenApiParameter.QUERY, description="e.g. 'teams,teams.players'"),
+        ],
+        description="Retrieves a given League.",
+        request=LeagueSerializer,
+        responses=LeagueSerializer
+    )
     def get(self, request, pk):
-        league = get_object_or_404(League.objects.all(), pk=pk)
-        league_serializer = LeagueSerializer(league)
+        fields = LeagueSerializer.select_fields(request.query_params)
+
+        try:
+            expand = parse_expand(League, request.query_params.get("expand"))
+        except ValueError as exc:
+            return JsonResponse({"expand": [str(exc)]}, status=400)
+
+        league_queryset = expand_queryset(LeagueSerializer.setup_queryset(League.objects.all(), fields), expand)
+        league = get_object_or_404(league_queryset, pk=pk)
+        league_serializer = LeagueSerializer(league, fields=fields)
 
-        return JsonResponse(league_serializer.data, safe=False)
+        return JsonResponse(expand_data(league_serializer.data, league, expand), safe=False)
 
     @extend_schema(description="Updates a given League.", request=LeagueSerializer, responses=LeagueSerializer)
     def put(self, request, pk):
         # default empty response.
         res = JsonResponse({}, safe=False)
         
-        stored_league = get_object_or_404(League.objects.all(), pk=pk)
+        stored_league = get_object_or_404(LeagueSerializer.setup_queryset(League.objects.all()), pk=pk)
         updated_league = request.data
         
         league_serializer = LeagueSerializer(stored_league, data=updated_league)
@@ -124,7 +225,7 @@ class LeagueRetrieveUpdateDestroyView(APIView):
         # default empty response.
         res = JsonResponse({}, safe=False)
         
-        stored_league = get_object_or_404(League.objects.all(), pk=pk)
+        stored_league = get_object_or_404(LeagueSerializer.setup_queryset(League.objects.all()), pk=pk)
         updated_league = request.data
         
         league_serializer = LeagueSerializer(stored_league, data=updated_league, partial=True)
@@ -1,4 +1,3 @@
-from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.generics import get_object_or_404
@@ -6,24 +5,53 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from ...models import Player
+from ...models import Team, Player
+from ..filters import PlayerFilter
+from ..bulk import bulk_create, bulk_update, bulk_delete, bulk_fetch
+from ..cache import CachedResponseMixin
 from ..serializers import PlayerSerializer
-from ..paginators import SingleSetPagination
+from ..paginators import cursor_with_ordering, get_paginator
+from ..renderers import JsonResponse
+from ..streaming import stream_queryset, wants_stream
 
 
-class PlayerListCreateView(APIView):
+class PlayerListCreateView(CachedResponseMixin, APIView):
     """
         get:
         Returns a list of all existing Players.
+        If query parameter 'ids' is provided, we return those Players only.
+        Possibility to filter players: ('age_min', 'age_max', 'appearances_min', 'appearances_max', 'position', 'team', 'league')
+        and to order them: ('ordering', e.g. '-appearances,name')
 
         post:
-        Creates a new Player instance.
+        Creates a new Player instance, or several at once if the body is a list.
+
+        patch:
+        Partially updates several Players at once, each identified by its 'id'.
+
+        delete:
+        Deletes the Players listed in query parameter 'ids'.
     """
+    cache_models = (Player, Team)
 
     @extend_schema(
         parameters=[
             OpenApiParameter("page", OpenApiTypes.INT, OpenApiParameter.QUERY),
             OpenApiParameter("per_page", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("cursor", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("stream", OpenApiTypes.BOOL, OpenApiParameter.QUERY),
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("ids", OpenApiTypes.STR, OpenApiParameter.QUERY, description="e.g. '1,2,3'"),
+
+            OpenApiParameter("age_min", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("age_max", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("appearances_min", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("appearances_max", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("position", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("team", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("league", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("ordering", OpenApiTypes.STR, OpenApiParameter.QUERY, enum=["name", "-name", "age", "-age", "appearances", "-appearances"]),
         ],
         description="Returns a list of all existing Players.",
         responses=PlayerSerializer
@@ -32,23 +60,38 @@ class PlayerListCreateView(APIView):
         # default empty response.
         res = JsonResponse({}, safe=False)
 
-        players_queryset = Player.objects.all().order_by("id")
-        if request.query_params.get("page"):
-            paginator = SingleSetPagination()
+        fields = PlayerSerializer.select_fields(request.query_params)
 
-            paginated_queryset = paginator.paginate_queryset(players_queryset, request)
-            players_serializer = PlayerSerializer(paginated_queryset, many=True)
+        if "ids" in request.query_params:
+            return bulk_fetch(PlayerSerializer, Player.objects.all(), request.query_params["ids"], fields)
 
-            res = paginator.get_paginated_response(players_serializer.data)
-        else:
-            players_serializer = PlayerSerializer(players_queryset, many=True)
+        if cursor_with_ordering(request):
+            return JsonResponse({"ordering": ["Not supported with 'cursor': cursor pages are in id order."]}, status=400)
 
-            res = JsonResponse(players_serializer.data, safe=False)
+        players_queryset = PlayerSerializer.values_queryset(Player.objects.all(), fields).order_by("id")
+
+        filterset = PlayerFilter(request.GET, queryset=players_queryset)
+        if not filterset.is_valid():
+            return JsonResponse(filterset.errors, status=400)
+
+        players_queryset = filterset.qs
+
+        paginator = get_paginator(request)
+        if paginator:
+            page = paginator.paginate_queryset(players_queryset, request)
+            res = paginator.get_paginated_response(PlayerSerializer.values_data(page, fields))
+        elif wants_stream(request):
+            res = stream_queryset(players_queryset, PlayerSerializer, fields)
+        else:
+            res = JsonResponse(PlayerSerializer.values_data(players_queryset, fields), safe=False)
         
         return res
 
-    @extend_schema(description="Creates a new Player instance.", request=PlayerSerializer, responses=PlayerSerializer)
+    @extend_schema(description="Creates a new Player instance, or several at once if the body is a list.", request=PlayerSerializer, responses=PlayerSerializer)
     def post(self, request):
+        if isinstance(request.data, list):
+            return bulk_create(PlayerSerializer, request.data)
+
         # default empty response.
         res = JsonResponse({}, safe=False)
         
@@ -62,8 +105,42 @@ class PlayerListCreateView(APIView):
 
         return res
 
+    @extend_schema(description="Partially updates several Players at once, each identified by its 'id'.", request=PlayerSerializer(many=True), responses=PlayerSerializer(many=True))
+    def patch(self, request):
+        queryset = PlayerSerializer.setup_queryset(Player.objects.all())
+
+        return bulk_update(PlayerSerializer, queryset, request.data)
+
+    @extend_schema(
+        parameters=[OpenApiParameter("ids", OpenApiTypes.STR, OpenApiParameter.QUERY, required=True)],
+        description="Deletes the Players listed in query parameter 'ids' (e.g. '1,2,3').",
+        request=None,
+    )
+    def delete(self, request):
+        return bulk_delete(Player.objects.all(), request.query_params.get("ids"))
+
+
+class PlayerBatchView(APIView):
+    """
+        post:
+        Returns the Players listed in the body's 'ids', like 'GET ?ids=' for lists too long for a URL.
+    """
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+        ],
+        description="Returns the Players listed in the body's 'ids' (e.g. {\"ids\": [1, 2, 3]}), in that order, and the ids not found.",
+        request=None,
+    )
+    def post(self, request):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+
+        return bulk_fetch(PlayerSerializer, Player.objects.all(), ids, PlayerSerializer.select_fields(request.query_params))
 
-class PlayerRetrieveUpdateDestroyView(APIView):
+
+class PlayerRetrieveUpdateDestroyView(CachedResponseMixin, APIView):
     """
         get:
         Retrieves a given Player.
@@ -77,11 +154,22 @@ class PlayerRetrieveUpdateDestroyView(APIView):
         delete:
         Deletes a given Player.
     """
+    cache_models = (Player, Team)
 
-    @extend_schema(description="Retrieves a given Player.", request=PlayerSerializer, responses=PlayerSerializer)
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+        ],
+        description="Retrieves a given Player.",
+        request=PlayerSerializer,
+        responses=PlayerSerializer
+    )
     def get(self, request, pk):
-        player = get_object_or_404(Player.objects.all(), pk=pk)
-        player_serializer = PlayerSerializer(player)
+        fields = PlayerSerializer.select_fields(request.query_params)
+
+        player = get_object_or_404(PlayerSerializer.setup_queryset(Player.objects.all(), fields), pk=pk)
+        player_serializer = PlayerSerializer(player, fields=fields)
 
         return JsonResponse(player_serializer.data, safe=False)
 
@@ -90,7 +178,7 @@ class PlayerRetrieveUpdateDestroyView(APIView):
         # default empty response.
         res = JsonResponse({}, safe=False)
         
-        stored_player = get_object_or_404(Player.objects.all(), pk=pk)
+        stored_player = get_object_or_404(PlayerSerializer.setup_queryset(Player.objects.all()), pk=pk)
         updated_player = request.data
         
         player_serializer = PlayerSerializer(stored_player, data=updated_player)
@@ -107,7 +195,7 @@ class PlayerRetrieveUpdateDestroyView(APIView):
         # default empty response.
         res = JsonResponse({}, safe=False)
         
-        stored_player = get_object_or_404(Player.objects.all(), pk=pk)
+        stored_player = get_object_or_404(PlayerSerializer.setup_queryset(Player.objects.all()), pk=pk)
         updated_player = request.data
         
         player_serializer = PlayerSerializer(stored_player, data=updated_player, partial=True)
@@ -0,0 +1,56 @@
+from django.utils.cache import patch_cache_control
+from rest_framework.views import APIView
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+
+from ...models import League, Team, Player
+from ..cache import CachedResponseMixin
+from ..renderers import JsonResponse
+from ..search import SEARCH_FIELDS, search
+
+
+# default and maximum number of results.
+SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+
+class SearchView(CachedResponseMixin, APIView):
+    """
+        get:
+        Searches Players (name), Teams (name, coach) and Leagues (name) by prefix or similarity.
+    """
+    cache_models = (Player, Team, League)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("q", OpenApiTypes.STR, OpenApiParameter.QUERY, required=True),
+            OpenApiParameter("types", OpenApiTypes.STR, OpenApiParameter.QUERY, description="e.g. 'player,team'"),
+            OpenApiParameter("limit", OpenApiTypes.INT, OpenApiParameter.QUERY),
+        ],
+        description="Searches Players (name), Teams (name, coach) and Leagues (name), best matches first: exact, prefix, then fuzzy.",
+    )
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return JsonResponse({"q": ["This query parameter is required."]}, status=400)
+
+        types = None
+        if request.query_params.get("types"):
+            types = [name.strip() for name in request.query_params["types"].split(",")]
+            unknown = [name for name in types if name not in SEARCH_FIELDS]
+            if unknown:
+                return JsonResponse({"types": [f"Unknown type '{name}'." for name in unknown]}, status=400)
+
+        try:
+            limit = min(int(request.query_params.get("limit", SEARCH_LIMIT)), MAX_SEARCH_LIMIT)
+        except ValueError:
+            return JsonResponse({"limit": ["A valid integer is required."]}, status=400)
+
+        results, current = search(query, types, max(limit, 1))
+
+        response = JsonResponse({"results": results})
+        if not current:
+            # an index being rebuilt answered: neither cached, nor given an ETag.
+            patch_cache_control(response, no_store=True)
+
+        return response
@@ -0,0 +1,154 @@
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+from rest_framework.views import APIView
+from rest_framework.generics import get_object_or_404
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.types import OpenApiTypes
+
+from ...models import League, Team, Player, PlayerStats
+from ..cache import CachedResponseMixin
+from ..renderers import JsonResponse
+
+
+def _totals(prefix=""):
+    # sums of the 'PlayerStats' counters, reached through 'prefix' (e.g. 'player_stats__').
+    return {
+        field: Coalesce(Sum(f"{prefix}{field}"), 0)
+        for field in ("players", "total_age", "total_appearances")
+    }
+
+
+def _summary(row):
+    players = row["players"]
+
+    return {
+        "players": players,
+        "average_age": round(row["total_age"] / players, 2) if players else None,
+        "total_appearances": row["total_appearances"],
+        "average_appearances": round(row["total_appearances"] / players, 2) if players else None,
+    }
+
+
+def _position_rows(queryset):
+    rows = queryset.order_by("position").values("position").annotate(**_totals())
+
+    return [{"position": row["position"], **_summary(row)} for row in rows]
+
+
+class StatsView(CachedResponseMixin, APIView):
+    """
+        get:
+        Returns statistics over all Players.
+    """
+    # a Team's deletion moves its players' statistics to 'team=None' without a Player signal.
+    cache_models = (Player, Team)
+
+    @extend_schema(description="Returns statistics over all Players (players without a team included).")
+    def get(self, request):
+        totals = PlayerStats.objects.aggregate(**_totals())
+        without_team = PlayerStats.objects.filter(team=None).aggregate(**_totals())
+
+        return JsonResponse({**_summary(totals), "players_without_team": without_team["players"]})
+
+
+class TeamStatsListView(CachedResponseMixin, APIView):
+    """
+        get:
+        Returns the Player statistics of every Team.
+    """
+    cache_models = (Player, Team, League)
+
+    @extend_schema(description="Returns the Player statistics of every Team. 'declared_players' is the Team's own 'number_of_players'.")
+    def get(self, request):
+        rows = (
+            Team.objects.annotate(**_totals("player_stats__"))
+            .values("id", "name", "league__name", "number_of_players", "players", "total_age", "total_appearances")
+            .order_by("id")
+        )
+
+        return JsonResponse([_team_stats(row) for row in rows], safe=False)
+
+
+class TeamStatsRetrieveView(CachedResponseMixin, APIView):
+    """
+        get:
+        Returns the Player statistics of a given Team, by position.
+    """
+    cache_models = (Player, Team, League)
+
+    @extend_schema(description="Returns the Player statistics of a given Team, by position.")
+    def get(self, request, pk):
+        queryset = Team.objects.annotate(**_totals("player_stats__")).values(
+            "id", "name", "league__name", "number_of_players", "players", "total_age", "total_appearances"
+        )
+        row = get_object_or_404(queryset, pk=pk)
+
+        return JsonResponse({**_team_stats(row), "positions": _position_rows(PlayerStats.objects.filter(team_id=pk))})
+
+
+def _team_stats(row):
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "league": row["league__name"],
+        "declared_players": row["number_of_players"],
+        **_summary(row),
+    }
+
+
+class LeagueStatsListView(CachedResponseMixin, APIView):
+    """
+        get:
+        Returns the Player statistics of every League.
+    """
+    cache_models = (Player, Team, League)
+
+    @extend_schema(description="Returns the Player statistics of every League, over the players of its teams.")
+    def get(self, request):
+        rows = (
+            League.objects.annotate(teams=Count("team", distinct=True), **_totals("team__player_stats__"))
+            .values("id", "name", "country", "teams", "players", "total_age", "total_appearances")
+            .order_by("id")
+        )
+
+        data = [
+            {"id": row["id"], "name": row["name"], "country": row["country"], "teams": row["teams"], **_summary(row)}
+            for row in rows
+        ]
+
+        return JsonResponse(data, safe=False)
+
+
+class PositionStatsListView(CachedResponseMixin, APIView):
+    """
+        get:
+        Returns the Player statistics by position, optionally of one Team or League.
+    """
+    cache_models = (Player, Team)
+
+    def get_cache_models(self, request):
+        # a League's deletion takes its teams out of it without a Team signal.
+        if request.GET.get("league"):
+            return (Player, Team, League)
+
+        return self.cache_models
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("team", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("league", OpenApiTypes.INT, OpenApiParameter.QUERY),
+        ],
+        description="Returns the Player statistics by position, optionally of one Team or League.",
+    )
+    def get(self, request):
+        queryset = PlayerStats.objects.all()
+
+        try:
+            if request.query_params.get("team"):
+                queryset = queryset.filter(team_id=int(request.query_params["team"]))
+            if request.query_params.get("league"):
+                queryset = queryset.filter(team__league_id=int(request.query_params["league"]))
+        except ValueError:
+            return JsonResponse({"non_field_errors": ["'team' and 'league' must be integers."]}, status=400)
+
+        return JsonResponse(_position_rows(queryset), safe=False)
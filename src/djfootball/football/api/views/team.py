@@ -1,4 +1,3 @@
-from django.http import JsonResponse
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.generics import get_object_or_404
@@ -6,26 +5,44 @@ from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
-from ...models import Team
+from ...models import League, Team, Player
 from ..filters import TeamFilter
+from ..bulk import bulk_create, bulk_update, bulk_delete, bulk_fetch
+from ..cache import CachedResponseMixin
+from ..expand import parse_expand, expand_queryset, expand_data
 from ..serializers import TeamSerializer
-from ..paginators import SingleSetPagination
+from ..paginators import get_paginator
+from ..renderers import JsonResponse
+from ..streaming import stream_queryset, wants_stream
 
 
-class TeamListCreateView(APIView):
+class TeamListCreateView(CachedResponseMixin, APIView):
     """
         get:
         Returns a list of all existing Teams.
+        If query parameter 'ids' is provided, we return those Teams only.
         Possibility to filter teams: ('name', 'city', 'championships_won', 'coach', 'number_of_players')
 
         post:
-        Creates a new Team instance.
+        Creates a new Team instance, or several at once if the body is a list.
+
+        patch:
+        Partially updates several Teams at once, each identified by its 'id'.
+
+        delete:
+        Deletes the Teams listed in query parameter 'ids'.
     """
+    cache_models = (Team, League)
 
     @extend_schema(
         parameters=[
             OpenApiParameter("page", OpenApiTypes.INT, OpenApiParameter.QUERY),
             OpenApiParameter("per_page", OpenApiTypes.INT, OpenApiParameter.QUERY),
+            OpenApiParameter("cursor", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("stream", OpenApiTypes.BOOL, OpenApiParameter.QUERY),
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("ids", OpenApiTypes.STR, OpenApiParameter.QUERY, description="e.g. '1,2,3'"),
             
             OpenApiParameter("name", OpenApiTypes.STR, OpenApiParameter.QUERY),
             OpenApiParameter("city", OpenApiTypes.STR, OpenApiParameter.QUERY),
@@ -40,28 +57,33 @@ class TeamListCreateView(APIView):
         # default empty response.
         res = JsonResponse({}, safe=False)
 
-        teams_queryset = Team.objects.all().order_by("id")
+        fields = TeamSerializer.select_fields(request.query_params)
+
+        if "ids" in request.query_params:
+            return bulk_fetch(TeamSerializer, Team.objects.all(), request.query_params["ids"], fields)
+
+        teams_queryset = TeamSerializer.values_queryset(Team.objects.all(), fields).order_by("id")
         
         filterset = TeamFilter(request.GET, queryset=teams_queryset)
         if filterset.is_valid():
             teams_queryset = filterset.qs
             
-        if request.query_params.get("page"):
-            paginator = SingleSetPagination()
-
-            paginated_queryset = paginator.paginate_queryset(teams_queryset, request)
-            teams_serializer = TeamSerializer(paginated_queryset, many=True)
-
-            res = paginator.get_paginated_response(teams_serializer.data)
+        paginator = get_paginator(request)
+        if paginator:
+            page = paginator.paginate_queryset(teams_queryset, request)
+            res = paginator.get_paginated_response(TeamSerializer.values_data(page, fields))
+        elif wants_stream(request):
+            res = stream_queryset(teams_queryset, TeamSerializer, fields)
         else:
-            teams_serializer = TeamSerializer(teams_queryset, many=True)
-            
-            res = JsonResponse(teams_serializer.data, safe=False)
+            res = JsonResponse(TeamSerializer.values_data(teams_queryset, fields), safe=False)
         
         return res
 
-    @extend_schema(description="Creates a new Team instance.", request=TeamSerializer, responses=TeamSerializer)
+    @extend_schema(description="Creates a new Team instance, or several at once if the body is a list.", request=TeamSerializer, responses=TeamSerializer)
     def post(self, request):
+        if isinstance(request.data, list):
+            return bulk_create(TeamSerializer, request.data)
+
         # default empty response.
         res = JsonResponse({}, safe=False)
         
@@ -75,11 +97,46 @@ class TeamListCreateView(APIView):
 
         return res
 
+    @extend_schema(description="Partially updates several Teams at once, each identified by its 'id'.", request=TeamSerializer(many=True), responses=TeamSerializer(many=True))
+    def patch(self, request):
+        queryset = TeamSerializer.setup_queryset(Team.objects.all())
 
-class TeamRetrieveUpdateDestroyView(APIView):
+        return bulk_update(TeamSerializer, queryset, request.data)
+
+    @extend_schema(
+        parameters=[OpenApiParameter("ids", OpenApiTypes.STR, OpenApiParameter.QUERY, required=True)],
+        description="Deletes the Teams listed in query parameter 'ids' (e.g. '1,2,3').",
+        request=None,
+    )
+    def delete(self, request):
+        return bulk_delete(Team.objects.all(), request.query_params.get("ids"))
+
+
+class TeamBatchView(APIView):
+    """
+        post:
+        Returns the Teams listed in the body's 'ids', like 'GET ?ids=' for lists too long for a URL.
+    """
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+        ],
+        description="Returns the Teams listed in the body's 'ids' (e.g. {\"ids\": [1, 2, 3]}), in that order, and the ids not found.",
+        request=None,
+    )
+    def post(self, request):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+
+        return bulk_fetch(TeamSerializer, Team.objects.all(), ids, TeamSerializer.select_fields(request.query_params))
+
+
+class TeamRetrieveUpdateDestroyView(CachedResponseMixin, APIView):
     """
         get:
         Retrieves a given Team.
+        Possibility to include nested collections: ('expand', any of 'players')
 
         put:
         Updates a given Team.
@@ -90,20 +147,45 @@ class TeamRetrieveUpdateDestroyView(APIView):
         delete:
         Deletes a given Team.
     """
+    cache_models = (Team, League)
+
+    def get_cache_models(self, request):
+        # expanded collections are read from the tables below as well.
+        if request.GET.get("expand"):
+            return (Team, League, Player)
 
-    @extend_schema(description="Retrieves a given Team.", request=TeamSerializer, responses=TeamSerializer)
+        return self.cache_models
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fields", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("exclude", OpenApiTypes.STR, OpenApiParameter.QUERY),
+            OpenApiParameter("expand", OpenApiTypes.STR, OpenApiParameter.QUERY, description="e.g. 'players'"),
+        ],
+        description="Retrieves a given Team.",
+        request=TeamSerializer,
+        responses=TeamSerializer
+    )
     def get(self, request, pk):
-        team = get_object_or_404(Team.objects.all(), pk=pk)
-        team_serializer = TeamSerializer(team)
+        fields = TeamSerializer.select_fields(request.query_params)
+
+        try:
+            expand = parse_expand(Team, request.query_params.get("expand"))
+        except ValueError as exc:
+            return JsonResponse({"expand": [str(exc)]}, status=400)
+
+        team_queryset = expand_queryset(TeamSerializer.setup_queryset(Team.objects.all(), fields), expand)
+        team = get_object_or_404(team_queryset, pk=pk)
+        team_serializer = TeamSerializer(team, fields=fields)
 
-        return JsonResponse(team_serializer.data, safe=False)
+        return JsonResponse(expand_data(team_serializer.data, team, expand), safe=False)
 
     @extend_schema(description="Updates a given Team.", request=TeamSerializer, responses=TeamSerializer)
     def put(self, request, pk):
         # default empty response.
         res = JsonResponse({}, safe=False)
         
-        stored_team = get_object_or_404(Team.objects.all(), pk=pk)
+        stored_team = get_object_or_404(TeamSerializer.setup_queryset(Team.objects.all()), pk=pk)
         updated_team = request.data
         
         team_serializer = TeamSerializer(stored_team, data=updated_team)
@@ -120,7 +202,7 @@ class TeamRetrieveUpdateDestroyView(APIView):
         # default empty response.
         res = JsonResponse({}, safe=False)
         
-        stored_team = get_object_or_404(Team.objects.all(), pk=pk)
+        stored_team = get_object_or_404(TeamSerializer.setup_queryset(Team.objects.all()), pk=pk)
         updated_team = request.data
         
         team_serializer = TeamSerializer(stored_team, data=updated_team, partial=True)
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FootballConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'football'
+
+    def ready(self):
+        from . import connections, instrumentation, signals  # noqa: F401 (connects the signal receivers)
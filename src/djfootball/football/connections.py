@@ -0,0 +1,87 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+logger = logging.getLogger(__name__)
+
+# how often (in requests) the connection reuse summary is logged.
+LOG_EVERY = 1000
+
+_lock = threading.Lock()
+_stats = {"requests": 0, "connections_opened": 0, "health_check_failures": 0}
+
+
+def _count(key):
+    with _lock:
+        _stats[key] += 1
+        return _stats[key]
+
+
+def connection_stats():
+    """
+        Returns this process' connection counters, and the share of requests served by an already open connection.
+    """
+    with _lock:
+        stats = dict(_stats)
+
+    if stats["requests"]:
+        stats["reuse_rate"] = max(0.0, 1 - stats["connections_opened"] / stats["requests"])
+    else:
+        stats["reuse_rate"] = 0.0
+
+    return stats
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    _count("connections_opened")
+
+
+@receiver(request_started)
+def check_connections(sender, **kwargs):
+    """
+        Health check for persistent connections ('DATABASE_CONN_HEALTH_CHECKS').
+
+        Django only drops a persistent connection after it failed during a request, so the next request
+        on it errors out. Checking it first closes it instead, and the request opens a fresh one.
+
+        Like Django 4.1's 'CONN_HEALTH_CHECKS', the check waits for the request's first use of the
+        connection: requests that don't query (cached responses, 304s) don't pay the round trip.
+    """
+    requests = _count("requests")
+    if requests % LOG_EVERY == 0:
+        logger.info("Database connections: %s", connection_stats())
+
+    if not settings.DATABASE_CONN_HEALTH_CHECKS:
+        return
+
+    for connection in connections.all():
+        if connection.connection is not None and connection.settings_dict["CONN_MAX_AGE"]:
+            _check_on_first_use(connection)
+            connection.health_check_pending = True
+
+
+def _check_on_first_use(connection):
+    # every cursor starts with 'ensure_connection()': checked there, once per request.
+    if "ensure_connection" in connection.__dict__:
+        return
+
+    ensure_connection = connection.ensure_connection
+
+    def checked_ensure_connection():
+        if connection.health_check_pending:
+            connection.health_check_pending = False
+
+            if connection.connection is not None and not connection.is_usable():
+                _count("health_check_failures")
+                connection.close()
+
+        ensure_connection()
+
+    connection.ensure_connection = checked_ensure_connection
@@ -0,0 +1,179 @@
+import io
+import random
+from contextlib import contextmanager
+from itertools import islice
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .api.cache import bump_version
+from .models import League, Team, Player
+from .stats import rebuild_stats
+
+
+COUNTRIES = ("Brasil", "Portugal", "Espanha", "Argentina", "Itália", "França", "Inglaterra", "Alemanha", "Uruguai", "México")
+CITIES = ("Lisboa", "Porto", "Braga", "Madrid", "Sevilha", "Rosário", "Santos", "Recife", "Curitiba", "Montevidéu", "Nápoles", "Lyon")
+TEAM_SUFFIXES = ("FC", "Atlético", "Esporte Clube", "United", "Sporting", "Athletic", "Real", "Nacional")
+FIRST_NAMES = ("João", "Pedro", "Lucas", "Gabriel", "Rafael", "Diego", "Bruno", "Thiago", "Carlos", "André", "Miguel", "Tiago", "Rui", "Nuno", "Mateus", "Felipe")
+LAST_NAMES = ("Silva", "Santos", "Oliveira", "Souza", "Pereira", "Costa", "Ferreira", "Rodrigues", "Almeida", "Gomes", "Martins", "Ribeiro", "Carvalho", "Lopes")
+# (position, share of a squad).
+POSITIONS = (("Goleiro", 3), ("Zagueiro", 6), ("Lateral", 4), ("Volante", 4), ("Meia", 5), ("Atacante", 5))
+
+
+def league_rows(count, teams_per_league=0, seed=0):
+    """
+        Yields 'count' League rows (dicts), the same ones for the same seed. Names are unique.
+    """
+    rng = random.Random(f"{seed}-leagues")
+
+    for i in range(count):
+        country = rng.choice(COUNTRIES)
+        yield {
+            "name": f"Liga {country} {i + 1}",
+            "country": country,
+            "number_of_teams": teams_per_league,
+            "current_champion": None,
+            "most_championships": None,
+            "most_appearances": None,
+        }
+
+
+def team_rows(count, players_per_team=0, seed=0):
+    """
+        Yields 'count' Team rows (dicts, without their league), the same ones for the same seed. Names are unique.
+    """
+    rng = random.Random(f"{seed}-teams")
+
+    for i in range(count):
+        city = rng.choice(CITIES)
+        yield {
+            "name": f"{city} {rng.choice(TEAM_SUFFIXES)} {i + 1}",
+            "city": city,
+            "championships_won": rng.randint(0, 40),
+            "coach": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "number_of_players": players_per_team,
+        }
+
+
+def player_rows(count, seed=0):
+    """
+        Yields 'count' Player rows (dicts, without their team), the same ones for the same seed.
+    """
+    for values in player_values(count, seed):
+        yield dict(zip(PLAYER_COLUMNS, values))
+
+
+# the columns of 'player_values()'.
+PLAYER_COLUMNS = ("name", "age", "position", "appearances")
+
+
+def player_values(count, seed=0):
+    """
+        'player_rows()' as 'PLAYER_COLUMNS' tuples, the cheaper form for millions of rows.
+    """
+    # one 'random()' per column: 'choice()' and 'randint()' cost several times more, at millions of rows.
+    random_float = random.Random(f"{seed}-players").random
+    names = [f"{first} {last} {other}" for first in FIRST_NAMES for last in LAST_NAMES for other in LAST_NAMES]
+    positions = [position for position, share in POSITIONS for _ in range(share)]
+
+    for _ in range(count):
+        age = 17 + int(random_float() * 22)
+        yield (
+            names[int(random_float() * len(names))],
+            age,
+            positions[int(random_float() * len(positions))],
+            int(random_float() * ((age - 16) * 40 + 1)),
+        )
+
+
+def generate(leagues, teams_per_league, players_per_team, seed=0, batch_size=10000):
+    """
+        Creates 'leagues' leagues of 'teams_per_league' teams of 'players_per_team' players each,
+        then rebuilds the Player statistics. Returns the created (leagues, teams, players) counts.
+
+        The same arguments always produce the same rows (ids aside).
+    """
+    with transaction.atomic():
+        league_objects = League.objects.bulk_create((League(**row) for row in league_rows(leagues, teams_per_league, seed)), batch_size=batch_size)
+
+        teams = zip(team_rows(leagues * teams_per_league, players_per_team, seed), _repeat_each(league_objects, teams_per_league))
+        team_objects = Team.objects.bulk_create(
+            (Team(**row, league_id=league.pk, league_name=league.name) for row, league in teams),
+            batch_size=batch_size,
+        )
+
+        players = zip(player_values(len(team_objects) * players_per_team, seed), _repeat_each(team_objects, players_per_team))
+        # raw rows skip 'auto_now': one timestamp for the whole load.
+        updated_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        with deferred_indexes(Player):
+            total_players = insert_rows(
+                Player,
+                (*PLAYER_COLUMNS, "team_id", "team_name", "updated_at"),
+                (values + (team.pk, team.name, updated_at) for values, team in players),
+                batch_size,
+            )
+
+        rebuild_stats()
+
+    for model in (League, Team, Player):
+        bump_version(model)
+
+    return len(league_objects), len(team_objects), total_players
+
+
+def insert_rows(model, columns, rows, batch_size=10000):
+    """
+        Inserts 'rows' (tuples of the 'columns' attribute names' values) into 'model's table, returning their number.
+
+        No model instance is created and no signal sent: rows go straight to 'executemany()', or to COPY
+        on PostgreSQL, which is what makes millions of rows a matter of seconds.
+    """
+    table = connection.ops.quote_name(model._meta.db_table)
+    quoted = ", ".join(connection.ops.quote_name(model._meta.get_field(column).column) for column in columns)
+
+    total = 0
+    with connection.cursor() as cursor:
+        while batch := list(islice(rows, batch_size)):
+            if connection.vendor == "postgresql":
+                buffer = io.StringIO("".join("\t".join(map(_copy_value, values)) + "\n" for values in batch))
+                cursor.copy_expert(f"COPY {table} ({quoted}) FROM STDIN", buffer)
+            else:
+                placeholders = ", ".join(["%s"] * len(columns))
+                cursor.executemany(f"INSERT INTO {table} ({quoted}) VALUES ({placeholders})", batch)
+
+            total += len(batch)
+
+    return total
+
+
+@contextmanager
+def deferred_indexes(model):
+    """
+        Drops 'model's 'Meta.indexes' for the duration of the block and creates them again afterwards:
+        building an index once over the loaded rows is much faster than updating it row by row.
+    """
+    schema_editor = connection.schema_editor()
+
+    with connection.cursor() as cursor:
+        for index in model._meta.indexes:
+            cursor.execute(str(index.remove_sql(model, schema_editor)))
+
+        try:
+            yield
+        finally:
+            for index in model._meta.indexes:
+                cursor.execute(str(index.create_sql(model, schema_editor)))
+
+
+def _copy_value(value):
+    # COPY's text format, as in 'import_data'.
+    if value is None:
+        return "\\N"
+
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _repeat_each(values, times):
+    for value in values:
+        for _ in range(times):
+            yield value
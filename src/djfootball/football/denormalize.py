@@ -0,0 +1,88 @@
+from django.db.models import F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from .models import Team, Player
+
+
+# model -> (denormalized column, relation): the related row's name copied into the model's own table.
+#
+# 'Model.save()' fills the column from the relation, 'football.signals' propagates renames and
+# deletions of the related rows, and the bulk write paths fill it themselves. Writes around all of
+# these ('QuerySet.update()' of the relation, raw SQL) leave it stale until 'refresh_names()'
+# (the 'backfill_names' command).
+#
+# A copy changes its row's representation, so propagating one also moves the row's 'updated_at'
+# (the change feed, 'football.api.changes'); the backfill only repairs, and leaves it alone.
+DENORMALIZED_NAMES = {
+    Player: ("team_name", "team"),
+    Team: ("league_name", "league"),
+}
+
+
+def refresh_names(model, queryset=None, touch=False):
+    """
+        Copies the related name into the denormalized column of every row of 'queryset' (all of
+        'model' by default) with a single UPDATE, returning the number of rows. With 'touch', their
+        'updated_at' too.
+    """
+    column, relation = DENORMALIZED_NAMES[model]
+    related_model = model._meta.get_field(relation).related_model
+
+    if queryset is None:
+        queryset = model.objects.all()
+
+    name = Subquery(related_model.objects.filter(pk=OuterRef(f"{relation}_id")).values("name")[:1])
+    if touch:
+        return queryset.update(**{column: name, "updated_at": timezone.now()})
+
+    return queryset.update(**{column: name})
+
+
+def stale_names(model):
+    """
+        Returns the rows of 'model' whose denormalized column disagrees with the related row's name.
+    """
+    column, relation = DENORMALIZED_NAMES[model]
+
+    return model.objects.filter(
+        Q(**{f"{relation}__isnull": True, f"{column}__isnull": False})
+        | (Q(**{f"{relation}__isnull": False}) & ~Q(**{column: F(f"{relation}__name")}))
+    )
+
+
+def _copies(related_model):
+    # (model, column, relation) of every denormalized copy of 'related_model's name.
+    for model, (column, relation) in DENORMALIZED_NAMES.items():
+        if model._meta.get_field(relation).related_model is related_model:
+            yield model, column, relation
+
+
+def propagate_name(instance):
+    """
+        Copies 'instance's (possibly new) name to the rows referencing it.
+    """
+    for model, column, relation in _copies(type(instance)):
+        model.objects.filter(**{relation: instance}).exclude(**{column: instance.name}).update(**{column: instance.name, "updated_at": timezone.now()})
+
+
+def propagate_names(related_model, objs):
+    """
+        'propagate_name()' for the renamed ones of several rows ('bulk_update()'), in one UPDATE per copy.
+    """
+    renamed = [obj.pk for obj in objs if obj.name_changed()]
+    if not renamed:
+        return
+
+    for model, column, relation in _copies(related_model):
+        refresh_names(model, model.objects.filter(**{f"{relation}__in": renamed}), touch=True)
+
+    for obj in objs:
+        obj.loaded_name = obj.name
+
+
+def clear_name(instance):
+    """
+        Empties the copies of 'instance's name before it's deleted ('on_delete=SET_NULL' doesn't send signals).
+    """
+    for model, column, relation in _copies(type(instance)):
+        model.objects.filter(**{relation: instance}).update(**{column: None, "updated_at": timezone.now()})
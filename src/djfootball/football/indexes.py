@@ -0,0 +1,27 @@
+from django.db import models
+from django.db.models.functions import Collate, Upper
+
+
+class CaseInsensitiveIndex(models.Index):
+    """
+        Index serving 'iexact' lookups on a single column.
+
+        PostgreSQL compiles 'iexact' to 'UPPER(col) = UPPER(%s)', so the index is built on 'UPPER(col)'.
+        SQLite compiles it to 'col LIKE %s' instead, which its LIKE optimization only serves from a
+        'COLLATE NOCASE' index, so that's what gets built there.
+    """
+
+    def __init__(self, field_name, *, name):
+        super().__init__(Upper(field_name), name=name)
+        self.field_name = field_name
+
+    def deconstruct(self):
+        path, _, kwargs = super().deconstruct()
+        return path, (self.field_name,), {"name": kwargs["name"]}
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor == "sqlite":
+            index = models.Index(Collate(self.field_name, "NOCASE"), name=self.name)
+            return index.create_sql(model, schema_editor, using=using, **kwargs)
+
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
@@ -0,0 +1,218 @@
+import asyncio
+import contextvars
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpResponse
+
+from .connections import connection_stats
+
+
+logger = logging.getLogger(__name__)
+
+# latency histogram buckets, in seconds (Prometheus' defaults).
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# identical SQL shapes run this many times in one request are logged as a likely N+1.
+N_PLUS_ONE_THRESHOLD = 10
+
+# '(%s, %s, %s)' lists of any length are one shape.
+_PLACEHOLDER_LIST = re.compile(r"\((?:%s, )*%s\)")
+
+
+class RequestMetrics:
+    """
+        Where a request's time went: database (query count and time), serialization and rendering.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.timings = {"db": 0.0, "serialize": 0.0, "render": 0.0}
+        self.shapes = Counter()
+
+
+_current = contextvars.ContextVar("request_metrics", default=None)
+
+
+@contextmanager
+def timed(name):
+    """
+        Adds the time spent in the block to the current request's 'name' timing (a no-op outside requests).
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - start
+
+
+def record_query(execute, sql, params, many, context):
+    """
+        Execute wrapper counting and timing the current request's queries, by SQL shape.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.timings["db"] += time.perf_counter() - start
+        metrics.queries += 1
+        metrics.shapes[_PLACEHOLDER_LIST.sub("(...)", sql)] += 1
+
+
+@receiver(connection_created)
+def install_execute_wrapper(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+_lock = threading.Lock()
+# (method, route) -> {"buckets": [...], "count", "sum", "queries", "db", "serialize", "render"}.
+_routes = defaultdict(lambda: {"buckets": [0] * len(BUCKETS), "count": 0, "sum": 0.0, "queries": 0, "db": 0.0, "serialize": 0.0, "render": 0.0})
+
+
+def _observe(method, route, duration, metrics):
+    with _lock:
+        stats = _routes[method, route]
+        stats["count"] += 1
+        stats["sum"] += duration
+        stats["queries"] += metrics.queries
+        for name, value in metrics.timings.items():
+            stats[name] += value
+
+        for i, bound in enumerate(BUCKETS):
+            if duration <= bound:
+                stats["buckets"][i] += 1
+
+
+class InstrumentationMiddleware:
+    """
+        Measures every request: database queries and time, serialization and render time, and the total.
+
+        The numbers go out in a 'Server-Timing' header (browser dev tools show them) when
+        'SERVER_TIMING' is on, and into this process' per-route histograms served by '/metrics'.
+        Identical SQL run 'N_PLUS_ONE_THRESHOLD' times or more in a request is logged as a likely N+1.
+
+        Queries are seen through an execute wrapper installed on every new connection, and attributed
+        to a request through a context variable, which follows the request into 'sync_to_async()' threads.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            # marks this instance as a coroutine function for Django's handler, like 'MiddlewareMixin'.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        duration = time.perf_counter() - metrics.start
+        route = getattr(request.resolver_match, "route", None) or "<unmatched>"
+
+        _observe(request.method, route, duration, metrics)
+
+        if settings.SERVER_TIMING:
+            response["Server-Timing"] = ", ".join([
+                f'db;desc="{metrics.queries} queries";dur={metrics.timings["db"] * 1000:.2f}',
+                f'serialize;dur={metrics.timings["serialize"] * 1000:.2f}',
+                f'render;dur={metrics.timings["render"] * 1000:.2f}',
+                f'total;dur={duration * 1000:.2f}',
+            ])
+
+        for shape, count in metrics.shapes.items():
+            if count >= N_PLUS_ONE_THRESHOLD:
+                logger.warning("Possible N+1 on %s %s: %d x %s", request.method, request.path, count, shape)
+
+        return response
+
+
+def metrics(request):
+    """
+        Prometheus text exposition of this process' request metrics and database connection counters.
+    """
+    lines = [
+        "# HELP djfootball_request_duration_seconds Request latency by route.",
+        "# TYPE djfootball_request_duration_seconds histogram",
+    ]
+
+    with _lock:
+        routes = {key: {**stats, "buckets": list(stats["buckets"])} for key, stats in _routes.items()}
+
+    for (method, route), stats in sorted(routes.items()):
+        labels = f'method="{method}",route="{_escape(route)}"'
+
+        for bound, count in zip(BUCKETS, stats["buckets"]):
+            lines.append(f'djfootball_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'djfootball_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats["count"]}')
+        lines.append(f"djfootball_request_duration_seconds_sum{{{labels}}} {stats['sum']}")
+        lines.append(f"djfootball_request_duration_seconds_count{{{labels}}} {stats['count']}")
+
+    counters = (
+        ("db_queries", "queries", "Database queries by route."),
+        ("db_duration_seconds", "db", "Time spent in database queries by route."),
+        ("serialize_duration_seconds", "serialize", "Time spent serializing by route."),
+        ("render_duration_seconds", "render", "Time spent rendering JSON by route."),
+    )
+    for name, key, description in counters:
+        lines += [f"# HELP djfootball_{name}_total {description}", f"# TYPE djfootball_{name}_total counter"]
+        for (method, route), stats in sorted(routes.items()):
+            lines.append(f'djfootball_{name}_total{{method="{method}",route="{_escape(route)}"}} {stats[key]}')
+
+    connections = connection_stats()
+    lines += [
+        "# HELP djfootball_db_connections_opened_total Database connections opened.",
+        "# TYPE djfootball_db_connections_opened_total counter",
+        f"djfootball_db_connections_opened_total {connections['connections_opened']}",
+        "# HELP djfootball_db_health_check_failures_total Persistent connections found broken before a request.",
+        "# TYPE djfootball_db_health_check_failures_total counter",
+        f"djfootball_db_health_check_failures_total {connections['health_check_failures']}",
+        "# HELP djfootball_db_connection_reuse_ratio Share of requests served by an already open connection.",
+        "# TYPE djfootball_db_connection_reuse_ratio gauge",
+        f"djfootball_db_connection_reuse_ratio {connections['reuse_rate']}",
+    ]
+
+    return HttpResponse("\n".join(lines) + "\n", content_type="text/plain; version=0.0.4")
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"')
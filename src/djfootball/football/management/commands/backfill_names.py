@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max, Min
+
+from ...api.cache import bump_version
+from ...denormalize import DENORMALIZED_NAMES, refresh_names, stale_names
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills the denormalized related-name columns ('Player.team_name', 'Team.league_name') from the "
+        "related rows, in primary key ranges of --batch-size rows, each in its own transaction. "
+        "With --check, only reports the stale rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Check consistency only, failing if anything is stale.")
+        parser.add_argument("--batch-size", type=int, default=50000)
+
+    def handle(self, **options):
+        if options["check"]:
+            stale = {model: stale_names(model).count() for model in DENORMALIZED_NAMES}
+
+            for model, count in stale.items():
+                if count:
+                    self.stderr.write(f"{model.__name__}.{DENORMALIZED_NAMES[model][0]}: {count} stale rows")
+
+            if any(stale.values()):
+                raise CommandError(f"{sum(stale.values())} stale denormalized names, run 'backfill_names' to fix them.")
+
+            self.stdout.write(self.style.SUCCESS("Denormalized names are consistent."))
+            return
+
+        batch_size = options["batch_size"]
+
+        for model in DENORMALIZED_NAMES:
+            bounds = model.objects.aggregate(low=Min("id"), high=Max("id"))
+            updated = 0
+
+            # short transactions: a batch only locks its own rows, for as long as one UPDATE takes.
+            for start in range(bounds["low"] or 0, (bounds["high"] or -1) + 1, batch_size):
+                with transaction.atomic():
+                    updated += refresh_names(model, model.objects.filter(id__gte=start, id__lt=start + batch_size))
+
+            bump_version(model)
+            self.stdout.write(f"{model.__name__}.{DENORMALIZED_NAMES[model][0]}: {updated} rows refreshed.")
+
+        self.stdout.write(self.style.SUCCESS("Denormalized names backfilled."))
@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...dataset import PLAYER_COLUMNS, generate, league_rows, player_values, team_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a synthetic dataset of leagues, teams and players for scale testing. "
+        "The same sizes and seed always produce the same rows. "
+        "Writes to the database, or with --output to CSV / JSONL files 'import_data' can load."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--leagues", type=int, default=10)
+        parser.add_argument("--teams-per-league", type=int, default=20)
+        parser.add_argument("--players-per-team", type=int, default=25)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=10000)
+        parser.add_argument("--output", help="Directory to write 'leagues', 'teams' and 'players' files to, instead of the database.")
+        parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="Format of the --output files.")
+
+    def handle(self, **options):
+        sizes = (options["leagues"], options["teams_per_league"], options["players_per_team"])
+        if min(sizes) < 0:
+            raise CommandError("Sizes can't be negative.")
+
+        start = time.perf_counter()
+
+        if options["output"]:
+            counts = self.write_files(options["output"], options["format"], *sizes, options["seed"])
+            target = f"'{options['output']}'"
+        else:
+            counts = generate(*sizes, seed=options["seed"], batch_size=options["batch_size"])
+            target = "the database"
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {counts[0]} leagues, {counts[1]} teams and {counts[2]} players into {target} in {elapsed:.2f}s "
+            f"({sum(counts) / elapsed if elapsed else 0:,.0f} rows/sec)."
+        ))
+
+    def write_files(self, directory, file_format, leagues, teams_per_league, players_per_team, seed):
+        """
+            Writes the rows 'generate()' would create, teams referencing their league and players their team
+            by name, as 'import_data' expects. Import them in order: leagues, teams, players.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        league_dicts = list(league_rows(leagues, teams_per_league, seed))
+        team_dicts = [
+            {**row, "league": league_dicts[i // teams_per_league]["name"]}
+            for i, row in enumerate(team_rows(leagues * teams_per_league, players_per_team, seed))
+        ]
+        players = (
+            (*values, team_dicts[i // players_per_team]["name"])
+            for i, values in enumerate(player_values(len(team_dicts) * players_per_team, seed))
+        )
+
+        return (
+            self.write_file(directory, "leagues", file_format, _columns(league_dicts), (tuple(row.values()) for row in league_dicts)),
+            self.write_file(directory, "teams", file_format, _columns(team_dicts), (tuple(row.values()) for row in team_dicts)),
+            self.write_file(directory, "players", file_format, (*PLAYER_COLUMNS, "team"), players),
+        )
+
+    def write_file(self, directory, resource, file_format, columns, rows):
+        """
+            Writes 'rows' (tuples of the 'columns' values) to '<directory>/<resource>.<format>', returning their number.
+        """
+        path = os.path.join(directory, f"{resource}.{file_format}")
+        total = 0
+
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            if file_format == "csv":
+                writer = csv.writer(file)
+                writer.writerow(columns)
+                for values in rows:
+                    # CSV has no null: 'import_data' reads empty cells as missing values.
+                    writer.writerow(["" if value is None else value for value in values])
+                    total += 1
+            else:
+                for values in rows:
+                    file.write(json.dumps(dict(zip(columns, values)), ensure_ascii=False) + "\n")
+                    total += 1
+
+        self.stdout.write(f"{total} {resource} written to '{path}'.")
+        return total
+
+
+def _columns(rows):
+    return tuple(rows[0]) if rows else ()
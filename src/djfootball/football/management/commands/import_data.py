@@ -0,0 +1,171 @@
+import csv
+import io
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.exceptions import ValidationError
+
+from ...api.cache import bump_version
+from ...api.serializers import LeagueSerializer, TeamSerializer, PlayerSerializer
+from ...models import League, Team
+from ...signals import post_bulk_create
+
+
+# resource -> (serializer, (relation column, related model) resolved by name).
+RESOURCES = {
+    "leagues": (LeagueSerializer, None),
+    "teams": (TeamSerializer, ("league", League)),
+    "players": (PlayerSerializer, ("team", Team)),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports leagues, teams or players from a CSV or JSONL file, in batches. "
+        "Teams reference their league and players their team by name. "
+        "Progress is checkpointed after every batch, so an interrupted import resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=RESOURCES)
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=("csv", "jsonl"), help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--checkpoint", help="Checkpoint file (defaults to '<path>.checkpoint').")
+        parser.add_argument("--no-copy", action="store_true", help="Use 'bulk_create()' even on PostgreSQL.")
+
+    def handle(self, resource, path, **options):
+        serializer_class, relation = RESOURCES[resource]
+        model = serializer_class.Meta.model
+
+        file_format = options["format"] or os.path.splitext(path)[1].lstrip(".").lower()
+        if file_format not in ("csv", "jsonl"):
+            raise CommandError(f"Unknown file format '{file_format}', use --format.")
+
+        checkpoint = options["checkpoint"] or f"{path}.checkpoint"
+        done = self.read_checkpoint(checkpoint)
+
+        # name -> id of every related row, so resolving a relation never hits the database.
+        lookup = {}
+        if relation:
+            lookup = {name: pk for pk, name in relation[1].objects.values_list("id", "name")}
+
+        use_copy = connection.vendor == "postgresql" and not options["no_copy"]
+        batch_size = options["batch_size"]
+
+        imported, skipped = 0, 0
+        start = time.perf_counter()
+
+        with open(path, newline="", encoding="utf-8") as file:
+            rows = islice(self.read_rows(file, file_format), done, None)
+
+            while batch := list(islice(rows, batch_size)):
+                objects, errors = self.validate(batch, done, serializer_class, relation, lookup)
+
+                with transaction.atomic():
+                    if use_copy:
+                        self.copy(model, objects)
+                    else:
+                        model.objects.bulk_create(objects, batch_size=batch_size)
+
+                    post_bulk_create.send(sender=model, objs=objects)
+
+                done += len(batch)
+                imported += len(objects)
+                skipped += len(errors)
+                self.write_checkpoint(checkpoint, done)
+
+                for line, error in errors:
+                    self.stderr.write(f"Row {line}: {error}")
+
+                elapsed = time.perf_counter() - start
+                self.stdout.write(f"{done} rows read, {imported} imported ({imported / elapsed:,.0f} rows/sec)")
+
+        if imported:
+            bump_version(model)
+
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} {resource}, skipped {skipped} in {elapsed:.2f}s "
+            f"({imported / elapsed if elapsed else 0:,.0f} rows/sec)."
+        ))
+
+    def read_rows(self, file, file_format):
+        if file_format == "csv":
+            for row in csv.DictReader(file):
+                # CSV has no null: empty cells are missing values.
+                yield {key: value for key, value in row.items() if value != ""}
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def validate(self, batch, offset, serializer_class, relation, lookup):
+        serializer = serializer_class()
+        objects, errors = [], []
+
+        for line, row in enumerate(batch, start=offset + 1):
+            try:
+                attrs = serializer.run_validation(row)
+
+                if relation and row.get(relation[0]) is not None:
+                    name = row[relation[0]]
+                    if name not in lookup:
+                        raise ValidationError({relation[0]: [f"Unknown {relation[0]} '{name}'."]})
+
+                    attrs[f"{relation[0]}_id"] = lookup[name]
+                    # the denormalized copy of the related name ('football.denormalize').
+                    attrs[f"{relation[0]}_name"] = name
+            except ValidationError as exc:
+                errors.append((line, exc.detail))
+            else:
+                objects.append(serializer.Meta.model(**attrs))
+
+        return objects, errors
+
+    def copy(self, model, objects):
+        """
+            Loads rows with PostgreSQL's COPY (text format), several times faster than a multi-row INSERT.
+        """
+        fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+
+        buffer = io.StringIO()
+        for obj in objects:
+            # 'pre_save()': 'auto_now' values, as 'bulk_create()' fills them.
+            values = (_copy_value(field.get_db_prep_save(field.pre_save(obj, True), connection)) for field in fields)
+            buffer.write("\t".join(values) + "\n")
+        buffer.seek(0)
+
+        table = connection.ops.quote_name(model._meta.db_table)
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+
+    def read_checkpoint(self, checkpoint):
+        if not os.path.exists(checkpoint):
+            return 0
+
+        with open(checkpoint) as file:
+            done = json.load(file)["rows"]
+
+        self.stdout.write(f"Resuming after row {done} (checkpoint '{checkpoint}').")
+        return done
+
+    def write_checkpoint(self, checkpoint, done):
+        with open(checkpoint, "w") as file:
+            json.dump({"rows": done}, file)
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...models import Tombstone
+
+
+class Command(BaseCommand):
+    help = (
+        "Deletes the tombstones of the change feed older than CHANGES_RETENTION_DAYS days "
+        "(or --days). Feed tokens older than that are answered with '410 Gone'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None, help="Defaults to CHANGES_RETENTION_DAYS.")
+
+    def handle(self, **options):
+        days = options["days"] if options["days"] is not None else settings.CHANGES_RETENTION_DAYS
+
+        # no signals or relations: a single DELETE over the 'deleted_at' index.
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=timezone.now() - timedelta(days=days)).delete()
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} tombstones older than {days} days."))
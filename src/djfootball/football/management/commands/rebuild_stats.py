@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...api.cache import bump_version
+from ...models import Player
+from ...stats import check_stats, rebuild_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the Player statistics summary table ('PlayerStats') from the Player table. "
+        "With --check, only reports the rows where the summary disagrees with the Player table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--check", action="store_true", help="Check consistency only, failing if anything differs.")
+
+    def handle(self, **options):
+        if options["check"]:
+            differences = check_stats()
+
+            for (team_id, position), expected, stored in differences:
+                self.stderr.write(f"team={team_id} position={position!r}: expected {expected}, stored {stored}")
+
+            if differences:
+                raise CommandError(f"{len(differences)} inconsistent Player statistics rows, run 'rebuild_stats' to fix them.")
+
+            self.stdout.write(self.style.SUCCESS("Player statistics are consistent."))
+            return
+
+        rows = rebuild_stats()
+        # the statistics endpoints' responses are cached under the Player table's version.
+        bump_version(Player)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} Player statistics rows."))
@@ -0,0 +1,38 @@
+# Generated by Django 4.0 on 2026-10-18 12:38
+
+from django.db import migrations, models
+import football.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='player',
+            index=football.indexes.CaseInsensitiveIndex('name', name='player_name_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=football.indexes.CaseInsensitiveIndex('name', name='team_name_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=football.indexes.CaseInsensitiveIndex('city', name='team_city_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=football.indexes.CaseInsensitiveIndex('coach', name='team_coach_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['championships_won'], name='team_championships_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['number_of_players'], name='team_number_of_players_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# (index, table, column) of the trigram indexes behind '/api/search/' on PostgreSQL.
+TRIGRAM_INDEXES = (
+    ("player_name_trgm_idx", "Player", "name"),
+    ("team_name_trgm_idx", "Team", "name"),
+    ("team_coach_trgm_idx", "Team", "coach"),
+    ("league_name_trgm_idx", "League", "name"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # other databases search through an in-process index ('football.api.search.TrigramIndex').
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index}" ON "{table}" USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0002_case_insensitive_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
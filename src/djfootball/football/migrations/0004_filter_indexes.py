@@ -0,0 +1,42 @@
+# Generated by Django 4.0 on 2026-10-18 13:04
+
+from django.db import migrations, models
+import football.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0003_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='league',
+            index=football.indexes.CaseInsensitiveIndex('country', name='league_country_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='league',
+            index=models.Index(fields=['number_of_teams', 'id'], name='league_number_of_teams_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='league',
+            index=models.Index(fields=['name', 'id'], name='league_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='player',
+            index=football.indexes.CaseInsensitiveIndex('position', name='player_position_ci_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['age', 'id'], name='player_age_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['appearances', 'id'], name='player_appearances_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['name', 'id'], name='player_name_idx'),
+        ),
+    ]
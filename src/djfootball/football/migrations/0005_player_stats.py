@@ -0,0 +1,59 @@
+# Generated by Django 4.0 on 2026-10-18 13:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_player_stats(apps, schema_editor):
+    # same as 'football.stats.rebuild_stats()', with the historical models.
+    Player = apps.get_model('football', 'Player')
+    PlayerStats = apps.get_model('football', 'PlayerStats')
+
+    rows = (
+        Player.objects.order_by()
+        .values('team', 'position')
+        .annotate(players=models.Count('id'), total_age=models.Sum('age'), total_appearances=models.Sum('appearances'))
+    )
+    PlayerStats.objects.bulk_create(
+        PlayerStats(
+            team_id=row['team'],
+            position=row['position'],
+            players=row['players'],
+            total_age=row['total_age'],
+            total_appearances=row['total_appearances'],
+        )
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0004_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlayerStats',
+            fields=[
+                ('id', models.AutoField(primary_key=True, serialize=False)),
+                ('position', models.CharField(max_length=30)),
+                ('players', models.IntegerField(default=0)),
+                ('total_age', models.BigIntegerField(default=0)),
+                ('total_appearances', models.BigIntegerField(default=0)),
+                ('team', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='player_stats', to='football.team')),
+            ],
+            options={
+                'db_table': 'PlayerStats',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='playerstats',
+            constraint=models.UniqueConstraint(fields=('team', 'position'), name='player_stats_team_position_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='playerstats',
+            constraint=models.UniqueConstraint(condition=models.Q(('team', None)), fields=('position',), name='player_stats_no_team_uniq'),
+        ),
+        migrations.RunPython(populate_player_stats, migrations.RunPython.noop),
+    ]
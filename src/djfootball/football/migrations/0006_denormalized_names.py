@@ -0,0 +1,34 @@
+# Generated by Django 4.0 on 2026-10-18 13:39
+
+from django.db import migrations, models
+
+
+def populate_names(apps, schema_editor):
+    # same as 'football.denormalize.refresh_names()', with the historical models.
+    Player = apps.get_model('football', 'Player')
+    Team = apps.get_model('football', 'Team')
+    League = apps.get_model('football', 'League')
+
+    Player.objects.update(team_name=models.Subquery(Team.objects.filter(pk=models.OuterRef('team_id')).values('name')[:1]))
+    Team.objects.update(league_name=models.Subquery(League.objects.filter(pk=models.OuterRef('league_id')).values('name')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('football', '0005_player_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='player',
+            name='team_name',
+            field=models.CharField(editable=False, max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='league_name',
+            field=models.CharField(editable=False, max_length=50, null=True),
+        ),
+        migrations.RunPython(populate_names, migrations.RunPython.noop),
+    ]
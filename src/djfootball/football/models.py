@@ -1,7 +1,40 @@
-from django.db import models
+from django.db import models, transaction
 
+from .indexes import CaseInsensitiveIndex
 
-class League(models.Model):
+
+class LoadedNameMixin:
+    """
+        Remembers the name a row was loaded with ('loaded_name'), so a save only propagates it to its
+        denormalized copies ('football.denormalize') when it actually changed.
+    """
+    loaded_name = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.loaded_name = instance.__dict__.get("name")
+
+        return instance
+
+    def name_changed(self):
+        return self.name != self.loaded_name
+
+
+class UpdatedAtMixin:
+    """
+        Keeps 'updated_at' (the change feed's position, 'football.changes') current on every save,
+        including saves limited to some 'update_fields'.
+    """
+
+    def save(self, *args, update_fields=None, **kwargs):
+        if update_fields is not None:
+            update_fields = {*update_fields, "updated_at"}
+
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+
+class League(UpdatedAtMixin, LoadedNameMixin, models.Model):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=50, null=False)
     country = models.CharField(max_length=50, null=False)
@@ -9,15 +42,29 @@ class League(models.Model):
     current_champion = models.CharField(max_length=50, null=True)
     most_championships = models.CharField(max_length=50, null=True)
     most_appearances = models.CharField(max_length=100, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'League'
+        indexes = [
+            # the change feed's keyset ('football.api.changes').
+            models.Index(fields=["updated_at", "id"], name="league_updated_at_idx"),
+            # 'LeagueFilter' lookups, and its orderings (ties broken by 'id').
+            CaseInsensitiveIndex("country", name="league_country_ci_idx"),
+            models.Index(fields=["number_of_teams", "id"], name="league_number_of_teams_idx"),
+            models.Index(fields=["name", "id"], name="league_name_idx"),
+        ]
     
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # a rename and its propagation to the teams' 'league_name' ('football.signals') commit together.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
 
-class Team(models.Model):
+
+class Team(UpdatedAtMixin, LoadedNameMixin, models.Model):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=50, null=False)
     city = models.CharField(max_length=50, null=False)
@@ -25,25 +72,112 @@ class Team(models.Model):
     coach = models.CharField(max_length=100, null=False)
     number_of_players = models.IntegerField()
     league = models.ForeignKey(League, null=True, on_delete=models.SET_NULL)
+    # denormalized 'league.name' ('football.denormalize'), so Team lists don't join 'League'.
+    league_name = models.CharField(max_length=50, null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'Team'
+        indexes = [
+            # the change feed's keyset ('football.api.changes').
+            models.Index(fields=["updated_at", "id"], name="team_updated_at_idx"),
+            # 'TeamFilter' lookups.
+            CaseInsensitiveIndex("name", name="team_name_ci_idx"),
+            CaseInsensitiveIndex("city", name="team_city_ci_idx"),
+            CaseInsensitiveIndex("coach", name="team_coach_ci_idx"),
+            models.Index(fields=["championships_won"], name="team_championships_idx"),
+            models.Index(fields=["number_of_players"], name="team_number_of_players_idx"),
+        ]
         
     def __str__(self):
         return self.name
 
+    def save(self, *args, update_fields=None, **kwargs):
+        if update_fields is None or "league" in update_fields:
+            self.league_name = self.league.name if self.league_id else None
+            if update_fields is not None:
+                update_fields = {*update_fields, "league_name"}
+
+        # a rename and its propagation to the players' 'team_name' ('football.signals') commit together.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, update_fields=update_fields, **kwargs)
+
 
-class Player(models.Model):
+class Player(UpdatedAtMixin, models.Model):
     id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=100, null=False)
     age = models.IntegerField()
     position = models.CharField(max_length=30, null=False)
     appearances = models.IntegerField()
     team = models.ForeignKey(Team, null=True, on_delete=models.SET_NULL)
+    # denormalized 'team.name' ('football.denormalize'), so Player lists don't join 'Team'.
+    team_name = models.CharField(max_length=50, null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'Player'
+        indexes = [
+            # the change feed's keyset ('football.api.changes').
+            models.Index(fields=["updated_at", "id"], name="player_updated_at_idx"),
+            # 'player_name' lookup on the League list.
+            CaseInsensitiveIndex("name", name="player_name_ci_idx"),
+            # 'PlayerFilter' lookups and range queries, and its orderings (ties broken by 'id').
+            CaseInsensitiveIndex("position", name="player_position_ci_idx"),
+            models.Index(fields=["age", "id"], name="player_age_idx"),
+            models.Index(fields=["appearances", "id"], name="player_appearances_idx"),
+            models.Index(fields=["name", "id"], name="player_name_idx"),
+        ]
         
     def __str__(self):
         return self.name
 
+    def save(self, *args, update_fields=None, **kwargs):
+        if update_fields is None or "team" in update_fields:
+            self.team_name = self.team.name if self.team_id else None
+            if update_fields is not None:
+                update_fields = {*update_fields, "team_name"}
+
+        # the row read before the write ('football.signals') stays locked until its statistics are updated.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, update_fields=update_fields, **kwargs)
+
+
+class PlayerStats(models.Model):
+    """
+        Materialized Player aggregates per (team, position), kept up to date by 'football.stats'.
+
+        A team's or a league's statistics are sums over a handful of these rows instead of a scan of
+        every Player row. Players without a team are counted under 'team=None'.
+    """
+    id = models.AutoField(primary_key=True)
+    team = models.ForeignKey(Team, null=True, on_delete=models.CASCADE, related_name="player_stats")
+    position = models.CharField(max_length=30, null=False)
+    players = models.IntegerField(default=0)
+    total_age = models.BigIntegerField(default=0)
+    total_appearances = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'PlayerStats'
+        constraints = [
+            models.UniqueConstraint(fields=["team", "position"], name="player_stats_team_position_uniq"),
+            # NULLs aren't equal to each other in a unique constraint: players without a team get their own.
+            models.UniqueConstraint(fields=["position"], condition=models.Q(team=None), name="player_stats_no_team_uniq"),
+        ]
+
+
+class Tombstone(models.Model):
+    """
+        Record of a deleted League, Team or Player, so the change feed ('football.api.changes') can report deletes.
+    """
+    id = models.AutoField(primary_key=True)
+    resource = models.CharField(max_length=10, null=False)
+    object_id = models.IntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'Tombstone'
+        indexes = [
+            # the change feed's keyset, per resource.
+            models.Index(fields=["resource", "deleted_at", "id"], name="tombstone_feed_idx"),
+            models.Index(fields=["deleted_at"], name="tombstone_deleted_at_idx"),
+        ]
@@ -0,0 +1,110 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import Signal, receiver
+
+from . import denormalize, stats
+from .api.cache import bump_version
+from .models import League, Team, Player, Tombstone
+
+
+# 'bulk_create()' and 'bulk_update()' don't send 'post_save': the bulk write paths send these instead.
+post_bulk_create = Signal()  # sender=model, objs=created objects
+pre_bulk_update = Signal()   # sender=model, objs=objects about to be modified and updated
+post_bulk_update = Signal()  # sender=model, objs=updated objects
+
+
+@receiver(post_save, sender=League)
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=League)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Player)
+def invalidate_cached_responses(sender, **kwargs):
+    # bump right away and again on commit: responses cached from the not yet committed
+    # state in between are orphaned by the second bump.
+    bump_version(sender)
+    transaction.on_commit(lambda: bump_version(sender))
+
+
+# 'PlayerStats' maintenance: every Player write applies its difference to the summary rows.
+
+@receiver(pre_save, sender=Player)
+def remember_player_stats(sender, instance, update_fields=None, **kwargs):
+    instance._stats_previous = None
+
+    if instance._state.adding or (update_fields is not None and not {"team", "position", "age", "appearances"} & set(update_fields)):
+        return
+
+    # locked until 'Player.save()' commits: two concurrent updates would both subtract the same row.
+    instance._stats_previous = Player.objects.select_for_update().filter(pk=instance.pk).only("team", "position", "age", "appearances").first()
+
+
+@receiver(post_save, sender=Player)
+def update_player_stats(sender, instance, created, update_fields=None, **kwargs):
+    previous = getattr(instance, "_stats_previous", None)
+    if not created and previous is None:
+        return
+
+    deltas = stats.player_deltas([instance])
+    if previous is not None:
+        stats.player_deltas([previous], -1, deltas)
+
+    stats.apply_deltas(deltas)
+
+
+@receiver(post_delete, sender=Player)
+def remove_player_stats(sender, instance, **kwargs):
+    stats.add_players([instance], -1)
+
+
+@receiver(pre_delete, sender=Team)
+def move_team_stats(sender, instance, **kwargs):
+    stats.move_team_players(instance)
+
+
+@receiver(post_bulk_create, sender=Player)
+def add_bulk_player_stats(sender, objs, **kwargs):
+    stats.add_players(objs)
+
+
+@receiver(pre_bulk_update, sender=Player)
+def remove_bulk_player_stats(sender, objs, **kwargs):
+    stats.add_players(objs, -1)
+
+
+@receiver(post_bulk_update, sender=Player)
+def readd_bulk_player_stats(sender, objs, **kwargs):
+    stats.add_players(objs)
+
+
+# Denormalized names ('football.denormalize'): renames and deletions reach the rows holding a copy.
+
+@receiver(post_save, sender=League)
+@receiver(post_save, sender=Team)
+def propagate_name(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and "name" not in update_fields) or not instance.name_changed():
+        return
+
+    denormalize.propagate_name(instance)
+    instance.loaded_name = instance.name
+
+
+@receiver(post_bulk_update, sender=League)
+@receiver(post_bulk_update, sender=Team)
+def propagate_bulk_names(sender, objs, **kwargs):
+    denormalize.propagate_names(sender, objs)
+
+
+@receiver(pre_delete, sender=League)
+@receiver(pre_delete, sender=Team)
+def clear_name(sender, instance, **kwargs):
+    denormalize.clear_name(instance)
+
+
+# Change feed ('football.api.changes'): deleted rows leave a tombstone behind.
+
+@receiver(post_delete, sender=League)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Player)
+def record_tombstone(sender, instance, **kwargs):
+    Tombstone.objects.create(resource=sender._meta.model_name, object_id=instance.pk)
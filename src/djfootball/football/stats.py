@@ -0,0 +1,117 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+
+from .models import Player, PlayerStats
+
+
+# 'PlayerStats' counters, in the order deltas are kept.
+STATS_FIELDS = ("players", "total_age", "total_appearances")
+
+
+def player_deltas(players, sign=1, deltas=None):
+    """
+        Adds (sign=1) or removes (sign=-1) the contribution of 'players' to 'deltas',
+        a '(team_id, position) -> [players, total_age, total_appearances]' mapping.
+    """
+    if deltas is None:
+        deltas = defaultdict(lambda: [0, 0, 0])
+
+    for player in players:
+        delta = deltas[player.team_id, player.position]
+        delta[0] += sign
+        delta[1] += sign * player.age
+        delta[2] += sign * player.appearances
+
+    return deltas
+
+
+def apply_deltas(deltas):
+    """
+        Applies 'player_deltas()' to the 'PlayerStats' rows, as relative updates ('players = players + n'),
+        so concurrent writers never overwrite each other's changes.
+    """
+    for (team_id, position), delta in deltas.items():
+        if not any(delta):
+            continue
+
+        rows = PlayerStats.objects.filter(team_id=team_id, position=position)
+        increments = {field: F(field) + value for field, value in zip(STATS_FIELDS, delta)}
+
+        if not rows.update(**increments):
+            try:
+                with transaction.atomic():
+                    PlayerStats.objects.create(team_id=team_id, position=position, **dict(zip(STATS_FIELDS, delta)))
+            except IntegrityError:
+                # created concurrently in between.
+                rows.update(**increments)
+
+        if delta[0] < 0:
+            rows.filter(players__lte=0).delete()
+
+
+def add_players(players, sign=1):
+    apply_deltas(player_deltas(players, sign))
+
+
+def move_team_players(team):
+    """
+        Moves a team's statistics to 'team=None', as its players are left without a team when it's deleted.
+    """
+    deltas = defaultdict(lambda: [0, 0, 0])
+    for row in PlayerStats.objects.filter(team=team):
+        values = [getattr(row, field) for field in STATS_FIELDS]
+        deltas[team.pk, row.position] = [-value for value in values]
+        deltas[None, row.position] = [a + b for a, b in zip(deltas[None, row.position], values)]
+
+    apply_deltas(deltas)
+
+
+def compute_stats():
+    """
+        Returns the '(team_id, position) -> (players, total_age, total_appearances)' statistics computed from the Player table.
+    """
+    rows = (
+        Player.objects.order_by()
+        .values("team", "position")
+        .annotate(players=Count("id"), total_age=Sum("age"), total_appearances=Sum("appearances"))
+    )
+
+    return {(row["team"], row["position"]): tuple(row[field] for field in STATS_FIELDS) for row in rows}
+
+
+def stored_stats():
+    rows = PlayerStats.objects.values("team", "position", *STATS_FIELDS)
+
+    return {(row["team"], row["position"]): tuple(row[field] for field in STATS_FIELDS) for row in rows}
+
+
+def check_stats():
+    """
+        Returns the '(team_id, position), expected, stored' triples where 'PlayerStats' disagrees with the Player table.
+    """
+    expected, stored = compute_stats(), stored_stats()
+
+    return [
+        (key, expected.get(key), stored.get(key))
+        for key in sorted(expected.keys() | stored.keys(), key=lambda key: (key[0] is None, key[0] or 0, key[1]))
+        if expected.get(key) != stored.get(key)
+    ]
+
+
+def rebuild_stats():
+    """
+        Recomputes every 'PlayerStats' row from the Player table, returning the number of rows.
+
+        Player writes committed while it runs may be counted twice or not at all, so it's meant for
+        quiet periods (or to be followed by 'check_stats()').
+    """
+    with transaction.atomic():
+        PlayerStats.objects.all().delete()
+        stats = PlayerStats.objects.bulk_create(
+            PlayerStats(team_id=team_id, position=position, **dict(zip(STATS_FIELDS, values)))
+            for (team_id, position), values in compute_stats().items()
+        )
+
+    return len(stats)
@@ -0,0 +1,29 @@
+import os
+import tempfile
+
+import pytest
+from django.core.cache import cache
+
+from football.api.search import clear_indexes
+
+
+# a cache backend shared between processes, which conditional GETs need ('football.api.cache'):
+# 'override_settings(CACHES=SHARED_CACHES)'.
+SHARED_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.path.join(tempfile.gettempdir(), "djfootball-tests-cache"),
+    }
+}
+
+
+def player_data(name, age=25, position="Atacante", appearances=10, **kwargs):
+    # the fields a Player is created with: 'Player(**player_data("Pepe"), team=team)'.
+    return {"name": name, "age": age, "position": position, "appearances": appearances, **kwargs}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # cached responses and table versions would otherwise outlive each test's rolled back data.
+    cache.clear()
+    clear_indexes()
@@ -0,0 +1,67 @@
+import pytest
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import path, reverse
+from rest_framework import status
+
+from football.api.views import player
+from football.api.views.asynchronous import async_api_view
+from football.models import Player
+
+from conftest import SHARED_CACHES
+
+
+urlpatterns = [
+    path("api/players/", async_api_view(player.PlayerListCreateView), name="player-list-create"),
+    path("api/players/<int:pk>", async_api_view(player.PlayerRetrieveUpdateDestroyView), name="player-retrieve-update-destroy"),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, CACHES=SHARED_CACHES)
+class TestAsyncViews(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.player = Player.objects.create(name="Jogador", age=27, position="Atacante", appearances=200)
+
+    @pytest.mark.django_db
+    async def test_get(self):
+        response = await self.async_client.get(reverse("player-list-create"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["name"], "Jogador")
+
+    @pytest.mark.django_db
+    async def test_cache_hit_without_queries(self):
+        url = reverse("player-retrieve-update-destroy", kwargs={"pk": self.player.id})
+        response = await self.async_client.get(url)
+
+        # a queryset update sends no signal: only a response that skipped the database still shows the old age.
+        await sync_to_async(Player.objects.update)(age=99)
+
+        cached_response = await self.async_client.get(url)
+        not_modified = await self.async_client.get(url, **{"If-None-Match": response["ETag"]})
+
+        self.assertEqual(cached_response.json(), response.json())
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @pytest.mark.django_db
+    async def test_stream(self):
+        # Django 4.0 would iterate the stream on the event loop: the array comes in one piece.
+        url = reverse("player-list-create")
+        response = await self.async_client.get(url + "?stream=1")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.streaming)
+        self.assertEqual(response.json(), (await self.async_client.get(url)).json())
+
+    @pytest.mark.django_db
+    async def test_write(self):
+        url = reverse("player-retrieve-update-destroy", kwargs={"pk": self.player.id})
+        await self.async_client.get(url)
+
+        response = await self.async_client.patch(url, {"age": 28}, content_type="application/json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((await self.async_client.get(url)).json()["age"], 28)
+        self.assertEqual(await sync_to_async(Player.objects.get)(pk=self.player.id), self.player)
@@ -0,0 +1,90 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import Team, Player
+
+from conftest import player_data
+
+
+class TestBulkCreate(APITestCase):
+    @pytest.mark.django_db
+    def test_post_list(self):
+        url = reverse("player-list-create")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(url, [player_data(f"Jogador {i}", age=20 + i, appearances=i) for i in range(50)], format="json")
+
+        inserts = [query for query in context.captured_queries if query["sql"].startswith('INSERT INTO "Player"')]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Player.objects.count(), 50)
+        self.assertEqual([player["id"] for player in response.json()], list(Player.objects.values_list("id", flat=True)))
+
+    @pytest.mark.django_db
+    def test_per_item_errors(self):
+        url = reverse("team-list-create")
+        data = [
+            {"name": "Equipa", "city": "Porto", "championships_won": 1, "coach": "Treinador", "number_of_players": 25},
+            {"name": "Clube", "city": "Lisboa", "championships_won": "many", "coach": "Mister", "number_of_players": 25},
+        ]
+        response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()[0], {})
+        self.assertIn("championships_won", response.json()[1])
+        self.assertEqual(Team.objects.count(), 0)
+
+
+class TestBulkUpdateDelete(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.players = Player.objects.bulk_create(Player(**player_data(f"Jogador {i}", age=20 + i, appearances=i)) for i in range(5))
+
+    @pytest.mark.django_db
+    def test_patch_list(self):
+        url = reverse("player-list-create")
+        data = [{"id": player.id, "appearances": 100 + player.appearances} for player in self.players]
+
+        response = self.client.patch(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(Player.objects.values_list("appearances", flat=True)), [100, 101, 102, 103, 104])
+
+    @pytest.mark.django_db
+    def test_patch_missing_id(self):
+        url = reverse("player-list-create")
+        data = [{"id": self.players[0].id, "age": 30}, {"id": 0, "age": 30}]
+
+        response = self.client.patch(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()[1], {"id": ["Not found."]})
+        self.assertEqual(Player.objects.filter(age=30).count(), 0)
+
+        # not an id, though equal to 1.
+        response = self.client.patch(url, [{"id": True, "age": 30}], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()[0], {"id": ["Not found."]})
+        self.assertEqual(Player.objects.filter(age=30).count(), 0)
+
+    @pytest.mark.django_db
+    def test_delete_ids(self):
+        ids = ",".join(str(player.id) for player in self.players[:3])
+        response = self.client.delete(reverse("player-list-create") + f"?ids={ids}")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"deleted": 3})
+        self.assertEqual(Player.objects.count(), 2)
+
+    @pytest.mark.django_db
+    def test_delete_without_ids(self):
+        response = self.client.delete(reverse("player-list-create"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Player.objects.count(), 5)
@@ -0,0 +1,73 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.api.bulk import MAX_BULK_FETCH
+from football.api.cache import get_versions
+from football.models import League, Team, Player
+
+
+# measures the database work itself, not the response cache.
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class TestBulkFetch(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        team = Team.objects.create(name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25)
+        self.ids = [
+            Player.objects.create(name=f"Jogador {i}", age=20, position="Atacante", appearances=i, team=team).id
+            for i in range(5)
+        ]
+
+    @pytest.mark.django_db
+    def test_get_preserves_order(self):
+        ids = [self.ids[3], self.ids[0], 999, self.ids[3]]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("player-list-create") + "?ids=" + ",".join(map(str, ids)))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([player["id"] for player in response.json()["results"]], [self.ids[3], self.ids[0]])
+        self.assertEqual(response.json()["missing"], [999])
+        self.assertEqual(response.json()["results"][0]["team"], "Equipa")
+        self.assertEqual(len(context.captured_queries), 1)
+
+    @pytest.mark.django_db
+    def test_get_with_fields(self):
+        response = self.client.get(reverse("player-list-create") + f"?ids={self.ids[1]}&fields=name")
+
+        self.assertEqual(response.json(), {"results": [{"name": "Jogador 1"}], "missing": []})
+
+    @pytest.mark.django_db
+    def test_post_body(self):
+        response = self.client.post(reverse("player-batch"), {"ids": list(reversed(self.ids))}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([player["id"] for player in response.json()["results"]], list(reversed(self.ids)))
+
+    @pytest.mark.django_db
+    def test_post_does_not_invalidate(self):
+        versions = get_versions((League, Team, Player))
+
+        self.assertEqual(self.client.post(reverse("league-batch"), {"ids": [1]}, format="json").json(), {"results": [], "missing": [1]})
+        self.assertEqual(self.client.post(reverse("team-batch"), {"ids": [1]}, format="json").status_code, status.HTTP_200_OK)
+
+        # a batch fetch is a read: it doesn't bump the cached responses' versions.
+        self.assertEqual(get_versions((League, Team, Player)), versions)
+
+    @pytest.mark.django_db
+    def test_invalid(self):
+        url = reverse("player-batch")
+
+        self.assertEqual(self.client.post(url, {"ids": [1, "a"]}, format="json").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, [1, 2], format="json").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(reverse("team-list-create") + "?ids=a").status_code, status.HTTP_400_BAD_REQUEST)
+
+    @pytest.mark.django_db
+    def test_cap(self):
+        response = self.client.post(reverse("player-batch"), {"ids": list(range(1, MAX_BULK_FETCH + 2))}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
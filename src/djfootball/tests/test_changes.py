@@ -0,0 +1,166 @@
+import io
+from datetime import timedelta
+from urllib.parse import urlencode
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.api.changes import DELETE, UPSERT, decode_token, encode_token
+from football.models import League, Team, Player, Tombstone
+
+from conftest import player_data
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0, CHANGES_DELAY_SECONDS=0)
+class TestChanges(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18)
+        self.team = Team.objects.create(name="Porto", city="Porto", championships_won=30, coach="Treinador", number_of_players=25, league=self.league)
+        self.players = [Player.objects.create(**player_data(f"Jogador {i}"), team=self.team) for i in range(3)]
+
+    def get(self, resource="players", expected_status=status.HTTP_200_OK, **params):
+        response = self.client.get(reverse("changes") + "?" + urlencode({"resource": resource, **params}))
+        self.assertEqual(response.status_code, expected_status, response.content)
+
+        return response.json()
+
+    def sync(self, since=None, **params):
+        # every page from 'since' on: (changes, next token).
+        results = []
+        while True:
+            data = self.get(**params, **({"since": since} if since else {}))
+            results += data["results"]
+            since = data["next"]
+            if not data["has_more"]:
+                return results, since
+
+    @pytest.mark.django_db
+    def test_from_the_beginning(self):
+        data = self.get()
+
+        self.assertEqual([(change["op"], change["id"]) for change in data["results"]], [("upsert", player.pk) for player in self.players])
+        self.assertEqual(data["results"][0]["data"], self.client.get(reverse("player-retrieve-update-destroy", kwargs={"pk": self.players[0].pk})).json())
+        self.assertFalse(data["has_more"])
+
+        self.assertEqual([change["data"]["name"] for change in self.get("teams")["results"]], ["Porto"])
+        self.assertEqual([change["data"]["name"] for change in self.get("leagues")["results"]], ["Liga"])
+
+    @pytest.mark.django_db
+    def test_since(self):
+        _, since = self.sync()
+
+        response = self.client.patch(reverse("player-retrieve-update-destroy", kwargs={"pk": self.players[1].pk}), {"appearances": 11}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 'delete()' empties the instance's pk.
+        deleted = self.players[0].pk
+        self.players[0].delete()
+        created = Player.objects.create(**player_data("Novo"))
+
+        results, since = self.sync(since)
+        self.assertEqual(
+            [(change["op"], change["id"]) for change in results],
+            [("upsert", self.players[1].pk), ("delete", deleted), ("upsert", created.pk)],
+        )
+        self.assertEqual(results[0]["data"]["appearances"], 11)
+
+        # nothing new: a token as far as the feed was read.
+        data = self.get(since=since)
+        self.assertEqual((data["results"], data["has_more"]), ([], False))
+        self.assertGreaterEqual(decode_token(data["next"]), decode_token(since))
+
+    @pytest.mark.django_db
+    def test_write_paths(self):
+        _, since = self.sync()
+
+        # bulk update, and a team rename reaching its players' 'team' name.
+        response = self.client.patch(reverse("player-list-create"), [{"id": self.players[0].pk, "age": 30}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.patch(reverse("team-retrieve-update-destroy", kwargs={"pk": self.team.pk}), {"name": "FC Porto"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results, _ = self.sync(since)
+        self.assertEqual(sorted(change["id"] for change in results), sorted(player.pk for player in self.players))
+        self.assertEqual({change["data"]["team"] for change in results}, {"FC Porto"})
+
+        # bulk delete, and the team's deletion leaving its players without a team.
+        _, since = self.sync(since)
+        response = self.client.delete(reverse("player-list-create") + f"?ids={self.players[0].pk}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.team.delete()
+
+        results, _ = self.sync(since)
+        self.assertEqual(results[0], {"op": "delete", "id": self.players[0].pk, "changed_at": results[0]["changed_at"]})
+        self.assertEqual([(change["op"], change["data"]["team"]) for change in results[1:]], [("upsert", None)] * 2)
+        self.assertEqual([change["op"] for change in self.get("teams", since=since)["results"]], ["delete"])
+
+    @pytest.mark.django_db
+    def test_keyset_pages(self):
+        # the same instant for every row and tombstone: ties are broken by ids.
+        Player.objects.bulk_create([Player(**player_data(f"Extra {i}")) for i in range(4)])
+        deleted = self.players[2].pk
+        Player.objects.filter(pk=deleted).delete()
+        instant = timezone.now() - timedelta(seconds=1)
+        Player.objects.update(updated_at=instant)
+        Tombstone.objects.update(deleted_at=instant)
+
+        results, _ = self.sync(per_page=2)
+        self.assertEqual(len(results), 7)
+        self.assertEqual(
+            [(change["op"], change["id"]) for change in results],
+            [("upsert", pk) for pk in Player.objects.order_by("id").values_list("id", flat=True)] + [("delete", deleted)],
+        )
+
+    @pytest.mark.django_db
+    def test_sparse_fieldset(self):
+        self.assertEqual(self.get(fields="name")["results"][0]["data"], {"name": "Jogador 0"})
+
+    @pytest.mark.django_db
+    def test_delay(self):
+        with override_settings(CHANGES_DELAY_SECONDS=60):
+            data = self.get()
+
+        self.assertEqual((data["results"], data["has_more"]), ([], False))
+        # served once they're old enough.
+        self.assertEqual(len(self.get(since=data["next"])["results"]), 3)
+
+    @pytest.mark.django_db
+    def test_tokens(self):
+        position = (timezone.now(), DELETE, 42, timezone.now() - timedelta(days=1))
+        self.assertEqual(decode_token(encode_token(position)), position)
+
+        self.assertIn("resource", self.get("coaches", status.HTTP_400_BAD_REQUEST))
+        self.assertIn("since", self.get(since="not a token", expected_status=status.HTTP_400_BAD_REQUEST))
+        self.assertIn("per_page", self.get(per_page="x", expected_status=status.HTTP_400_BAD_REQUEST))
+
+        # deletes this old may have been pruned already.
+        old = timezone.now() - timedelta(days=31)
+        self.assertIn("since", self.get(since=encode_token((old, UPSERT, 1, old)), expected_status=status.HTTP_410_GONE))
+
+    @pytest.mark.django_db
+    def test_old_changes(self):
+        # nothing changed since long before the retention period.
+        Player.objects.update(updated_at=timezone.now() - timedelta(days=40))
+
+        # neither a full sync of them, page by page, nor a token it ends with has expired.
+        results, since = self.sync(per_page=1)
+        self.assertEqual(len(results), 3)
+
+        data = self.get(since=since)
+        self.assertEqual((data["results"], data["has_more"]), ([], False))
+        self.assertEqual(self.get(since=data["next"])["results"], [])
+
+    @pytest.mark.django_db
+    def test_prune_tombstones(self):
+        old, recent = self.players[0].pk, self.players[1].pk
+        Player.objects.filter(pk__in=[old, recent]).delete()
+        Tombstone.objects.filter(object_id=old).update(deleted_at=timezone.now() - timedelta(days=31))
+
+        call_command("prune_tombstones", stdout=io.StringIO())
+
+        self.assertEqual(list(Tombstone.objects.values_list("object_id", flat=True)), [recent])
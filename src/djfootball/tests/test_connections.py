@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from football.connections import check_connections, connection_stats
+from football.models import Team
+
+
+class TestConnectionHealthChecks(TestCase):
+    def start_request(self):
+        # only this receiver: Django's own 'close_old_connections()' would close the test connection.
+        check_connections(sender=self.__class__)
+
+    def tearDown(self):
+        connection.__dict__.pop("ensure_connection", None)
+        connection.health_check_pending = False
+
+    @pytest.mark.django_db
+    @override_settings(DATABASE_CONN_HEALTH_CHECKS=True)
+    def test_broken_connection_is_closed(self):
+        connection.ensure_connection()
+
+        with patch.dict(connection.settings_dict, CONN_MAX_AGE=60), \
+                patch.object(connection, "is_usable", return_value=False), \
+                patch.object(connection, "close") as close:
+            self.start_request()
+            close.assert_not_called()
+
+            # on the request's first use.
+            connection.ensure_connection()
+            connection.ensure_connection()
+
+        close.assert_called_once()
+        self.assertGreaterEqual(connection_stats()["health_check_failures"], 1)
+
+    @pytest.mark.django_db
+    @override_settings(DATABASE_CONN_HEALTH_CHECKS=True)
+    def test_usable_connection_is_kept(self):
+        connection.ensure_connection()
+
+        with patch.dict(connection.settings_dict, CONN_MAX_AGE=60), patch.object(connection, "close") as close:
+            self.start_request()
+            Team.objects.count()
+
+        close.assert_not_called()
+
+    @pytest.mark.django_db
+    @override_settings(DATABASE_CONN_HEALTH_CHECKS=True)
+    def test_cached_response_without_queries(self):
+        url = reverse("team-list-create")
+        self.client.get(url)
+
+        with patch.dict(connection.settings_dict, CONN_MAX_AGE=60), \
+                patch.object(connection, "is_usable", return_value=True) as is_usable:
+            with self.assertNumQueries(0):
+                self.client.get(url)
+            is_usable.assert_not_called()
+
+            with override_settings(RESPONSE_CACHE_TIMEOUT=0):
+                self.client.get(url)
+            is_usable.assert_called_once()
+
+    def test_stats(self):
+        requests = connection_stats()["requests"]
+        self.start_request()
+
+        stats = connection_stats()
+        self.assertEqual(stats["requests"], requests + 1)
+        self.assertTrue(0 <= stats["reuse_rate"] <= 1)
@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+
+import pytest
+from django.core.management import call_command
+from django.test import TestCase
+
+from football.dataset import generate, player_rows, team_rows
+from football.denormalize import stale_names
+from football.models import League, Team, Player
+from football.stats import check_stats
+
+
+class TestDataset(TestCase):
+
+    @pytest.mark.django_db
+    def test_generate(self):
+        self.assertEqual(generate(2, 3, 4, batch_size=5), (2, 6, 24))
+
+        self.assertEqual(League.objects.count(), 2)
+        self.assertEqual(set(League.objects.values_list("number_of_teams", flat=True)), {3})
+        self.assertEqual(set(Team.objects.values_list("number_of_players", flat=True)), {4})
+
+        # referentially consistent: every team has its league's share, every player a team.
+        for league in League.objects.all():
+            self.assertEqual(league.team_set.count(), 3)
+        for team in Team.objects.all():
+            self.assertEqual(team.player_set.count(), 4)
+        self.assertFalse(Player.objects.filter(team=None).exists())
+
+        self.assertEqual(check_stats(), [])
+        self.assertFalse(stale_names(Player).exists() or stale_names(Team).exists())
+
+    def test_deterministic(self):
+        self.assertEqual(list(player_rows(50, seed=7)), list(player_rows(50, seed=7)))
+        self.assertNotEqual(list(player_rows(50, seed=7)), list(player_rows(50, seed=8)))
+
+        names = [row["name"] for row in team_rows(500)]
+        self.assertEqual(len(set(names)), 500)
+
+
+class TestGenerateData(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_command(self, *args):
+        call_command("generate_data", *args, stdout=io.StringIO())
+
+    def read(self, path):
+        with open(path, encoding="utf-8") as file:
+            return file.read()
+
+    @pytest.mark.django_db
+    def test_database(self):
+        self.run_command("--leagues=2", "--teams-per-league=2", "--players-per-team=10", "--batch-size=7")
+
+        self.assertEqual(League.objects.count(), 2)
+        self.assertEqual(Team.objects.count(), 4)
+        self.assertEqual(Player.objects.count(), 40)
+        self.assertEqual(check_stats(), [])
+
+    @pytest.mark.django_db
+    def test_files_import(self):
+        for file_format in ("csv", "jsonl"):
+            output = os.path.join(self.directory.name, file_format)
+            self.run_command("--leagues=2", "--teams-per-league=3", "--players-per-team=5", f"--output={output}", f"--format={file_format}")
+
+            for resource in ("leagues", "teams", "players"):
+                call_command("import_data", resource, os.path.join(output, f"{resource}.{file_format}"), stdout=io.StringIO(), stderr=io.StringIO())
+
+        # the same rows, whether loaded directly or through either file format.
+        self.assertEqual(Player.objects.count(), 60)
+        for team in Team.objects.all():
+            self.assertEqual(team.player_set.count(), 5)
+        self.assertEqual(check_stats(), [])
+        self.assertFalse(stale_names(Player).exists() or stale_names(Team).exists())
+
+    def test_deterministic(self):
+        for name in ("a", "b", "c"):
+            seed = 2 if name == "c" else 1
+            self.run_command("--leagues=1", "--teams-per-league=2", "--players-per-team=20", f"--seed={seed}", f"--output={os.path.join(self.directory.name, name)}")
+
+        files = {name: self.read(os.path.join(self.directory.name, name, "players.csv")) for name in ("a", "b", "c")}
+        self.assertEqual(files["a"], files["b"])
+        self.assertNotEqual(files["a"], files["c"])
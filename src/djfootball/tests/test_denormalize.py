@@ -0,0 +1,91 @@
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.denormalize import stale_names
+from football.models import League, Team, Player
+
+from conftest import player_data
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class TestDenormalizedNames(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18)
+        self.team = Team.objects.create(name="Porto", city="Porto", championships_won=30, coach="Treinador", number_of_players=25, league=self.league)
+        self.other = Team.objects.create(name="Braga", city="Braga", championships_won=0, coach="Mister", number_of_players=25)
+        self.player = Player.objects.create(**player_data("Pepe"), team=self.team)
+
+    def assertConsistent(self):
+        self.assertFalse(stale_names(Player).exists())
+        self.assertFalse(stale_names(Team).exists())
+
+    @pytest.mark.django_db
+    def test_saves(self):
+        self.assertEqual(Player.objects.get().team_name, "Porto")
+        self.assertEqual(Team.objects.get(pk=self.team.pk).league_name, "Liga")
+
+        self.player.team = self.other
+        self.player.save(update_fields=["team"])
+        self.assertEqual(Player.objects.get().team_name, "Braga")
+
+        self.player.team = None
+        self.player.save()
+        self.assertIsNone(Player.objects.get().team_name)
+        self.assertConsistent()
+
+    @pytest.mark.django_db
+    def test_renames(self):
+        response = self.client.patch(reverse("team-retrieve-update-destroy", kwargs={"pk": self.team.pk}), {"name": "FC Porto"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Player.objects.get().team_name, "FC Porto")
+
+        response = self.client.patch(reverse("league-list-create"), [{"id": self.league.pk, "name": "Liga Portugal"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Team.objects.get(pk=self.team.pk).league_name, "Liga Portugal")
+
+        self.assertEqual(self.client.get(reverse("player-list-create")).json()[0]["team"], "FC Porto")
+        self.assertEqual(self.client.get(reverse("team-list-create") + "?name=fc porto").json()[0]["league"], "Liga Portugal")
+        self.assertConsistent()
+
+    @pytest.mark.django_db
+    def test_deletes(self):
+        self.league.delete()
+        self.team.delete()
+
+        self.assertIsNone(Player.objects.get().team_name)
+        self.assertConsistent()
+
+    @pytest.mark.django_db
+    def test_single_table_lists(self):
+        for url in (reverse("player-list-create") + "?page=1", reverse("team-list-create") + "?page=1"):
+            with CaptureQueriesContext(connection) as context:
+                self.client.get(url)
+            self.assertFalse(any("JOIN" in query["sql"] for query in context.captured_queries), url)
+
+        with override_settings(DENORMALIZED_NAMES=False), CaptureQueriesContext(connection) as context:
+            data = self.client.get(reverse("player-list-create")).json()
+        self.assertEqual(data[0]["team"], "Porto")
+        self.assertIn("JOIN", context.captured_queries[-1]["sql"])
+
+    @pytest.mark.django_db
+    def test_backfill(self):
+        # around every maintained write path.
+        Player.objects.update(team=self.other)
+        self.assertTrue(stale_names(Player).exists())
+
+        with self.assertRaises(CommandError):
+            call_command("backfill_names", "--check", stdout=io.StringIO(), stderr=io.StringIO())
+
+        call_command("backfill_names", "--batch-size=1", stdout=io.StringIO())
+        self.assertEqual(Player.objects.get().team_name, "Braga")
+        self.assertConsistent()
+        call_command("backfill_names", "--check", stdout=io.StringIO())
@@ -0,0 +1,84 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import League, Team, Player
+
+
+# measures the database work itself, not the response cache.
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class TestExpand(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+
+    def add_teams(self, count, players_per_team=3):
+        for i in range(count):
+            team = Team.objects.create(
+                name=f"Equipa {i}", city="Porto", championships_won=i, coach="Treinador", number_of_players=25, league=self.league
+            )
+            Player.objects.bulk_create(
+                Player(name=f"Jogador {i}.{j}", age=20, position="Atacante", appearances=j, team=team)
+                for j in range(players_per_team)
+            )
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json(), len(context.captured_queries)
+
+    @pytest.mark.django_db
+    def test_league_tree(self):
+        self.add_teams(2, players_per_team=2)
+
+        data, _ = self.get(reverse("league-retrieve-update-destroy", kwargs={"pk": self.league.id}) + "?expand=teams,teams.players")
+
+        self.assertEqual(data["name"], "Liga")
+        self.assertEqual([team["name"] for team in data["teams"]], ["Equipa 0", "Equipa 1"])
+        self.assertEqual([player["name"] for player in data["teams"][1]["players"]], ["Jogador 1.0", "Jogador 1.1"])
+        self.assertEqual(data["teams"][1]["players"][0]["team"], "Equipa 1")
+
+    @pytest.mark.django_db
+    def test_one_query_per_level(self):
+        url = reverse("league-retrieve-update-destroy", kwargs={"pk": self.league.id}) + "?expand=teams.players"
+
+        self.add_teams(1)
+        _, small = self.get(url)
+
+        self.add_teams(10)
+        data, large = self.get(url)
+
+        self.assertEqual(len(data["teams"]), 11)
+        self.assertEqual(small, large)
+        # league, teams, players.
+        self.assertEqual(large, 3)
+
+    @pytest.mark.django_db
+    def test_team_players(self):
+        self.add_teams(1, players_per_team=2)
+        team = Team.objects.get()
+
+        data, queries = self.get(reverse("team-retrieve-update-destroy", kwargs={"pk": team.id}) + "?expand=players&fields=name")
+
+        self.assertEqual(set(data), {"name", "players"})
+        self.assertEqual(len(data["players"]), 2)
+        self.assertEqual(queries, 2)
+
+    @pytest.mark.django_db
+    def test_without_expand(self):
+        data, _ = self.get(reverse("league-retrieve-update-destroy", kwargs={"pk": self.league.id}))
+
+        self.assertNotIn("teams", data)
+
+    @pytest.mark.django_db
+    def test_unknown_expansion(self):
+        response = self.client.get(reverse("team-retrieve-update-destroy", kwargs={"pk": 1}) + "?expand=teams")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {"expand": ["Unknown expansion 'teams'."]})
@@ -0,0 +1,92 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import League, Team, Player
+
+
+class TestPlayerFilter(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        liga = League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+        porto = Team.objects.create(name="Porto", city="Porto", championships_won=30, coach="Treinador", number_of_players=25, league=liga)
+        braga = Team.objects.create(name="Braga", city="Braga", championships_won=0, coach="Mister", number_of_players=25)
+
+        Player.objects.create(name="Pepe", age=38, position="Defesa", appearances=600, team=porto)
+        Player.objects.create(name="Diogo", age=25, position="Atacante", appearances=120, team=porto)
+        Player.objects.create(name="Ricardo", age=25, position="Atacante", appearances=300, team=braga)
+        Player.objects.create(name="Livre", age=19, position="Defesa", appearances=3)
+
+        self.porto, self.liga = porto, liga
+
+    def names(self, query):
+        response = self.client.get(reverse("player-list-create") + query)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [player["name"] for player in response.json()]
+
+    @pytest.mark.django_db
+    def test_ranges(self):
+        self.assertEqual(self.names("?age_min=20&age_max=30"), ["Diogo", "Ricardo"])
+        self.assertEqual(self.names("?appearances_min=300"), ["Pepe", "Ricardo"])
+
+    @pytest.mark.django_db
+    def test_position_team_and_league(self):
+        self.assertEqual(self.names("?position=defesa"), ["Pepe", "Livre"])
+        self.assertEqual(self.names(f"?team={self.porto.id}"), ["Pepe", "Diogo"])
+        self.assertEqual(self.names(f"?league={self.liga.id}&position=atacante"), ["Diogo"])
+
+    @pytest.mark.django_db
+    def test_ordering(self):
+        self.assertEqual(self.names("?ordering=-appearances"), ["Pepe", "Ricardo", "Diogo", "Livre"])
+        # ties broken by id.
+        self.assertEqual(self.names("?ordering=age"), ["Livre", "Diogo", "Ricardo", "Pepe"])
+        self.assertEqual(self.names("?ordering=-age,name"), ["Pepe", "Diogo", "Ricardo", "Livre"])
+
+    @pytest.mark.django_db
+    def test_invalid_values(self):
+        # rejected, rather than answered with every player.
+        for query, field in (("?position=defesa&ordering=position", "ordering"), ("?position=defesa&age_min=abc", "age")):
+            response = self.client.get(reverse("player-list-create") + query)
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(field, response.json())
+
+    @pytest.mark.django_db
+    def test_paginated(self):
+        response = self.client.get(reverse("player-list-create") + "?ordering=name&page=1&per_page=2")
+
+        self.assertEqual([player["name"] for player in response.json()["results"]], ["Diogo", "Livre"])
+
+
+class TestLeagueFilter(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+        League.objects.create(name="La Liga", country="Spain", number_of_teams=20, current_champion=None)
+        League.objects.create(name="Segunda Liga", country="Portugal", number_of_teams=18, current_champion=None)
+
+    def names(self, query):
+        response = self.client.get(reverse("league-list-create") + query)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [league["name"] for league in response.json()]
+
+    @pytest.mark.django_db
+    def test_filters(self):
+        self.assertEqual(self.names("?country=portugal"), ["Liga", "Segunda Liga"])
+        self.assertEqual(self.names("?number_of_teams_min=19"), ["La Liga"])
+        self.assertEqual(self.names("?number_of_teams_max=18&country=Portugal"), ["Liga", "Segunda Liga"])
+
+    @pytest.mark.django_db
+    def test_ordering(self):
+        self.assertEqual(self.names("?ordering=name"), ["La Liga", "Liga", "Segunda Liga"])
+        self.assertEqual(self.names("?ordering=-number_of_teams"), ["La Liga", "Segunda Liga", "Liga"])
+
+    @pytest.mark.django_db
+    def test_invalid_values(self):
+        response = self.client.get(reverse("league-list-create") + "?country=portugal&ordering=country")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.json())
@@ -0,0 +1,59 @@
+import io
+import json
+import os
+import tempfile
+
+import pytest
+from django.core.management import call_command
+from django.test import TestCase
+
+from football.models import League, Team, Player
+from football.stats import check_stats
+
+
+class TestImportData(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+
+        return path
+
+    def run_import(self, *args):
+        call_command("import_data", *args, stdout=io.StringIO(), stderr=io.StringIO())
+
+    @pytest.mark.django_db
+    def test_csv_with_relations(self):
+        leagues = self.write("leagues.csv", "name,country,number_of_teams,current_champion\nLiga,Portugal,18,\n")
+        teams = self.write(
+            "teams.csv",
+            "name,city,championships_won,coach,number_of_players,league\n"
+            "Equipa,Porto,30,Treinador,25,Liga\n"
+            "Clube,Lisboa,many,Mister,25,Liga\n"
+            "Outro,Braga,1,Mister,25,Unknown\n",
+        )
+
+        self.run_import("leagues", leagues)
+        self.run_import("teams", teams, "--batch-size", "2")
+
+        self.assertIsNone(League.objects.get().current_champion)
+        self.assertEqual(list(Team.objects.values_list("name", "league__name")), [("Equipa", "Liga")])
+
+    @pytest.mark.django_db
+    def test_jsonl_resumes_from_checkpoint(self):
+        rows = [{"name": f"Jogador {i}", "age": 20, "position": "Atacante", "appearances": i} for i in range(5)]
+        players = self.write("players.jsonl", "\n".join(json.dumps(row) for row in rows))
+        self.write("players.jsonl.checkpoint", json.dumps({"rows": 3}))
+
+        self.run_import("players", players)
+
+        self.assertEqual(list(Player.objects.values_list("name", flat=True)), ["Jogador 3", "Jogador 4"])
+        self.assertFalse(os.path.exists(players + ".checkpoint"))
+        # imported rows are counted in the Player statistics.
+        self.assertEqual(check_stats(), [])
@@ -0,0 +1,59 @@
+import pytest
+from django.db import connection
+from django.test import TestCase
+
+from football.api.filters import PlayerFilter, LeagueFilter
+from football.models import League, Team, Player
+
+
+class TestCaseInsensitiveIndexes(TestCase):
+    """
+        Checks, through the query plan, that the filter and lookup paths are served by an index.
+    """
+
+    def assertUsesIndex(self, queryset, index_name):
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                # tiny test tables would otherwise always be sequentially scanned.
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+            plan = queryset.explain()
+
+        self.assertIn(index_name, plan)
+
+    @pytest.mark.django_db
+    def test_team_filters(self):
+        self.assertUsesIndex(Team.objects.filter(name__iexact="equipa"), "team_name_ci_idx")
+        self.assertUsesIndex(Team.objects.filter(city__iexact="porto"), "team_city_ci_idx")
+        self.assertUsesIndex(Team.objects.filter(coach__iexact="treinador"), "team_coach_ci_idx")
+        self.assertUsesIndex(Team.objects.filter(championships_won=1), "team_championships_idx")
+        self.assertUsesIndex(Team.objects.filter(number_of_players=25), "team_number_of_players_idx")
+
+    @pytest.mark.django_db
+    def test_player_name(self):
+        self.assertUsesIndex(Player.objects.filter(name__iexact="jogador"), "player_name_ci_idx")
+
+    @pytest.mark.django_db
+    def test_foreign_keys(self):
+        self.assertUsesIndex(Player.objects.filter(team_id=1), "Player_team_id")
+        self.assertUsesIndex(Team.objects.filter(league_id=1), "Team_league_id")
+
+    @pytest.mark.django_db
+    def test_player_filters(self):
+        def filtered(query):
+            return PlayerFilter(query, queryset=Player.objects.order_by("id")).qs
+
+        self.assertUsesIndex(filtered({"age_min": 20, "age_max": 25}), "player_age_idx")
+        self.assertUsesIndex(filtered({"appearances_min": 100, "appearances_max": 200}), "player_appearances_idx")
+        self.assertUsesIndex(filtered({"position": "defesa"}), "player_position_ci_idx")
+        self.assertUsesIndex(filtered({"ordering": "-age"}), "player_age_idx")
+        self.assertUsesIndex(filtered({"ordering": "name"}), "player_name_idx")
+
+    @pytest.mark.django_db
+    def test_league_filters(self):
+        def filtered(query):
+            return LeagueFilter(query, queryset=League.objects.order_by("id")).qs
+
+        self.assertUsesIndex(filtered({"country": "portugal"}), "league_country_ci_idx")
+        self.assertUsesIndex(filtered({"number_of_teams_min": 18, "number_of_teams_max": 20}), "league_number_of_teams_idx")
+        self.assertUsesIndex(filtered({"ordering": "name"}), "league_name_idx")
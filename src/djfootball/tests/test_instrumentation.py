@@ -0,0 +1,77 @@
+import re
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from football.instrumentation import InstrumentationMiddleware, N_PLUS_ONE_THRESHOLD
+from football.models import Team, Player
+
+
+def server_timing(response):
+    return dict(
+        (match["name"], (match["desc"], float(match["dur"])))
+        for match in re.finditer(r'(?P<name>\w+);(?:desc="(?P<desc>[^"]*)";)?dur=(?P<dur>[\d.]+)', response["Server-Timing"])
+    )
+
+
+# measures the database work itself, not the response cache.
+@override_settings(RESPONSE_CACHE_TIMEOUT=0, SERVER_TIMING=True)
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        team = Team.objects.create(name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25)
+        self.player = Player.objects.create(name="Jogador", age=27, position="Atacante", appearances=200, team=team)
+
+    @pytest.mark.django_db
+    def test_server_timing(self):
+        response = self.client.get(reverse("player-retrieve-update-destroy", kwargs={"pk": self.player.id}))
+        timings = server_timing(response)
+
+        self.assertEqual(set(timings), {"db", "serialize", "render", "total"})
+        self.assertEqual(timings["db"][0], "1 queries")
+        self.assertGreaterEqual(timings["total"][1], timings["db"][1])
+
+    @pytest.mark.django_db
+    @override_settings(SERVER_TIMING=False)
+    def test_server_timing_disabled(self):
+        response = self.client.get(reverse("player-list-create"))
+
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @pytest.mark.django_db
+    async def test_asgi_queries_are_attributed(self):
+        # the view runs in a 'sync_to_async()' thread: the request's context has to follow it there.
+        response = await self.async_client.get(reverse("player-list-create"))
+
+        self.assertEqual(server_timing(response)["db"][0], "1 queries")
+
+    @pytest.mark.django_db
+    def test_metrics(self):
+        self.client.get(reverse("player-list-create"))
+
+        response = self.client.get(reverse("metrics"))
+        content = response.content.decode()
+
+        self.assertEqual(response["Content-Type"], "text/plain; version=0.0.4")
+        self.assertRegex(content, r'djfootball_request_duration_seconds_bucket\{method="GET",route="api/players/",le="\+Inf"\} [1-9]')
+        self.assertRegex(content, r'djfootball_db_queries_total\{method="GET",route="api/players/"\} [1-9]')
+        self.assertIn("djfootball_db_connection_reuse_ratio", content)
+
+    @pytest.mark.django_db
+    def test_n_plus_one_is_logged(self):
+        def view(request):
+            for player in Player.objects.all()[:1]:
+                for _ in range(N_PLUS_ONE_THRESHOLD):
+                    Team.objects.get(pk=player.team_id)
+
+            return HttpResponse()
+
+        request = RequestFactory().get("/")
+        request.resolver_match = None
+
+        with self.assertLogs("football.instrumentation", "WARNING") as logs:
+            InstrumentationMiddleware(view)(request)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn(f"{N_PLUS_ONE_THRESHOLD} x SELECT", logs.output[0])
@@ -0,0 +1,117 @@
+from urllib.parse import urlencode
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.api.player_leagues import MAX_PLAYER_NAMES
+from football.models import League, Team, Player
+
+from conftest import SHARED_CACHES, player_data
+
+
+# measures the resolution path itself, not the response cache.
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class TestPlayerLeagues(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.liga = League.objects.create(name="Liga", country="Portugal", number_of_teams=18)
+        self.laliga = League.objects.create(name="LaLiga", country="Espanha", number_of_teams=20)
+        self.porto = Team.objects.create(name="Porto", city="Porto", championships_won=30, coach="Treinador", number_of_players=25, league=self.liga)
+        self.sevilla = Team.objects.create(name="Sevilla", city="Sevilha", championships_won=1, coach="Mister", number_of_players=25, league=self.laliga)
+        self.amateur = Team.objects.create(name="Amador", city="Braga", championships_won=0, coach="Mister", number_of_players=25)
+
+        # two players share a name, in different leagues.
+        Player.objects.create(**player_data("João Silva"), team=self.sevilla)
+        Player.objects.create(**player_data("João Silva"), team=self.porto)
+        Player.objects.create(**player_data("Pepe"), team=self.porto)
+        Player.objects.create(**player_data("Sem Equipa"))
+        Player.objects.create(**player_data("Amador"), team=self.amateur)
+
+    def get(self, *names, **params):
+        response = self.client.get(reverse("league-list-create") + "?" + urlencode([("player_name", name) for name in names] + list(params.items())))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response.json()
+
+    @pytest.mark.django_db
+    def test_shared_name(self):
+        data = self.get("joão silva")
+
+        # every league of the name, by id (was a 500: MultipleObjectsReturned).
+        self.assertEqual([league["id"] for league in data["results"]], [self.liga.id, self.laliga.id])
+        self.assertEqual((data["missing"], data["no_league"]), ([], []))
+
+    @pytest.mark.django_db
+    def test_several_names(self):
+        data = self.get("Pepe", "  João SILVA ", "Ninguém", "Sem Equipa", "Amador", "pepe", fields="name")
+
+        self.assertEqual(data["results"], [{"name": "Liga"}, {"name": "LaLiga"}])
+        self.assertEqual(data["missing"], ["Ninguém"])
+        # no team, or a team outside any league: reported rather than an empty '{}'.
+        self.assertEqual(data["no_league"], ["Sem Equipa", "Amador"])
+
+    @pytest.mark.django_db
+    def test_names_as_stored(self):
+        # neither casefolded ('ß' -> 'ss') nor with their whitespace collapsed.
+        Player.objects.create(**player_data("Thomas Straße"), team=self.porto)
+        Player.objects.create(**player_data("Joao  Felix"), team=self.sevilla)
+
+        data = self.get("Thomas Straße", "Joao  Felix", "Joao Felix")
+
+        self.assertEqual([league["id"] for league in data["results"]], [self.liga.id, self.laliga.id])
+        self.assertEqual(data["missing"], ["Joao Felix"])
+
+    @pytest.mark.django_db
+    def test_too_many_names(self):
+        response = self.client.get(reverse("league-list-create") + "?" + urlencode([("player_name", f"Jogador {i}") for i in range(MAX_PLAYER_NAMES + 1)]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @pytest.mark.django_db
+    @override_settings(CACHES=SHARED_CACHES)
+    def test_cached_resolution(self):
+        cache.clear()
+        self.get("Pepe", "João Silva")
+
+        # names resolved once: only the leagues are read again.
+        with CaptureQueriesContext(connection) as context:
+            self.get("pepe", "joão silva")
+        self.assertEqual(len(context.captured_queries), 1)
+
+    @pytest.mark.django_db
+    def test_local_cache(self):
+        self.get("Pepe")
+
+        # e.g. another worker's write, which this process' versions don't see: nothing is remembered.
+        Player.objects.filter(name="Pepe").update(team=self.sevilla)
+
+        self.assertEqual(self.get("Pepe")["results"][0]["id"], self.laliga.id)
+
+    @pytest.mark.django_db
+    @override_settings(CACHES=SHARED_CACHES)
+    def test_invalidation(self):
+        cache.clear()
+        self.assertEqual(self.get("Pepe")["results"][0]["id"], self.liga.id)
+
+        self.porto.league = self.laliga
+        self.porto.save()
+        self.assertEqual(self.get("Pepe")["results"][0]["id"], self.laliga.id)
+
+        Player.objects.filter(name="Pepe").get().delete()
+        self.assertEqual(self.get("Pepe")["missing"], ["Pepe"])
+
+    @pytest.mark.django_db
+    def test_cached_response_invalidation(self):
+        # the last 'player_name' empty: the lookup still depends on the Player and Team tables.
+        with override_settings(RESPONSE_CACHE_TIMEOUT=60):
+            self.assertEqual(self.get("Pepe", "")["results"][0]["id"], self.liga.id)
+
+            self.porto.league = self.laliga
+            self.porto.save()
+            self.assertEqual(self.get("Pepe", "")["results"][0]["id"], self.laliga.id)
@@ -1,3 +1,4 @@
+import json
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -92,3 +93,71 @@ class TestPlayerRetrieveUpdateDestroy(APITestCase):
         self.assertEqual(Player.objects.count(), total_players - 1)
 
 
+class TestPlayerCursorPagination(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        Player.objects.bulk_create(
+            Player(name=f"Jogador {i}", age=27, position="Atacante", appearances=i) for i in range(5)
+        )
+
+    @pytest.mark.django_db
+    def test_walk_pages(self):
+        url = reverse("player-list-create") + "?cursor=&per_page=2"
+
+        names = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.json())
+
+            names += [player["name"] for player in response.json()["results"]]
+            url = response.json()["next"]
+
+        self.assertEqual(names, [f"Jogador {i}" for i in range(5)])
+
+    @pytest.mark.django_db
+    def test_ordering(self):
+        response = self.client.get(reverse("player-list-create") + "?cursor=&ordering=-appearances")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.json())
+
+        # an empty '?ordering=' is no ordering.
+        response = self.client.get(reverse("player-list-create") + "?cursor=&ordering=")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestPlayerStreaming(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        Player.objects.bulk_create(
+            Player(name=f"Jogador {i}", age=27, position="Atacante", appearances=i) for i in range(5)
+        )
+
+    @pytest.mark.django_db
+    def test_stream(self):
+        url = reverse("player-list-create")
+        response = self.client.get(url + "?stream=1")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+
+        content = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(content, self.client.get(url).json())
+
+    @pytest.mark.django_db
+    def test_stream_empty(self):
+        Player.objects.all().delete()
+        response = self.client.get(reverse("player-list-create") + "?stream=1")
+
+        self.assertEqual(json.loads(b"".join(response.streaming_content)), [])
+
+    @pytest.mark.django_db
+    def test_stream_false(self):
+        url = reverse("player-list-create")
+
+        for value in ("0", "false", "no"):
+            response = self.client.get(url + f"?stream={value}")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(response.streaming)
+            self.assertEqual(response.json(), self.client.get(url).json())
@@ -0,0 +1,91 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import League, Team, Player
+
+
+class ConstantQueryCountMixin:
+    """
+        Asserts that hitting an URL issues the same number of queries no matter how many rows exist.
+    """
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def assertConstantQueries(self, url, add_rows, expected=None):
+        add_rows(2)
+        small = self.count_queries(url)
+
+        add_rows(20)
+        large = self.count_queries(url)
+
+        self.assertEqual(small, large)
+        if expected is not None:
+            self.assertEqual(large, expected)
+
+
+# measures the database work itself, not the response cache.
+@override_settings(RESPONSE_CACHE_TIMEOUT=0)
+class TestListQueryCount(ConstantQueryCountMixin, APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18)
+        self.team = Team.objects.create(
+            name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25, league=self.league
+        )
+
+    def add_leagues(self, total):
+        League.objects.bulk_create(
+            League(name=f"Liga {i}", country="Portugal", number_of_teams=18) for i in range(total)
+        )
+
+    def add_teams(self, total):
+        Team.objects.bulk_create(
+            Team(name=f"Equipa {i}", city="Porto", championships_won=0, coach="Treinador", number_of_players=25, league=self.league)
+            for i in range(total)
+        )
+
+    def add_players(self, total):
+        Player.objects.bulk_create(
+            Player(name=f"Jogador {i}", age=25, position="Atacante", appearances=10, team=self.team)
+            for i in range(total)
+        )
+
+    @pytest.mark.django_db
+    def test_leagues(self):
+        self.assertConstantQueries(reverse("league-list-create"), self.add_leagues, expected=1)
+
+    @pytest.mark.django_db
+    def test_teams(self):
+        self.assertConstantQueries(reverse("team-list-create"), self.add_teams, expected=1)
+
+    @pytest.mark.django_db
+    def test_players(self):
+        self.assertConstantQueries(reverse("player-list-create"), self.add_players, expected=1)
+
+    @pytest.mark.django_db
+    def test_players_paginated(self):
+        url = reverse("player-list-create") + "?page=1&per_page=10"
+        self.assertConstantQueries(url, self.add_players)
+
+    @pytest.mark.django_db
+    def test_player_detail(self):
+        player = Player.objects.create(name="Jogador", age=25, position="Atacante", appearances=10, team=self.team)
+        url = reverse("player-retrieve-update-destroy", kwargs={"pk": player.id})
+
+        self.assertEqual(self.count_queries(url), 1)
+        self.assertEqual(self.client.get(url).json()["team"], "Equipa")
+
+    @pytest.mark.django_db
+    def test_players_cursor(self):
+        url = reverse("player-list-create") + "?cursor=&per_page=10"
+        self.assertConstantQueries(url, self.add_players, expected=1)
@@ -0,0 +1,43 @@
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from football.api import renderers
+from football.api.renderers import JsonResponse, dumps
+
+
+class TestDumps(SimpleTestCase):
+    data = {"name": "Jogador Ünico", "age": 27, "value": Decimal("1.50"), "when": timezone.now(), "tags": [None, True]}
+
+    def test_backends_agree(self):
+        with patch.object(renderers, "orjson", None):
+            stdlib = dumps(self.data)
+
+        self.assertIsInstance(stdlib, bytes)
+        self.assertEqual(json.loads(dumps(self.data)), json.loads(stdlib))
+
+    def test_json_response(self):
+        response = JsonResponse([1, 2], safe=False)
+
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), [1, 2])
+
+        with self.assertRaises(TypeError):
+            JsonResponse([1, 2])
+
+
+class TestPaginatedRendering(APITestCase):
+    @pytest.mark.django_db
+    def test_paginated_response_uses_json_renderer(self):
+        with patch.object(renderers, "dumps", wraps=renderers.dumps) as dumps_mock:
+            response = self.client.get(reverse("player-list-create") + "?page=1")
+
+        self.assertEqual(response.json()["results"], [])
+        dumps_mock.assert_called()
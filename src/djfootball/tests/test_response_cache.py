@@ -0,0 +1,118 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import League, Team, Player
+
+from conftest import SHARED_CACHES
+
+
+class TestResponseCache(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18)
+        self.team = Team.objects.create(
+            name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25, league=self.league
+        )
+        self.player = Player.objects.create(name="Jogador", age=25, position="Atacante", appearances=10, team=self.team)
+
+    @pytest.mark.django_db
+    def test_cached_list(self):
+        url = reverse("player-list-create")
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(url)
+
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.json(), response.json())
+
+    @pytest.mark.django_db
+    def test_normalized_query_params(self):
+        url = reverse("player-list-create")
+        self.client.get(url + "?page=1&per_page=5")
+
+        with self.assertNumQueries(0):
+            self.client.get(url + "?per_page=5&page=1")
+
+    @pytest.mark.django_db
+    def test_write_invalidates_detail(self):
+        url = reverse("player-retrieve-update-destroy", kwargs={"pk": self.player.id})
+        self.client.get(url)
+
+        self.client.patch(url, {"appearances": 11}, format="json")
+
+        self.assertEqual(self.client.get(url).json()["appearances"], 11)
+
+    @pytest.mark.django_db
+    def test_team_rename_invalidates_players(self):
+        url = reverse("player-list-create")
+        self.assertEqual(self.client.get(url).json()[0]["team"], "Equipa")
+
+        self.client.patch(
+            reverse("team-retrieve-update-destroy", kwargs={"pk": self.team.id}), {"name": "Clube"}, format="json"
+        )
+
+        self.assertEqual(self.client.get(url).json()[0]["team"], "Clube")
+
+    @pytest.mark.django_db
+    def test_model_signal_invalidates(self):
+        url = reverse("team-list-create")
+        self.assertEqual(self.client.get(url).json()[0]["league"], "Liga")
+
+        self.league.name = "Primeira Liga"
+        self.league.save()
+
+        self.assertEqual(self.client.get(url).json()[0]["league"], "Primeira Liga")
+
+
+@override_settings(RESPONSE_CACHE_TIMEOUT=0, CACHES=SHARED_CACHES)
+class TestConditionalGet(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        cache.clear()
+        self.team = Team.objects.create(
+            name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25
+        )
+
+    @pytest.mark.django_db
+    def test_etag(self):
+        url = reverse("team-list-create")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @pytest.mark.django_db
+    def test_etag_changes_on_write(self):
+        url = reverse("team-retrieve-update-destroy", kwargs={"pk": self.team.id})
+        etag = self.client.get(url)["ETag"]
+
+        self.client.patch(url, {"coach": "Mister"}, format="json")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @pytest.mark.django_db
+    def test_no_last_modified(self):
+        # one second resolution: a write within the second of the response would still be '304'.
+        response = self.client.get(reverse("team-list-create"))
+
+        self.assertNotIn("Last-Modified", response)
+
+    @pytest.mark.django_db
+    def test_no_etag_with_a_local_cache(self):
+        # a process-local cache doesn't see other workers' writes: its versions can't vouch for the data.
+        with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+            url = reverse("team-list-create")
+            response = self.client.get(url)
+            self.assertNotIn("ETag", response)
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH="*")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,156 @@
+import pytest
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.api import search
+from football.api.search import TrigramIndex, similarity, trigrams
+from football.models import League, Team, Player
+
+from conftest import SHARED_CACHES
+
+
+class TestTrigramIndex(TestCase):
+    def setUp(self):
+        self.index = TrigramIndex([
+            (1, "Cristiano Ronaldo"),
+            (2, "Ronaldinho"),
+            (3, "Rui Costa"),
+            (4, "Ronald Koeman"),
+            (5, None),
+        ])
+
+    def test_trigrams_match_pg_trgm(self):
+        # SELECT show_trgm('Rui') -> {"  r"," ru","rui","ui "}
+        self.assertEqual(trigrams("Rui"), {"  r", " ru", "rui", "ui "})
+
+    def test_similarity(self):
+        self.assertEqual(similarity(trigrams("ronaldo"), trigrams("Ronaldo")), 1.0)
+        self.assertEqual(similarity(set(), trigrams("x")), 0.0)
+
+    def test_prefix(self):
+        self.assertEqual(self.index.prefix("ronald", 10), [(4, "Ronald Koeman"), (2, "Ronaldinho")])
+        self.assertEqual(self.index.prefix("ronald", 1), [(4, "Ronald Koeman")])
+        self.assertEqual(self.index.prefix("zz", 10), [])
+
+    def test_fuzzy(self):
+        matches = self.index.fuzzy("cristiano ronaldu", 10)
+
+        self.assertEqual(matches[0], (1, "Cristiano Ronaldo"))
+        self.assertNotIn((3, "Rui Costa"), matches)
+
+    def test_fuzzy_matches_a_full_scan(self):
+        first_names, last_names = ("Rui", "Ruben", "Joao", "Jota", "Bruno"), ("Dias", "Diaz", "Neves", "Costa", "Felix")
+        # the numbers' trigrams are sparse posting lists, made bitmaps when queried.
+        names = [f"{first} {last} {i}" for i in range(40) for first in first_names for last in last_names]
+        index = TrigramIndex(list(enumerate(names)))
+
+        for query in ("rui dias", "joao felis 12", "ruben neves 3", "bruno"):
+            query_trigrams = trigrams(query)
+            scored = sorted(((similarity(query_trigrams, trigrams(name.casefold())), position) for position, name in enumerate(names)), reverse=True)
+
+            self.assertEqual(index.fuzzy(query, 5), [(position, names[position]) for score, position in scored if score >= 0.3][:5])
+
+    def test_fuzzy_empty(self):
+        self.assertEqual(TrigramIndex([]).fuzzy("rui", 10), [])
+        self.assertEqual(self.index.fuzzy("", 10), [])
+
+
+class TestSearchView(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga Portugal", country="Portugal", number_of_teams=18, current_champion=None)
+        self.team = Team.objects.create(
+            name="Porto", city="Porto", championships_won=30, coach="Sergio Conceicao", number_of_players=25, league=self.league
+        )
+        self.player = Player.objects.create(name="Pepe", age=38, position="Defesa", appearances=600, team=self.team)
+
+    def search(self, query):
+        response = self.client.get(reverse("search") + query)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["results"]
+
+    @pytest.mark.django_db
+    def test_ranking(self):
+        Player.objects.create(name="Portoghese", age=20, position="Atacante", appearances=1)
+        Player.objects.create(name="Portto", age=20, position="Atacante", appearances=1)
+
+        results = self.search("?q=porto")
+
+        self.assertEqual(
+            [(result["type"], result["value"], result["match"]) for result in results],
+            [("team", "Porto", "exact"), ("player", "Portoghese", "prefix"), ("player", "Portto", "fuzzy")],
+        )
+
+    @pytest.mark.django_db
+    def test_coach_and_types(self):
+        results = self.search("?q=sergio conceisao&types=team")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["id"], self.team.id)
+        self.assertEqual(results[0]["field"], "coach")
+
+    @pytest.mark.django_db
+    def test_limit(self):
+        Player.objects.create(name="Pepe Junior", age=20, position="Defesa", appearances=1)
+
+        self.assertEqual(len(self.search("?q=pepe&limit=1")), 1)
+
+    @pytest.mark.django_db
+    def test_bad_requests(self):
+        self.assertEqual(self.client.get(reverse("search")).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(reverse("search") + "?q=a&types=coach").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(reverse("search") + "?q=a&limit=x").status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CACHES=SHARED_CACHES)
+class TestSearchIndexRebuild(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def search(self, query):
+        response = self.client.get(reverse("search") + query)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def values(self, response):
+        return [result["value"] for result in response.json()["results"]]
+
+    def test_sees_writes(self):
+        self.assertEqual(self.values(self.search("?q=joao")), [])
+
+        Player.objects.create(name="Joao Felix", age=22, position="Atacante", appearances=100)
+
+        # the previous index answers while the new one is built, and that answer isn't kept.
+        response = self.search("?q=joao")
+        self.assertEqual(self.values(response), [])
+        self.assertIn("no-store", response["Cache-Control"])
+        self.assertNotIn("ETag", response)
+
+        for thread in list(search._rebuilding.values()):
+            thread.join()
+
+        response = self.search("?q=joao")
+        self.assertEqual(self.values(response), ["Joao Felix"])
+        self.assertIn("ETag", response)
+
+    # versions of this process only: another process' write, e.g. a raw update, doesn't change them.
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}, RESPONSE_CACHE_TIMEOUT=0, SEARCH_INDEX_MAX_AGE=0)
+    def test_local_cache_max_age(self):
+        player = Player.objects.create(name="Joao Felix", age=22, position="Atacante", appearances=100)
+        self.assertEqual(self.values(self.search("?q=joao")), ["Joao Felix"])
+
+        Player.objects.filter(pk=player.pk).update(name="Bernardo Silva")
+
+        response = self.search("?q=joao")
+        self.assertEqual(self.values(response), ["Joao Felix"])
+        self.assertIn("no-store", response["Cache-Control"])
+
+        for thread in list(search._rebuilding.values()):
+            thread.join()
+
+        self.assertEqual(self.values(self.search("?q=joao")), [])
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+from django.test import TestCase
+
+from football.api.serializers import LeagueSerializer, TeamSerializer, PlayerSerializer
+from football.models import League, Team, Player
+
+
+class TestValuesPath(TestCase):
+    """
+        The values path of list responses must produce exactly what the serializers produce.
+    """
+
+    @pytest.mark.django_db
+    def setUp(self):
+        league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+        team = Team.objects.create(
+            name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25, league=league
+        )
+        Team.objects.create(name="Clube", city="Lisboa", championships_won=0, coach="Mister", number_of_players=25)
+        Player.objects.create(name="Jogador", age=27, position="Atacante", appearances=200, team=team)
+        Player.objects.create(name="Livre", age=30, position="Defesa", appearances=10)
+
+    def assertSameOutput(self, serializer_class):
+        model = serializer_class.Meta.model
+        expected = serializer_class(model.objects.order_by("id"), many=True).data
+
+        rows = serializer_class.values_queryset(model.objects.all()).order_by("id")
+        data = serializer_class.values_data(rows)
+
+        # same keys, in the same order, with the same values.
+        self.assertEqual(json.dumps(data), json.dumps(expected))
+
+    @pytest.mark.django_db
+    def test_leagues(self):
+        self.assertSameOutput(LeagueSerializer)
+
+    @pytest.mark.django_db
+    def test_teams(self):
+        self.assertSameOutput(TeamSerializer)
+
+    @pytest.mark.django_db
+    def test_players(self):
+        self.assertSameOutput(PlayerSerializer)
@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import League, Team, Player
+
+
+class TestSparseFieldsets(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+        self.team = Team.objects.create(
+            name="Equipa", city="Porto", championships_won=1, coach="Treinador", number_of_players=25, league=self.league
+        )
+        self.player = Player.objects.create(name="Jogador", age=27, position="Atacante", appearances=200, team=self.team)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json(), context.captured_queries[-1]["sql"]
+
+    @pytest.mark.django_db
+    def test_list_fields(self):
+        data, sql = self.get(reverse("player-list-create") + "?fields=id,name")
+
+        self.assertEqual(data, [{"id": self.player.id, "name": "Jogador"}])
+        # neither the other columns nor the team are read.
+        self.assertNotIn('"position"', sql)
+        self.assertNotIn('"Team"', sql)
+
+    @pytest.mark.django_db
+    def test_list_exclude(self):
+        data, sql = self.get(reverse("team-list-create") + "?exclude=league,coach")
+
+        self.assertEqual(list(data[0]), ["id", "name", "city", "championships_won", "number_of_players"])
+        self.assertNotIn('"coach"', sql)
+        self.assertNotIn('"League"', sql)
+
+    @pytest.mark.django_db
+    def test_list_related_field(self):
+        data, _ = self.get(reverse("player-list-create") + "?fields=name,team")
+
+        self.assertEqual(data, [{"name": "Jogador", "team": "Equipa"}])
+
+    @pytest.mark.django_db
+    def test_unknown_fields_are_ignored(self):
+        data, _ = self.get(reverse("league-list-create") + "?fields=name,password")
+
+        self.assertEqual(data, [{"name": "Liga"}])
+
+    @pytest.mark.django_db
+    def test_cursor_pagination_without_id(self):
+        Player.objects.create(name="Outro", age=20, position="Defesa", appearances=5, team=self.team)
+
+        data, _ = self.get(reverse("player-list-create") + "?fields=name&cursor=&per_page=1")
+        self.assertEqual(data["results"], [{"name": "Jogador"}])
+
+        data, _ = self.get(data["next"])
+        self.assertEqual(data["results"], [{"name": "Outro"}])
+
+    @pytest.mark.django_db
+    def test_stream(self):
+        response = self.client.get(reverse("player-list-create") + "?fields=age&stream=1")
+
+        self.assertEqual(b"".join(response.streaming_content), b'[{"age":27}]')
+
+    @pytest.mark.django_db
+    def test_detail(self):
+        data, sql = self.get(reverse("team-retrieve-update-destroy", kwargs={"pk": self.team.id}) + "?fields=name,league")
+
+        self.assertEqual(data, {"name": "Equipa", "league": "Liga"})
+        self.assertNotIn('"coach"', sql)
+
+    @pytest.mark.django_db
+    def test_player_name_league(self):
+        data, _ = self.get(reverse("league-list-create") + "?player_name=jogador&fields=name,country")
+
+        self.assertEqual(data["results"], [{"name": "Liga", "country": "Portugal"}])
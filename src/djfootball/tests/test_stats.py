@@ -0,0 +1,174 @@
+import io
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from football.models import League, Team, Player, PlayerStats
+from football.stats import check_stats
+
+from conftest import player_data
+
+
+class TestStatsMaintenance(APITestCase):
+    """
+        Every write path must leave 'PlayerStats' equal to a recomputation from the Player table.
+    """
+
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+        self.team = Team.objects.create(name="Porto", city="Porto", championships_won=30, coach="Treinador", number_of_players=25, league=self.league)
+        self.other = Team.objects.create(name="Braga", city="Braga", championships_won=0, coach="Mister", number_of_players=25)
+
+    def assertConsistent(self):
+        self.assertEqual(check_stats(), [])
+
+    @pytest.mark.django_db
+    def test_single_writes(self):
+        player = Player.objects.create(**player_data("Pepe", 38, "Defesa", 600), team=self.team)
+        self.assertConsistent()
+
+        player.team, player.position, player.age = self.other, "Atacante", 39
+        player.save()
+        self.assertConsistent()
+
+        player.delete()
+        self.assertConsistent()
+        self.assertFalse(PlayerStats.objects.exists())
+
+    @pytest.mark.django_db
+    def test_api_writes(self):
+        url = reverse("player-list-create")
+
+        response = self.client.post(url, [player_data(f"Jogador {i}", age=20 + i) for i in range(3)], format="json")
+        self.assertConsistent()
+
+        ids = [player["id"] for player in response.json()]
+        self.client.patch(url, [{"id": ids[0], "position": "Defesa"}, {"id": ids[1], "age": 40}], format="json")
+        self.assertConsistent()
+
+        self.client.patch(reverse("player-retrieve-update-destroy", kwargs={"pk": ids[2]}), {"appearances": 99}, format="json")
+        self.assertConsistent()
+
+        self.client.delete(f"{url}?ids={ids[0]},{ids[1]}")
+        self.assertConsistent()
+
+    @pytest.mark.django_db
+    def test_team_delete(self):
+        Player.objects.create(**player_data("Pepe"), team=self.team)
+        Player.objects.create(**player_data("Livre"))
+
+        self.team.delete()
+
+        self.assertConsistent()
+        self.assertEqual(PlayerStats.objects.get().players, 2)
+
+
+class TestStatsTransaction(TransactionTestCase):
+    def test_player_save_is_atomic(self):
+        player = Player.objects.create(**player_data("Pepe"))
+
+        # the update and its statistics commit together, or not at all.
+        with mock.patch("football.stats.apply_deltas", side_effect=RuntimeError):
+            player.age = 40
+            with self.assertRaises(RuntimeError):
+                player.save()
+
+        self.assertEqual(Player.objects.get(pk=player.pk).age, 25)
+        self.assertEqual(check_stats(), [])
+
+
+class TestStatsViews(APITestCase):
+    @pytest.mark.django_db
+    def setUp(self):
+        self.league = League.objects.create(name="Liga", country="Portugal", number_of_teams=18, current_champion=None)
+        self.team = Team.objects.create(name="Porto", city="Porto", championships_won=30, coach="Treinador", number_of_players=25, league=self.league)
+        self.empty = Team.objects.create(name="Braga", city="Braga", championships_won=0, coach="Mister", number_of_players=20)
+
+        Player.objects.create(**player_data("Pepe", 38, "Defesa", 600), team=self.team)
+        Player.objects.create(**player_data("Diogo", 25, "Atacante", 120), team=self.team)
+        Player.objects.create(**player_data("Otavio", 27, "Atacante", 150), team=self.team)
+        Player.objects.create(**player_data("Livre", 30, "Defesa", 10))
+
+    def get(self, name, **kwargs):
+        response = self.client.get(reverse(name, kwargs=kwargs or None))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    @pytest.mark.django_db
+    def test_overall(self):
+        self.assertEqual(
+            self.get("stats"),
+            {"players": 4, "average_age": 30.0, "total_appearances": 880, "average_appearances": 220.0, "players_without_team": 1},
+        )
+
+    @pytest.mark.django_db
+    def test_teams(self):
+        porto, braga = self.get("team-stats-list")
+
+        self.assertEqual(porto, {
+            "id": self.team.id, "name": "Porto", "league": "Liga", "declared_players": 25,
+            "players": 3, "average_age": 30.0, "total_appearances": 870, "average_appearances": 290.0,
+        })
+        self.assertEqual((braga["players"], braga["average_age"]), (0, None))
+
+    @pytest.mark.django_db
+    def test_team_positions(self):
+        data = self.get("team-stats-retrieve", pk=self.team.id)
+
+        self.assertEqual([(row["position"], row["players"]) for row in data["positions"]], [("Atacante", 2), ("Defesa", 1)])
+        self.assertEqual(self.client.get(reverse("team-stats-retrieve", kwargs={"pk": 999})).status_code, status.HTTP_404_NOT_FOUND)
+
+    @pytest.mark.django_db
+    def test_leagues(self):
+        (liga,) = self.get("league-stats-list")
+
+        self.assertEqual((liga["teams"], liga["players"], liga["total_appearances"]), (1, 3, 870))
+
+    @pytest.mark.django_db
+    def test_positions(self):
+        self.assertEqual([(row["position"], row["players"]) for row in self.get("position-stats-list")], [("Atacante", 2), ("Defesa", 2)])
+
+        response = self.client.get(reverse("position-stats-list") + f"?league={self.league.id}")
+        self.assertEqual([(row["position"], row["players"]) for row in response.json()], [("Atacante", 2), ("Defesa", 1)])
+
+    @pytest.mark.django_db
+    def test_reflects_writes(self):
+        self.get("stats")
+        Player.objects.create(**player_data("Novo"), team=self.team)
+
+        self.assertEqual(self.get("stats")["players"], 5)
+
+    @pytest.mark.django_db
+    def test_reflects_team_and_league_deletes(self):
+        # neither sends a Player signal: the players are moved without one.
+        self.get("stats")
+        url = reverse("position-stats-list") + f"?league={self.league.id}"
+        self.assertEqual(len(self.client.get(url).json()), 2)
+
+        self.league.delete()
+        self.assertEqual(self.client.get(url).json(), [])
+
+        self.team.delete()
+        self.assertEqual(self.get("stats")["players_without_team"], 4)
+
+
+class TestRebuildStatsCommand(APITestCase):
+    @pytest.mark.django_db
+    def test_check_and_rebuild(self):
+        Player.objects.create(**player_data("Pepe"))
+        call_command("rebuild_stats", "--check", stdout=io.StringIO())
+
+        # e.g. a raw SQL write, which no signal sees.
+        Player.objects.update(age=50)
+        with self.assertRaises(CommandError):
+            call_command("rebuild_stats", "--check", stdout=io.StringIO(), stderr=io.StringIO())
+
+        call_command("rebuild_stats", stdout=io.StringIO())
+        self.assertEqual(check_stats(), [])